@@ -0,0 +1,90 @@
+"""
+Benchmark de la génération des alertes de stock.
+
+Compare l'ancien calcul (iterrows, un f-string et un logging.warning
+synchrone vers le fichier de log par alerte) à check_stock_alerts : messages
+construits sur les colonnes, logging via une file, avec et sans message
+récapitulatif.
+
+Usage:
+    python benchmarks/bench_alerts.py [--rows 200000] [--threshold 20] 2>/dev/null
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.generator import generate_inventory  # noqa: E402
+from inventory_manager.core.manager import InventoryManager  # noqa: E402
+from inventory_manager.utils import logging_setup  # noqa: E402
+
+
+def legacy_alerts(manager: InventoryManager) -> list:
+    """Ancien calcul : une ligne et un message de log à la fois."""
+    alerts = []
+    for _, product in manager.get_low_stock_products().iterrows():
+        alert = (
+            f"ALERTE: Stock bas pour {product['name']} "
+            f"({product['quantity']} unités restantes, "
+            f"seuil: {manager.stock_threshold})"
+        )
+        alerts.append(alert)
+        logging.warning(alert)
+    return alerts
+
+
+def timed(func) -> float:
+    """Durée d'un appel."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--threshold", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_file = Path(temp_dir) / "bench.log"
+        root = logging.getLogger()
+        root.setLevel(logging.INFO)
+
+        # Ancien logging : écriture synchrone dans le fichier et sur la console
+        handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+        for handler in handlers:
+            root.addHandler(handler)
+        manager = InventoryManager(temp_dir)
+        manager.inventory_df = generate_inventory(args.rows).astype(
+            {"quantity": np.int8}
+        )
+        manager.set_stock_threshold(args.threshold)
+        count = len(manager.get_low_stock_products())
+        legacy = timed(lambda: legacy_alerts(manager))
+        for handler in handlers:
+            root.removeHandler(handler)
+            handler.close()
+
+        # Nouveau logging : file d'attente et thread d'écriture
+        logging_setup.setup_logging(str(log_file))
+        vectorized = timed(manager.check_stock_alerts)
+        summary = timed(lambda: manager.check_stock_alerts(summary=True))
+        logging_setup.flush_logging()
+
+    print(f"{args.rows} produits, {count} alertes\n")
+    print(f"{'iterrows + log synchrone (s)':<34} {legacy:>8.3f}")
+    print(f"{'vectorisé + file de log (s)':<34} {vectorized:>8.3f}")
+    print(f"{'vectorisé + récapitulatif (s)':<34} {summary:>8.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Benchmark de l'affichage des résultats de `main.py list`.
+
+Compare l'ancien affichage (iterrows puis un seul tableau rich imprimé à la
+fin) à display_results, qui formate et imprime les lignes par blocs :
+temps avant la première ligne affichée, temps total et pic mémoire.
+
+Usage:
+    python benchmarks/bench_display.py [--rows 20000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.generator import generate_inventory  # noqa: E402
+from main import display_results  # noqa: E402
+
+
+class TimedFile:
+    """Sortie qui jette le texte en notant l'instant de la première écriture."""
+
+    def __init__(self):
+        self.sink = open(os.devnull, "w", encoding="utf-8")
+        self.first_write = None
+
+    def write(self, text: str) -> int:
+        if self.first_write is None and "Produit" in text:
+            self.first_write = time.perf_counter()
+        return self.sink.write(text)
+
+    def flush(self) -> None:
+        self.sink.flush()
+
+
+def legacy_display(df: pd.DataFrame, console: Console) -> None:
+    """Ancien affichage : une Series par ligne et un seul tableau."""
+    table = Table(show_header=True, header_style="bold magenta")
+    for col in df.columns:
+        table.add_column(col)
+    for _, row in df.iterrows():
+        table.add_row(*[str(val) for val in row])
+    console.print(table)
+
+
+def measure(render):
+    """
+    Temps avant la première ligne, temps total et pic mémoire de render.
+
+    tracemalloc ralentit fortement rich : la mémoire est mesurée lors d'un
+    second passage, séparé du chronométrage.
+    """
+    output = TimedFile()
+    start = time.perf_counter()
+    render(Console(file=output, width=120))
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    render(Console(file=TimedFile(), width=120))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return output.first_write - start, elapsed, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args()
+
+    df = generate_inventory(args.rows)
+    legacy = measure(lambda console: legacy_display(df, console))
+    chunked = measure(lambda console: display_results(df, console=console))
+
+    print(f"{args.rows} produits\n")
+    print(f"{'':<26} {'iterrows':>12} {'par blocs':>12}")
+    print(f"{'première ligne (s)':<26} {legacy[0]:>12.3f} {chunked[0]:>12.3f}")
+    print(f"{'total (s)':<26} {legacy[1]:>12.3f} {chunked[1]:>12.3f}")
+    print(
+        f"{'pic mémoire (Mo)':<26} {legacy[2] / 2**20:>12.1f} "
+        f"{chunked[2] / 2**20:>12.1f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Benchmark de la recherche par nom.
+
+Compare str.contains(case=False) sur tous les noms à l'index de trigrammes
+de NameIndex (construction, recherche exacte et recherche approchée).
+
+Usage:
+    python benchmarks/bench_name_search.py [--rows 1000000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from inventory_manager.core.name_index import NameIndex  # noqa: E402
+
+WORDS = [
+    "Écouteurs",
+    "Smartphone",
+    "Laptop",
+    "Tablette",
+    "Chaise",
+    "Canapé",
+    "Bureau",
+    "Armoire",
+    "Console",
+    "Télévision",
+]
+BRANDS = ["Sony", "Samsung", "Dell", "Apple", "LG", "Ikea", "Bosch", "Philips"]
+
+QUERIES = ["ecouteurs sony", "Samsung", "télévision lg 4", "chaise ikea 12345"]
+
+
+def make_names(rows: int, seed: int = 0) -> pd.Series:
+    """Génère des noms de produits synthétiques."""
+    rng = np.random.default_rng(seed)
+    words = np.array(WORDS, dtype=object)[rng.integers(0, len(WORDS), rows)]
+    brands = np.array(BRANDS, dtype=object)[rng.integers(0, len(BRANDS), rows)]
+    refs = rng.integers(0, 100_000, rows).astype(str)
+    return pd.Series(words + " " + brands + " " + refs)
+
+
+def best_time(func, repeat: int) -> float:
+    """Meilleur temps d'exécution sur plusieurs essais."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    names = make_names(args.rows)
+    start = time.perf_counter()
+    index = NameIndex(names)
+    print(
+        f"Construction de l'index ({args.rows} noms) : "
+        f"{time.perf_counter() - start:.2f} s\n"
+    )
+
+    print(
+        f"{'requête':<20} {'contains (ms)':>14} {'index (ms)':>11} "
+        f"{'flou (ms)':>10} {'résultats':>10}"
+    )
+    for query in QUERIES:
+        contains = best_time(
+            lambda: names.str.contains(query, case=False, na=False), args.repeat
+        )
+        indexed = best_time(lambda: index.search(query), args.repeat)
+        fuzzy = best_time(lambda: index.fuzzy_search(query), args.repeat)
+        print(
+            f"{query:<20} {contains * 1000:>14.1f} {indexed * 1000:>11.1f} "
+            f"{fuzzy * 1000:>10.1f} {len(index.search(query)):>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
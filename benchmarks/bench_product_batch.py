@@ -0,0 +1,83 @@
+"""
+Benchmark de ProductBatch face à une liste de Product.
+
+Mesure, pour N produits, la mémoire allouée (tracemalloc) et le temps de
+construction depuis l'inventaire, puis le temps d'un parcours complet
+(somme de quantity * unit_price).
+
+Usage:
+    python benchmarks/bench_product_batch.py [--rows 200000]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.generator import generate_inventory  # noqa: E402
+from inventory_manager.models.product import Product  # noqa: E402
+from inventory_manager.models.product_batch import ProductBatch  # noqa: E402
+
+
+def build_products(df: pd.DataFrame) -> list:
+    """Construit une liste de Product à partir de l'inventaire."""
+    return [
+        Product(name, int(quantity), float(unit_price), category)
+        for name, quantity, unit_price, category in zip(
+            df["name"], df["quantity"], df["unit_price"], df["category"]
+        )
+    ]
+
+
+def measure(build):
+    """Temps de construction et mémoire allouée par build()."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    df = generate_inventory(args.rows).astype({"quantity": np.int8})
+    products, list_time, list_memory = measure(lambda: build_products(df))
+    batch, batch_time, batch_memory = measure(lambda: ProductBatch.from_frame(df))
+
+    start = time.perf_counter()
+    sum(p.quantity * p.unit_price for p in products)
+    list_iter = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sum(view.quantity * view.unit_price for view in batch)
+    batch_iter = time.perf_counter() - start
+
+    start = time.perf_counter()
+    float(np.dot(batch.quantities, batch.unit_prices))
+    batch_vector = time.perf_counter() - start
+
+    print(f"{args.rows} produits\n")
+    print(f"{'':<22} {'list[Product]':>14} {'ProductBatch':>14}")
+    print(
+        f"{'mémoire (Mo)':<22} {list_memory / 2**20:>14.1f} "
+        f"{batch_memory / 2**20:>14.1f}"
+    )
+    print(f"{'construction (s)':<22} {list_time:>14.3f} {batch_time:>14.3f}")
+    print(f"{'parcours (s)':<22} {list_iter:>14.3f} {batch_iter:>14.3f}")
+    print(f"{'calcul vectoriel (s)':<22} {'-':>14} {batch_vector:>14.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
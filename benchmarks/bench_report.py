@@ -0,0 +1,72 @@
+"""
+Benchmark des statistiques par catégorie du rapport.
+
+Compare l'ancien calcul (un masque booléen par catégorie, O(catégories ×
+lignes)) à l'agrégation groupée unique de InventoryManager, de 10 à 10 000
+catégories.
+
+Usage:
+    python benchmarks/bench_report.py [--rows 200000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.generator import generate_inventory  # noqa: E402
+from inventory_manager.core.manager import InventoryManager  # noqa: E402
+
+
+def legacy_category_stats(df: pd.DataFrame) -> list:
+    """Ancien calcul : un sous-DataFrame filtré par catégorie."""
+    category_stats = []
+    for category in df["category"].unique():
+        cat_df = df[df["category"] == category]
+        category_stats.extend(
+            [
+                len(cat_df),
+                (cat_df["quantity"] * cat_df["unit_price"]).sum(),
+                cat_df["unit_price"].mean(),
+                cat_df["quantity"].sum(),
+            ]
+        )
+    return category_stats
+
+
+def best_time(func, repeat: int) -> float:
+    """Meilleur temps d'exécution sur plusieurs essais."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'catégories':>10} {'boucle (s)':>12} {'groupby (s)':>12} {'gain':>8}")
+    for categories in [10, 100, 1_000, 10_000]:
+        df = generate_inventory(args.rows, categories)
+        legacy = best_time(lambda: legacy_category_stats(df), args.repeat)
+        grouped = best_time(
+            lambda: InventoryManager._compute_report_stats(df), args.repeat
+        )
+        print(
+            f"{categories:>10} {legacy:>12.4f} {grouped:>12.4f} "
+            f"{legacy / grouped:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Benchmark de l'ouverture de l'inventaire depuis un instantané binaire.
+
+Compare le chargement du cache (Parquet ou pickle) puis une requête, à
+l'ouverture de l'instantané projeté en mémoire puis la même requête, pour
+les produits en stock bas et une recherche par catégorie et prix.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--rows 1000000] 2>/dev/null
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.generator import generate_inventory  # noqa: E402
+from inventory_manager.core.manager import InventoryManager  # noqa: E402
+from inventory_manager.utils.cache import InventoryCache  # noqa: E402
+from inventory_manager.utils.file_handler import FileHandler  # noqa: E402
+
+
+def timed(func) -> float:
+    """Durée d'un appel."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    queries = {
+        "stock bas": lambda m: m.get_low_stock_products(),
+        "catégorie + prix": lambda m: m.search_products(
+            category="Cat7", min_price=100.0, max_price=200.0
+        ),
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        df = FileHandler.optimize_dtypes(generate_inventory(args.rows))
+        cache = InventoryCache(temp_dir)
+        cache.save(df, {})
+        snapshot_file = str(Path(temp_dir) / "inventory.snapshot")
+        writer = InventoryManager(temp_dir)
+        writer.inventory_df = df
+        writer.save_snapshot(snapshot_file)
+        del df, writer
+
+        print(f"{args.rows} produits\n")
+        print(f"{'requête':<18} {'cache (s)':>10} {'instantané (s)':>15}")
+        for label, query in queries.items():
+            manager = InventoryManager(temp_dir)
+
+            def from_cache():
+                manager.inventory_df = cache.load({})
+                query(manager)
+
+            def from_snapshot():
+                manager.open_snapshot(snapshot_file)
+                query(manager)
+
+            print(
+                f"{label:<18} {timed(from_cache):>10.3f} {timed(from_snapshot):>15.3f}"
+            )
+
+        manager = InventoryManager(temp_dir)
+        opening = timed(lambda: manager.open_snapshot(snapshot_file))
+        print(f"\nouverture seule de l'instantané (s) {opening:.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
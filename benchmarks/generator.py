@@ -0,0 +1,158 @@
+"""
+Générateur déterministe d'inventaires synthétiques pour les benchmarks.
+
+Un même jeu de paramètres (lignes, catégories, taux de doublons, asymétrie,
+graine) produit toujours les mêmes données, ce qui rend les mesures
+comparables d'une exécution à l'autre.
+
+Usage:
+    python -m benchmarks.generator --out data [--files 4] [--rows 100000]
+        [--categories 50] [--duplicate-rate 0.1] [--skew 1.0] [--seed 0]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def category_weights(categories: int, skew: float) -> np.ndarray:
+    """
+    Probabilité de chaque catégorie, selon une loi de Zipf.
+
+    Args:
+        categories (int): Nombre de catégories
+        skew (float): Exposant de la loi (0 : catégories équiprobables)
+
+    Returns:
+        np.ndarray: Probabilités, de la catégorie la plus fréquente à la moins
+            fréquente
+    """
+    weights = 1.0 / np.arange(1, categories + 1) ** skew
+    return weights / weights.sum()
+
+
+def generate_inventory(
+    rows: int,
+    categories: int = 50,
+    duplicate_rate: float = 0.0,
+    skew: float = 0.0,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Génère un inventaire synthétique.
+
+    Une fraction duplicate_rate des lignes reprend le couple (nom, catégorie)
+    d'un autre produit, avec une autre quantité et un autre prix : la
+    consolidation les déduplique. Les doublons sont répartis au hasard dans
+    l'inventaire.
+
+    Args:
+        rows (int): Nombre de lignes
+        categories (int): Nombre de catégories (« Cat0 », « Cat1 », ...)
+        duplicate_rate (float): Fraction des lignes qui sont des doublons
+        skew (float): Asymétrie de la répartition des catégories (voir
+            category_weights ; 0 : uniforme)
+        seed (int): Graine du générateur aléatoire
+
+    Returns:
+        pd.DataFrame: Inventaire (name, quantity, unit_price, category)
+    """
+    if not 0 <= duplicate_rate < 1:
+        raise ValueError("Le taux de doublons doit être compris entre 0 et 1")
+
+    rng = np.random.default_rng(seed)
+    quantity = rng.integers(0, 100, rows)
+    unit_price = rng.uniform(1, 1000, rows).round(2)
+
+    unique = rows - int(rows * duplicate_rate)
+    if skew:
+        key_categories = rng.choice(
+            categories, unique, p=category_weights(categories, skew)
+        )
+    else:
+        key_categories = rng.integers(0, categories, unique)
+    keys = np.arange(unique)
+    if unique < rows:
+        keys = rng.permutation(
+            np.concatenate([keys, rng.integers(0, unique, rows - unique)])
+        )
+
+    return pd.DataFrame(
+        {
+            "name": [f"Produit {key}" for key in keys],
+            "quantity": quantity,
+            "unit_price": unit_price,
+            "category": pd.Categorical(
+                [f"Cat{category}" for category in key_categories[keys]]
+            ),
+        }
+    )
+
+
+def write_inventory_files(
+    directory: str,
+    files: int,
+    rows: int,
+    categories: int = 50,
+    duplicate_rate: float = 0.0,
+    skew: float = 0.0,
+    seed: int = 0,
+) -> List[Path]:
+    """
+    Écrit un inventaire synthétique réparti en plusieurs fichiers CSV.
+
+    Les lignes de generate_inventory sont découpées en files fichiers
+    consécutifs : les doublons se retrouvent aussi d'un fichier à l'autre.
+
+    Args:
+        directory (str): Répertoire de destination, créé s'il n'existe pas
+        files (int): Nombre de fichiers CSV
+        rows (int): Nombre total de lignes
+        categories (int): Nombre de catégories
+        duplicate_rate (float): Fraction des lignes qui sont des doublons
+        skew (float): Asymétrie de la répartition des catégories
+        seed (int): Graine du générateur aléatoire
+
+    Returns:
+        List[Path]: Fichiers écrits, dans l'ordre de consolidation
+    """
+    df = generate_inventory(rows, categories, duplicate_rate, skew, seed)
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i, part in enumerate(np.array_split(np.arange(rows), files)):
+        path = Path(directory) / f"inventory_{i:03d}.csv"
+        df.iloc[part].to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--out", required=True, help="Répertoire de destination")
+    parser.add_argument("--files", type=int, default=4)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--duplicate-rate", type=float, default=0.1)
+    parser.add_argument("--skew", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    paths = write_inventory_files(
+        args.out,
+        files=args.files,
+        rows=args.rows,
+        categories=args.categories,
+        duplicate_rate=args.duplicate_rate,
+        skew=args.skew,
+        seed=args.seed,
+    )
+    print(f"{args.rows} lignes écrites dans {len(paths)} fichier(s) de {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+"""
+Suite de benchmarks des opérations principales de l'inventaire.
+
+Génère des inventaires synthétiques déterministes (voir generator.py) de
+plusieurs tailles, chronomètre consolidate_files, search_products,
+check_stock_alerts, generate_report et display_results, enregistre les
+résultats en JSON et les compare à une référence enregistrée : une opération
+plus lente que la référence au-delà de la tolérance est signalée comme une
+régression (code de sortie 1).
+
+Usage:
+    python benchmarks/run.py [--sizes 10000,100000] [--files 4] [--categories 50]
+        [--duplicate-rate 0.1] [--skew 1.0] [--repeat 3]
+        [--output benchmarks/results.json] [--baseline benchmarks/baseline.json]
+        [--tolerance 0.25] [--save-baseline]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARKS_DIR.parent))
+
+from benchmarks.generator import write_inventory_files  # noqa: E402
+from inventory_manager.core.manager import InventoryManager  # noqa: E402
+from main import display_results  # noqa: E402
+
+# Écart absolu (s) en dessous duquel une différence est du bruit de mesure
+MIN_REGRESSION_SECONDS = 0.005
+
+
+def best_time(
+    func: Callable[[], Any],
+    repeat: int,
+    reset: Optional[Callable[[], Any]] = None,
+) -> float:
+    """
+    Meilleure durée de func sur repeat exécutions.
+
+    reset est appelé hors mesure avant chaque exécution : il vide par exemple
+    les résultats mémorisés, pour que chaque exécution calcule son résultat.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        if reset is not None:
+            reset()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_size(rows: int, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """
+    Chronomètre chaque opération sur un inventaire de rows lignes.
+
+    Args:
+        rows (int): Nombre de lignes de l'inventaire (doublons compris)
+        args (argparse.Namespace): Paramètres du générateur et des mesures
+
+    Returns:
+        List[Dict[str, Any]]: Une mesure par opération
+    """
+    from rich.console import Console
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        write_inventory_files(
+            temp_dir,
+            files=args.files,
+            rows=rows,
+            categories=args.categories,
+            duplicate_rate=args.duplicate_rate,
+            skew=args.skew,
+            seed=args.seed,
+        )
+        report_file = str(Path(temp_dir) / "report.csv")
+        # Un gestionnaire neuf à chaque mesure : consolidation complète
+        timings = {
+            "consolidate_files": best_time(
+                lambda: InventoryManager(temp_dir).consolidate_files(), args.repeat
+            )
+        }
+        manager = InventoryManager(temp_dir)
+        manager.consolidate_files()
+
+        # Recherches indexées, comme en mode serve, watch ou batch : les index
+        # sont construits une fois, hors mesure
+        manager.build_indexes = True
+        manager.search_products(name="produit 1")
+        with open(os.devnull, "w", encoding="utf-8") as devnull:
+            console = Console(file=devnull, width=120)
+            operations = {
+                "search_products[name]": lambda: manager.search_products(
+                    name="produit 12"
+                ),
+                "search_products[category+price]": lambda: manager.search_products(
+                    category="Cat1", min_price=100.0, max_price=200.0
+                ),
+                "check_stock_alerts": lambda: manager.check_stock_alerts(summary=True),
+                "generate_report": lambda: manager.generate_report(report_file),
+                "display_results": lambda: display_results(
+                    manager.inventory_df, console=console
+                ),
+            }
+            # Les résultats mémorisés sont oubliés avant chaque exécution
+            for name, func in operations.items():
+                timings[name] = best_time(func, args.repeat, manager.clear_memo)
+
+    unique = len(manager.inventory_df)
+    return [
+        {"operation": name, "rows": rows, "unique_rows": unique, "seconds": seconds}
+        for name, seconds in timings.items()
+    ]
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    tolerance: float,
+) -> List[Dict[str, Any]]:
+    """
+    Compare des mesures à une référence.
+
+    Args:
+        results (List[Dict[str, Any]]): Mesures actuelles
+        baseline (List[Dict[str, Any]]): Mesures de référence
+        tolerance (float): Ralentissement relatif toléré (0.25 : +25 %)
+
+    Returns:
+        List[Dict[str, Any]]: Mesures actuelles complétées de la durée de
+            référence, du rapport entre les deux et d'un indicateur
+            « regression »
+    """
+    reference = {(r["operation"], r["rows"]): r["seconds"] for r in baseline}
+    compared = []
+    for result in results:
+        seconds = reference.get((result["operation"], result["rows"]))
+        ratio = result["seconds"] / seconds if seconds else None
+        compared.append(
+            {
+                **result,
+                "baseline": seconds,
+                "ratio": ratio,
+                "regression": ratio is not None
+                and ratio > 1 + tolerance
+                and result["seconds"] - seconds > MIN_REGRESSION_SECONDS,
+            }
+        )
+    return compared
+
+
+def print_results(compared: List[Dict[str, Any]]) -> None:
+    """Affiche les mesures et leur comparaison à la référence."""
+    print(
+        f"{'opération':<34} {'lignes':>9} {'durée (s)':>10} "
+        f"{'référence':>10} {'rapport':>8}"
+    )
+    for result in compared:
+        baseline = (
+            f"{result['baseline']:>10.4f}" if result["baseline"] else f"{'-':>10}"
+        )
+        ratio = f"{result['ratio']:>7.2f}x" if result["ratio"] else f"{'-':>8}"
+        flag = "  RÉGRESSION" if result["regression"] else ""
+        print(
+            f"{result['operation']:<34} {result['rows']:>9} "
+            f"{result['seconds']:>10.4f} {baseline} {ratio}{flag}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        default="10000,100000",
+        help="Nombres de lignes, séparés par des virgules",
+    )
+    parser.add_argument("--files", type=int, default=4)
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--duplicate-rate", type=float, default=0.1)
+    parser.add_argument("--skew", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=str(BENCHMARKS_DIR / "results.json"))
+    parser.add_argument("--baseline", default=str(BENCHMARKS_DIR / "baseline.json"))
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Enregistrer les mesures comme nouvelle référence",
+    )
+    args = parser.parse_args()
+
+    # Les alertes sont construites mais pas écrites : seul le calcul est mesuré
+    logging.getLogger().addHandler(logging.NullHandler())
+
+    parameters = {
+        key: getattr(args, key)
+        for key in ("files", "categories", "duplicate_rate", "skew", "seed", "repeat")
+    }
+    results = []
+    for rows in (int(size) for size in args.sizes.split(",")):
+        results.extend(run_size(rows, args))
+
+    run = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "parameters": parameters,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(run, f, indent=2, ensure_ascii=False)
+
+    baseline = {"results": []}
+    if Path(args.baseline).exists():
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("parameters") != parameters:
+            print("Attention : paramètres différents de ceux de la référence\n")
+
+    compared = compare(results, baseline["results"], args.tolerance)
+    print_results(compared)
+    print(f"\nRésultats enregistrés dans {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2, ensure_ascii=False)
+        print(f"Référence enregistrée dans {args.baseline}")
+        return 0
+
+    regressions = sum(result["regression"] for result in compared)
+    if regressions:
+        print(f"{regressions} régression(s) au-delà de +{args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
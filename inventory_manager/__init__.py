@@ -1,5 +1,15 @@
-from .core.manager import InventoryManager
-from .models.product import Product
-
 __version__ = "1.0.0"
 __all__ = ["InventoryManager", "Product"]
+
+
+def __getattr__(name):
+    """Importe les classes publiques à la demande (pandas est coûteux)."""
+    if name == "InventoryManager":
+        from .core.manager import InventoryManager
+
+        return InventoryManager
+    if name == "Product":
+        from .models.product import Product
+
+        return Product
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
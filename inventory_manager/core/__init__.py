@@ -1,3 +1,10 @@
-from .manager import InventoryManager
-
 __all__ = ["InventoryManager"]
+
+
+def __getattr__(name):
+    """Importe le gestionnaire à la demande (pandas est coûteux)."""
+    if name == "InventoryManager":
+        from .manager import InventoryManager
+
+        return InventoryManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,215 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+# Fichier du répertoire de données contenant les seuils et les alertes actives
+ALERT_STATE_FILE = ".inventory_alerts.json"
+
+ALERT_COLUMNS = ["name", "category", "quantity", "threshold"]
+
+
+def row_thresholds(
+    df: pd.DataFrame,
+    default: int,
+    category_thresholds: Dict[str, int],
+    product_thresholds: Dict[str, int],
+) -> np.ndarray:
+    """
+    Seuil d'alerte applicable à chaque ligne d'un DataFrame de produits.
+
+    Le seuil d'un produit l'emporte sur celui de sa catégorie, qui l'emporte
+    sur le seuil par défaut.
+
+    Args:
+        df (pd.DataFrame): Produits (colonnes name et category)
+        default (int): Seuil par défaut
+        category_thresholds (Dict[str, int]): Seuils par catégorie
+        product_thresholds (Dict[str, int]): Seuils par nom de produit
+
+    Returns:
+        np.ndarray: Seuil de chaque ligne
+    """
+    thresholds = np.full(len(df), default, dtype=np.int64)
+    for column, overrides in (
+        ("category", category_thresholds),
+        ("name", product_thresholds),
+    ):
+        if overrides:
+            mapped = (
+                df[column]
+                .astype(object)
+                .map(overrides)
+                .to_numpy(dtype=np.float64, na_value=np.nan)
+            )
+            found = ~np.isnan(mapped)
+            thresholds[found] = mapped[found]
+    return thresholds
+
+
+class AlertState:
+    """
+    État persistant des alertes de stock.
+
+    Conserve entre deux exécutions les seuils (par défaut, par catégorie et
+    par produit) et les alertes actives avec la dernière quantité connue.
+    Chaque vérification compare l'inventaire à cet état pour ne signaler que
+    les changements : nouvelles alertes, alertes aggravées et alertes levées.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialise un état vide.
+
+        Args:
+            path (str): Fichier de l'état
+        """
+        self.path = Path(path)
+        self.default_threshold = None
+        self.category_thresholds: Dict[str, int] = {}
+        self.product_thresholds: Dict[str, int] = {}
+        self.alerts = pd.DataFrame(columns=ALERT_COLUMNS)
+
+    @classmethod
+    def load(cls, path: str) -> "AlertState":
+        """
+        Charge l'état depuis son fichier.
+
+        Args:
+            path (str): Fichier de l'état
+
+        Returns:
+            AlertState: État chargé, ou vide si le fichier est absent ou illisible
+        """
+        state = cls(path)
+        try:
+            with open(state.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return state
+        except (OSError, ValueError) as e:
+            logging.warning(f"État des alertes illisible, ignoré: {str(e)}")
+            return state
+
+        state.default_threshold = data.get("default_threshold")
+        state.category_thresholds = data.get("category_thresholds", {})
+        state.product_thresholds = data.get("product_thresholds", {})
+        state.alerts = pd.DataFrame(data.get("alerts", []), columns=ALERT_COLUMNS)
+        return state
+
+    def save(self) -> bool:
+        """
+        Enregistre l'état via un fichier temporaire renommé ensuite.
+
+        Returns:
+            bool: True si succès, False sinon
+        """
+        data = {
+            "default_threshold": self.default_threshold,
+            "category_thresholds": self.category_thresholds,
+            "product_thresholds": self.product_thresholds,
+            "alerts": self.alerts[ALERT_COLUMNS].to_dict(orient="records"),
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            return True
+        except Exception as e:
+            logging.error(f"Erreur lors de l'écriture de l'état d'alerte: {str(e)}")
+            return False
+
+    def apply_thresholds(self, manager) -> None:
+        """
+        Reporte les seuils enregistrés sur un gestionnaire ou un client.
+
+        Args:
+            manager: InventoryManager ou InventoryClient
+        """
+        if self.default_threshold is not None:
+            manager.set_stock_threshold(self.default_threshold)
+        manager.category_thresholds.update(self.category_thresholds)
+        manager.product_thresholds.update(self.product_thresholds)
+
+    def store_thresholds(self, manager) -> None:
+        """
+        Enregistre les seuils d'un gestionnaire ou d'un client.
+
+        Args:
+            manager: InventoryManager ou InventoryClient
+        """
+        self.default_threshold = manager.stock_threshold
+        self.category_thresholds = dict(manager.category_thresholds)
+        self.product_thresholds = dict(manager.product_thresholds)
+
+    def diff(self, low_stock: pd.DataFrame) -> Dict[str, List[str]]:
+        """
+        Compare les alertes actuelles à l'état et met l'état à jour.
+
+        Une alerte est aggravée quand la quantité a baissé depuis la dernière
+        vérification. Les alertes inchangées ne sont pas signalées.
+
+        Args:
+            low_stock (pd.DataFrame): Produits en stock bas, avec une colonne
+                threshold donnant le seuil de chaque produit
+
+        Returns:
+            Dict[str, List[str]]: Messages des alertes « new », « worsened »
+                et « resolved »
+        """
+        current = low_stock[ALERT_COLUMNS].astype(
+            {"name": object, "category": object, "quantity": "int64"}
+        )
+        previous = self.alerts.astype(
+            {"name": object, "category": object, "quantity": "int64"}
+        )
+        merged = current.merge(
+            previous[["name", "category", "quantity"]],
+            on=["name", "category"],
+            how="outer",
+            suffixes=("", "_previous"),
+            indicator=True,
+            sort=False,
+        )
+
+        new = merged[merged["_merge"] == "left_only"]
+        worsened = merged[
+            (merged["_merge"] == "both")
+            & (merged["quantity"] < merged["quantity_previous"])
+        ]
+        resolved = merged[merged["_merge"] == "right_only"]
+
+        def as_text(column: pd.Series) -> pd.Series:
+            return column.astype("int64").astype(str)
+
+        changes = {
+            "new": (
+                "NOUVELLE ALERTE: Stock bas pour "
+                + new["name"]
+                + " ("
+                + as_text(new["quantity"])
+                + " unités restantes, seuil: "
+                + as_text(new["threshold"])
+                + ")"
+            ).tolist(),
+            "worsened": (
+                "ALERTE AGGRAVÉE: Stock bas pour "
+                + worsened["name"]
+                + " ("
+                + as_text(worsened["quantity"])
+                + " unités restantes, contre "
+                + as_text(worsened["quantity_previous"])
+                + ", seuil: "
+                + as_text(worsened["threshold"])
+                + ")"
+            ).tolist(),
+            "resolved": ("ALERTE LEVÉE: " + resolved["name"]).tolist(),
+        }
+
+        self.alerts = current.reset_index(drop=True)
+        return changes
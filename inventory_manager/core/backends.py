@@ -0,0 +1,32 @@
+from typing import Type
+
+from .manager import InventoryManager
+
+# Stockages disponibles pour l'inventaire consolidé
+BACKENDS = ("pandas", "sqlite")
+
+
+def get_backend(name: str) -> Type[InventoryManager]:
+    """
+    Retourne la classe de gestionnaire d'un stockage.
+
+    Les gestionnaires partagent l'interface d'InventoryManager et donnent
+    les mêmes résultats : « pandas » garde l'inventaire dans un DataFrame,
+    « sqlite » dans une base SQLite indexée.
+
+    Args:
+        name (str): pandas ou sqlite
+
+    Returns:
+        Type[InventoryManager]: Classe du gestionnaire
+
+    Raises:
+        ValueError: Si le stockage est inconnu
+    """
+    if name == "pandas":
+        return InventoryManager
+    if name == "sqlite":
+        from .sqlite_manager import SQLiteInventoryManager
+
+        return SQLiteInventoryManager
+    raise ValueError(f"Stockage inconnu : {name}")
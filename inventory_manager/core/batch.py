@@ -0,0 +1,210 @@
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+
+from ..utils.exporters import export_frame
+from ..utils.report_sinks import atomic_path, save_report
+
+# Commandes d'une tâche et paramètres acceptés par chacune
+BATCH_COMMANDS = {
+    "report": {"output", "format"},
+    "alerts": {"output", "summary"},
+    "low_stock": {"output", "format"},
+    "search": {
+        "output",
+        "format",
+        "name",
+        "category",
+        "min_price",
+        "max_price",
+        "fuzzy",
+    },
+    "list": {"output", "format", "sort_by", "desc"},
+}
+
+# Format d'export des produits d'après l'extension du fichier de sortie
+FRAME_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".parquet": "parquet"}
+
+# Nombre de tâches exécutées en parallèle par défaut
+DEFAULT_BATCH_WORKERS = 4
+
+
+def load_jobs(path: str) -> List[Dict[str, Any]]:
+    """
+    Lit un fichier de tâches JSON, ou YAML (extension .yaml ou .yml).
+
+    Le fichier contient une liste de tâches, ou un objet dont la clé « jobs »
+    contient cette liste. Chaque tâche est un objet dont la clé « command »
+    est une commande de BATCH_COMMANDS, accompagnée de ses paramètres ; la
+    sortie (« output ») est obligatoire, sauf pour alerts.
+
+    Args:
+        path (str): Fichier de tâches
+
+    Returns:
+        List[Dict[str, Any]]: Tâches, dans l'ordre du fichier
+
+    Raises:
+        ValueError: Si le fichier ou une tâche est invalide
+    """
+    with open(path, encoding="utf-8") as f:
+        if Path(path).suffix.lower() in (".yaml", ".yml"):
+            if not find_spec("yaml"):
+                raise ValueError("Les fichiers YAML nécessitent le paquet PyYAML")
+            import yaml
+
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+
+    if isinstance(data, dict):
+        data = data.get("jobs")
+    if not isinstance(data, list):
+        raise ValueError("Le fichier de tâches doit contenir une liste de tâches")
+
+    for number, job in enumerate(data, 1):
+        if not isinstance(job, dict) or job.get("command") not in BATCH_COMMANDS:
+            raise ValueError(f"Tâche {number} : commande absente ou inconnue")
+        unknown = set(job) - BATCH_COMMANDS[job["command"]] - {"command"}
+        if unknown:
+            raise ValueError(
+                f"Tâche {number} : paramètre(s) inconnu(s) : "
+                f"{', '.join(sorted(unknown))}"
+            )
+        if job["command"] != "alerts" and not job.get("output"):
+            raise ValueError(f"Tâche {number} : fichier de sortie (output) manquant")
+    return data
+
+
+class BatchRunner:
+    """
+    Exécute des tâches sur un inventaire chargé une seule fois.
+
+    Les tâches ne font que lire l'inventaire : elles sont exécutées en
+    parallèle dans un pool de threads si le gestionnaire le permet
+    (concurrent_reads), une à une sinon. Les résultats intermédiaires
+    communs, produits en stock bas et statistiques du rapport, sont mémorisés
+    par le gestionnaire : calculés par la première tâche qui en a besoin,
+    puis réutilisés par les suivantes.
+    """
+
+    def __init__(self, manager, workers: int = DEFAULT_BATCH_WORKERS):
+        """
+        Initialise l'exécution.
+
+        Args:
+            manager (InventoryManager): Gestionnaire à l'inventaire chargé
+            workers (int): Nombre maximal de tâches exécutées en parallèle
+
+        Raises:
+            ValueError: Si le nombre de workers n'est pas strictement positif
+        """
+        if workers < 1:
+            raise ValueError("Le nombre de workers doit être un entier positif")
+
+        self.manager = manager
+        self.workers = workers if manager.concurrent_reads else 1
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], int]] = {
+            "report": self._run_report,
+            "alerts": self._run_alerts,
+            "low_stock": self._run_low_stock,
+            "search": self._run_search,
+            "list": self._run_list,
+        }
+
+    def run(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Exécute des tâches (voir load_jobs).
+
+        L'échec d'une tâche n'interrompt pas les autres.
+
+        Args:
+            jobs (List[Dict[str, Any]]): Tâches à exécuter
+
+        Returns:
+            List[Dict[str, Any]]: Un résultat par tâche, dans l'ordre des
+                tâches : command, output, status (« ok » ou « erreur »),
+                count (lignes écrites ou alertes) ou error, et seconds
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(self._run_job, jobs))
+
+    def _run_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Exécute une tâche et mesure sa durée."""
+        result = {"command": job["command"], "output": job.get("output")}
+        start = time.perf_counter()
+        try:
+            result.update(status="ok", count=self._handlers[job["command"]](job))
+        except Exception as e:
+            logging.error(f"Erreur lors de la tâche {job['command']}: {str(e)}")
+            result.update(status="erreur", error=str(e))
+        result["seconds"] = time.perf_counter() - start
+        return result
+
+    def _export(self, df: pd.DataFrame, job: Dict[str, Any]) -> int:
+        """Exporte des produits vers la sortie d'une tâche, sans fichier partiel."""
+        output = job["output"]
+        output_format = job.get("format") or FRAME_FORMATS.get(
+            Path(output).suffix.lower(), "csv"
+        )
+        with atomic_path(output) as tmp_path:
+            export_frame(df, output_format, tmp_path)
+        logging.info(f"Résultats exportés vers {output}")
+        return len(df)
+
+    def _run_report(self, job: Dict[str, Any]) -> int:
+        """Écrit le rapport ; retourne le nombre de catégories."""
+        result = self.manager.generate_report()
+        if not save_report(result, job["output"], job.get("format")):
+            raise Exception("Échec de la génération du rapport")
+        return len(result.categories)
+
+    def _run_alerts(self, job: Dict[str, Any]) -> int:
+        """
+        Vérifie les alertes ; retourne leur nombre.
+
+        Le fichier des alertes est écrit sans fichier partiel (atomic_path).
+        """
+        output = job.get("output")
+        if not output:
+            alerts = self.manager.check_stock_alerts(
+                summary=job.get("summary", True),
+                low_stock=self.manager.get_low_stock_products(with_thresholds=True),
+            )
+            return len(alerts)
+
+        with atomic_path(output) as tmp_path:
+            alerts = self.manager.check_stock_alerts(
+                summary=job.get("summary", True),
+                alert_file=tmp_path,
+                low_stock=self.manager.get_low_stock_products(with_thresholds=True),
+            )
+        logging.info(f"Alertes exportées vers {output}")
+        return len(alerts)
+
+    def _run_low_stock(self, job: Dict[str, Any]) -> int:
+        """Exporte les produits en stock bas."""
+        return self._export(
+            self.manager.get_low_stock_products(with_thresholds=True), job
+        )
+
+    def _run_search(self, job: Dict[str, Any]) -> int:
+        """Exporte les résultats d'une recherche."""
+        criteria = ("name", "category", "min_price", "max_price", "fuzzy")
+        results = self.manager.search_products(
+            **{key: job[key] for key in criteria if key in job}
+        )
+        return self._export(results, job)
+
+    def _run_list(self, job: Dict[str, Any]) -> int:
+        """Exporte l'inventaire, trié si demandé."""
+        df = self.manager.inventory_df
+        if job.get("sort_by"):
+            df = df.sort_values(by=job["sort_by"], ascending=not job.get("desc", False))
+        return self._export(df, job)
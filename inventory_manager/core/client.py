@@ -0,0 +1,162 @@
+import json
+import os
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Le client n'utilise que la bibliothèque standard : une commande servie par
+# un serveur actif n'importe ni pandas ni le gestionnaire
+
+# Fichier du répertoire de données indiquant l'adresse du serveur actif
+SERVER_STATE_FILE = ".inventory_server.json"
+
+# Variable d'environnement donnant le jeton d'accès au serveur
+SERVER_TOKEN_ENV = "INVENTORY_SERVER_TOKEN"
+
+
+class InventoryClient:
+    """
+    Client du serveur d'inventaire.
+
+    Les résultats sont retournés tels que décodés du JSON de la réponse :
+    produits au format « split » (clés columns et data), alertes en liste de
+    messages, rapport au format de ReportResult.to_dict. Le serveur n'écrit
+    aucun fichier : c'est à l'appelant d'écrire les alertes ou le rapport.
+    """
+
+    def __init__(
+        self, address: str, token: Optional[str] = None, timeout: float = 30.0
+    ):
+        """
+        Initialise le client.
+
+        Args:
+            address (str): Adresse HTTP du serveur
+            token (str, optional): Jeton d'accès, si le serveur en exige un
+            timeout (float): Délai maximal d'une requête (s)
+        """
+        self.address = address
+        self.token = token
+        self.timeout = timeout
+        self.stock_threshold: Optional[int] = None
+        self.category_thresholds: Dict[str, int] = {}
+        self.product_thresholds: Dict[str, int] = {}
+
+    @classmethod
+    def discover(cls, data_directory: str) -> Optional["InventoryClient"]:
+        """
+        Retourne un client si un serveur sert ce répertoire de données.
+
+        Le jeton d'accès est lu dans le fichier d'état, sinon dans la
+        variable d'environnement INVENTORY_SERVER_TOKEN.
+
+        Args:
+            data_directory (str): Répertoire de données
+
+        Returns:
+            Optional[InventoryClient]: Client connecté ou None
+        """
+        try:
+            with open(Path(data_directory) / SERVER_STATE_FILE, encoding="utf-8") as f:
+                state = json.load(f)
+            address = state["address"]
+            with urllib.request.urlopen(f"{address}/ping", timeout=0.5):
+                return cls(
+                    address,
+                    token=state.get("token") or os.environ.get(SERVER_TOKEN_ENV),
+                )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def query(self, command: str, **params) -> Any:
+        """
+        Envoie une commande au serveur.
+
+        Args:
+            command (str): Commande à exécuter
+            **params: Paramètres de la commande
+
+        Returns:
+            Any: Résultat de la commande, décodé du JSON
+
+        Raises:
+            ValueError: Si le serveur signale une erreur
+        """
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        request = urllib.request.Request(
+            f"{self.address}/query",
+            data=json.dumps({"command": command, "params": params}).encode("utf-8"),
+            headers=headers,
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = json.load(response)
+        except urllib.error.HTTPError as e:
+            payload = json.load(e)
+        if payload["status"] != "ok":
+            raise ValueError(payload["error"])
+        return payload["result"]
+
+    def list_products(self) -> Dict[str, Any]:
+        """Inventaire consolidé du serveur, au format « split »."""
+        return self.query("list")
+
+    def search_products(self, **criteria) -> Dict[str, Any]:
+        """Recherche des produits (voir InventoryManager.search_products)."""
+        return self.query("search", **criteria)
+
+    def set_stock_threshold(
+        self,
+        threshold: int,
+        category: Optional[str] = None,
+        product: Optional[str] = None,
+    ) -> None:
+        """
+        Configure un seuil d'alerte utilisé par les prochaines requêtes.
+
+        Args:
+            threshold (int): Nouveau seuil d'alerte
+            category (str, optional): Catégorie concernée
+            product (str, optional): Nom du produit concerné
+
+        Raises:
+            ValueError: Si le seuil n'est pas un entier positif
+        """
+        try:
+            threshold = int(threshold)
+        except (TypeError, ValueError):
+            raise ValueError("Le seuil doit être un nombre entier")
+
+        if threshold < 0:
+            raise ValueError("Le seuil doit être un entier positif")
+        if product is not None:
+            self.product_thresholds[product] = threshold
+        elif category is not None:
+            self.category_thresholds[category] = threshold
+        else:
+            self.stock_threshold = threshold
+
+    def _threshold_params(self) -> Dict[str, Any]:
+        """Seuils à transmettre avec une requête d'alertes."""
+        return {
+            "threshold": self.stock_threshold,
+            "category_thresholds": self.category_thresholds,
+            "product_thresholds": self.product_thresholds,
+        }
+
+    def get_low_stock_products(self, with_thresholds: bool = False) -> Dict[str, Any]:
+        """Produits en stock bas (voir InventoryManager.get_low_stock_products)."""
+        return self.query(
+            "low_stock", with_thresholds=with_thresholds, **self._threshold_params()
+        )
+
+    def check_stock_alerts(self, summary: bool = False) -> List[str]:
+        """Alertes de stock (voir InventoryManager.check_stock_alerts)."""
+        return self.query("alerts", summary=summary, **self._threshold_params())
+
+    def generate_report(self) -> Dict[str, Any]:
+        """Statistiques du rapport, au format de ReportResult.to_dict."""
+        return self.query("report")
@@ -1,48 +1,319 @@
-from typing import Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import numpy as np
 import pandas as pd
 import logging
+import threading
 from ..utils.file_handler import FileHandler
+from ..utils.cache import InventoryCache
+from ..utils.exporters import export_frame
+from ..utils.report_sinks import save_report
+from ..utils.logging_setup import setup_logging
+from ..utils.memo import ResultCache
+from ..utils.profiling import profiled
+from ..utils.snapshot import InventorySnapshot, write_snapshot
+from ..models.report import ReportResult
+from .alert_state import row_thresholds
+from .name_index import NameIndex, scan_names
 
 
 class InventoryManager:
     """Gestionnaire principal de l'inventaire."""
 
-    def __init__(self, data_directory: str):
+    # Les lectures (recherche, alertes, rapport) peuvent être faites depuis
+    # plusieurs threads à la fois ; les index sont construits sous verrou
+    concurrent_reads = True
+
+    def __init__(
+        self,
+        data_directory: str,
+        jobs: int = 1,
+        cache_directory: Optional[str] = None,
+        pyarrow_strings: bool = False,
+    ):
         """
         Initialise le gestionnaire d'inventaire.
 
         Args:
             data_directory (str): Chemin vers le répertoire contenant les fichiers CSV
+            jobs (int): Nombre de fichiers CSV lus en parallèle (défaut: 1)
+            cache_directory (str, optional): Répertoire du cache disque de
+                l'inventaire consolidé (désactivé si None)
+            pyarrow_strings (bool): Stocker les noms en chaînes pyarrow
+
+        Raises:
+            ValueError: Si le nombre de jobs n'est pas strictement positif
         """
+        if jobs < 1:
+            raise ValueError("Le nombre de jobs doit être un entier positif")
+
         self.data_directory = data_directory
-        self.inventory_df = None
+        self.jobs = jobs
+        self.pyarrow_strings = pyarrow_strings
+        self.cache = (
+            InventoryCache(
+                cache_directory, options={"pyarrow_strings": pyarrow_strings}
+            )
+            if cache_directory
+            else None
+        )
+        # Signature et données lues de chaque fichier source
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self._fragments: Dict[str, Optional[pd.DataFrame]] = {}
+        # Instantané binaire ouvert à la place des CSV (voir open_snapshot)
+        self.snapshot: Optional[InventorySnapshot] = None
+        self._inventory_df: Optional[pd.DataFrame] = None
         self.stock_threshold = 10
+        # Seuils propres à une catégorie ou à un produit (par nom)
+        self.category_thresholds: Dict[str, int] = {}
+        self.product_thresholds: Dict[str, int] = {}
+        # Index secondaires de search_products, construits à la demande. Leur
+        # construction ne se rentabilise que sur plusieurs requêtes : sans
+        # build_indexes (activé par serve, watch et batch), les recherches
+        # filtrent directement les colonnes
+        self.build_indexes = False
+        self._indexed_df: Optional[pd.DataFrame] = None
+        self._category_index: Optional[Dict[str, np.ndarray]] = None
+        self._price_order: Optional[np.ndarray] = None
+        self._sorted_prices: Optional[np.ndarray] = None
+        self._name_index: Optional[NameIndex] = None
+        self._index_lock = threading.RLock()
+        # Résultats dérivés (stock bas, recherches, rapport) mémorisés pour la
+        # version courante des données, incrémentée à chaque changement
+        self.data_version = 0
+        self._memo = ResultCache()
         self.setup_logging()
 
     def setup_logging(self) -> None:
-        """Configure le système de logging."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            handlers=[logging.FileHandler("inventory.log"), logging.StreamHandler()],
-        )
+        """Configure le système de logging (écritures dans un thread dédié)."""
+        setup_logging()
 
-    def consolidate_files(self) -> None:
-        """Consolide tous les fichiers CSV du répertoire."""
-        self.inventory_df = FileHandler.read_csv_files(self.data_directory)
-        if self.inventory_df is not None:
-            self.inventory_df.drop_duplicates(
-                subset=["name", "category"], keep="last", inplace=True
+    @property
+    def inventory_df(self) -> Optional[pd.DataFrame]:
+        """Inventaire consolidé ; décodé à la demande depuis un instantané."""
+        if self._inventory_df is None and self.snapshot is not None:
+            self._inventory_df = FileHandler.optimize_dtypes(
+                self.snapshot.take(), pyarrow_strings=self.pyarrow_strings
             )
-        else:
+        return self._inventory_df
+
+    @inventory_df.setter
+    def inventory_df(self, df: Optional[pd.DataFrame]) -> None:
+        """Remplace l'inventaire consolidé (et l'instantané éventuel)."""
+        self._inventory_df = df
+        if df is not None:
+            self.snapshot = None
+            self._bump_data_version()
+
+    def _require_loaded(self) -> None:
+        """Vérifie qu'un inventaire a été consolidé ou ouvert."""
+        if self._inventory_df is None and self.snapshot is None:
+            raise ValueError("Base de données non initialisée")
+
+    def _from_snapshot(self) -> bool:
+        """Indique si les requêtes portent directement sur l'instantané."""
+        return self._inventory_df is None and self.snapshot is not None
+
+    def open_snapshot(self, path: str) -> None:
+        """
+        Ouvre un instantané binaire à la place des fichiers CSV.
+
+        L'instantané est projeté en mémoire : l'ouverture est immédiate quelle
+        que soit sa taille. Les filtres sur la quantité, le prix et la
+        catégorie lisent directement ses colonnes, et seules les lignes
+        retenues sont décodées ; inventory_df n'est construit que si une
+        commande a besoin de tout l'inventaire.
+
+        Args:
+            path (str): Fichier de l'instantané (voir write_snapshot)
+
+        Raises:
+            ValueError: Si l'instantané est absent ou invalide
+        """
+        try:
+            snapshot = InventorySnapshot.open(path)
+        except FileNotFoundError:
+            raise ValueError(f"Instantané introuvable : {path}")
+        if snapshot.is_stale(self.data_directory):
+            logging.warning(f"Les fichiers CSV ont changé depuis l'instantané {path}")
+        self.inventory_df = None
+        self.snapshot = snapshot
+        self._manifest = snapshot.manifest
+        self._fragments = {}
+        self._invalidate_indexes()
+
+    @profiled("consolidate_files")
+    def consolidate_files(
+        self,
+        rebuild_cache: bool = False,
+        changed_paths: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Consolide tous les fichiers CSV du répertoire.
+
+        La consolidation est incrémentale : seuls les fichiers ajoutés ou
+        modifiés depuis le dernier appel (chemin, date de modification, taille
+        et contenu) sont relus, les lignes des fichiers supprimés disparaissent,
+        puis la déduplication « dernier fichier gagnant » est rejouée.
+        Si un cache est configuré, les fragments de chaque fichier y sont
+        conservés entre deux exécutions, ainsi que l'inventaire consolidé
+        d'un chargement complet ; après une consolidation incrémentale, seuls
+        le manifeste et les fragments relus sont écrits.
+
+        Args:
+            rebuild_cache (bool): Ignorer les données déjà lues et tout relire
+            changed_paths (Iterable[str], optional): Fichiers modifiés depuis le
+                dernier appel, s'ils sont connus (voir DirectoryWatcher) : seuls
+                ceux-ci et les nouveaux fichiers sont relus pour calculer leur
+                signature
+        """
+        manifest = self._build_manifest(changed_paths)
+        incremental = bool(self._fragments) and not rebuild_cache
+
+        if not rebuild_cache:
+            if self.inventory_df is not None and manifest == self._manifest:
+                return
+            if self.cache is not None and not self._fragments:
+                cached_df = self.cache.load(manifest)
+                if cached_df is not None:
+                    self.inventory_df = cached_df
+                    self._manifest = manifest
+                    self._invalidate_indexes()
+                    return
+
+        fragments = {}
+        to_read = []
+        for source, signature in manifest.items():
+            if rebuild_cache:
+                to_read.append(source)
+            elif self._manifest.get(source) == signature and source in self._fragments:
+                fragments[source] = self._fragments[source]
+            else:
+                fragment = (
+                    self.cache.load_fragment(source, signature)
+                    if self.cache is not None
+                    else None
+                )
+                if fragment is not None:
+                    fragments[source] = fragment
+                else:
+                    to_read.append(source)
+
+        read_frames = FileHandler.read_csv_paths(
+            [Path(source) for source in to_read], jobs=self.jobs
+        )
+        for source, fragment in zip(to_read, read_frames):
+            fragments[source] = fragment
+            if self.cache is not None and fragment is not None:
+                self.cache.save_fragment(source, manifest[source], fragment)
+
+        # Le manifeste suit l'ordre trié des fichiers : le dernier fichier gagne
+        frames = [
+            fragments[source] for source in manifest if fragments[source] is not None
+        ]
+        if not frames:
             raise ValueError("Échec de la consolidation des fichiers")
 
-    def set_stock_threshold(self, threshold: int) -> None:
+        inventory_df = pd.concat(frames, ignore_index=True)
+        inventory_df.drop_duplicates(
+            subset=["name", "category"], keep="last", inplace=True
+        )
+
+        self.inventory_df = FileHandler.optimize_dtypes(
+            inventory_df, pyarrow_strings=self.pyarrow_strings
+        )
+        self._invalidate_indexes()
+        self._fragments = fragments
+        self._manifest = manifest
+
+        if self.cache is not None:
+            if incremental:
+                # L'inventaire consolidé sera réenregistré au prochain
+                # chargement complet, reconstruit à partir des fragments
+                self.cache.save_manifest(manifest)
+            else:
+                self.cache.save(self.inventory_df, manifest)
+
+    def _build_manifest(
+        self, changed_paths: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Construit le manifeste des fichiers CSV du répertoire.
+
+        Args:
+            changed_paths (Iterable[str], optional): Fichiers modifiés depuis le
+                dernier manifeste ; les autres gardent leur signature
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Signature de chaque fichier, par chemin
+        """
+        csv_files = FileHandler.list_csv_files(self.data_directory)
+        if changed_paths is None or not self._manifest:
+            return InventoryCache.build_manifest(csv_files)
+
+        changed = {str(Path(path).resolve()) for path in changed_paths}
+        manifest = {}
+        for path in csv_files:
+            source = str(path.resolve())
+            if source in changed or source not in self._manifest:
+                manifest[source] = FileHandler.file_signature(path)
+            else:
+                manifest[source] = self._manifest[source]
+        return manifest
+
+    def save_snapshot(self, path: str) -> bool:
+        """
+        Enregistre l'inventaire consolidé dans un instantané binaire.
+
+        Args:
+            path (str): Fichier de l'instantané (voir open_snapshot)
+
+        Returns:
+            bool: True si succès, False sinon
+        """
+        self._require_loaded()
+        return write_snapshot(self.inventory_df, path, self._manifest)
+
+    def memory_report(self) -> pd.DataFrame:
+        """
+        Compare l'empreinte mémoire de l'inventaire avant et après compactage.
+
+        L'état « avant » correspond aux types par défaut de pandas : chaînes en
+        objets Python, quantité en int64 et prix en float64.
+
+        Returns:
+            pd.DataFrame: Octets par colonne (colonnes « avant » et « après »)
+        """
+        self._require_loaded()
+
+        default_dtypes = {"name": object, "category": object}
+        if pd.api.types.is_integer_dtype(self.inventory_df["quantity"]):
+            default_dtypes["quantity"] = "int64"
+        default_df = self.inventory_df.astype(default_dtypes)
+        return pd.DataFrame(
+            {
+                "avant": FileHandler.memory_usage(default_df),
+                "après": FileHandler.memory_usage(self.inventory_df),
+            }
+        )
+
+    def set_stock_threshold(
+        self,
+        threshold: int,
+        category: Optional[str] = None,
+        product: Optional[str] = None,
+    ) -> None:
         """
         Configure le seuil d'alerte pour le stock bas.
 
+        Le seuil d'un produit l'emporte sur celui de sa catégorie, qui
+        l'emporte sur le seuil par défaut.
+
         Args:
             threshold (int): Nouveau seuil d'alerte
+            category (str, optional): Catégorie concernée (seuil par défaut si
+                ni catégorie ni produit)
+            product (str, optional): Nom du produit concerné
 
         Raises:
             ValueError: Si le seuil n'est pas un entier positif
@@ -55,148 +326,600 @@ class InventoryManager:
 
         if threshold < 0:
             raise ValueError("Le seuil doit être un entier positif")
-        self.stock_threshold = threshold
+        if product is not None:
+            self.product_thresholds[product] = threshold
+        elif category is not None:
+            self.category_thresholds[category] = threshold
+        else:
+            self.stock_threshold = threshold
+
+    def row_thresholds(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Seuil d'alerte applicable à chaque ligne d'un DataFrame de produits.
+
+        Args:
+            df (pd.DataFrame): Produits (colonnes name et category)
 
-    def get_low_stock_products(self) -> pd.DataFrame:
+        Returns:
+            np.ndarray: Seuil de chaque ligne
+        """
+        return row_thresholds(
+            df,
+            self.stock_threshold,
+            self.category_thresholds,
+            self.product_thresholds,
+        )
+
+    def _snapshot_thresholds(self) -> np.ndarray:
+        """
+        Seuil d'alerte de chaque ligne de l'instantané (voir row_thresholds).
+
+        Les seuils par catégorie passent par une table indexée par code de
+        catégorie ; les noms ne sont décodés qu'en présence de seuils par
+        produit.
+        """
+        snapshot = self.snapshot
+        table = np.array(
+            [
+                self.category_thresholds.get(category, self.stock_threshold)
+                for category in snapshot.categories
+            ],
+            dtype=np.int64,
+        )
+        thresholds = table[snapshot.category_codes]
+        if self.product_thresholds:
+            names = pd.Series(snapshot.names(), dtype=object)
+            mapped = names.map(self.product_thresholds).to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+            found = ~np.isnan(mapped)
+            thresholds[found] = mapped[found]
+        return thresholds
+
+    def get_low_stock_products(self, with_thresholds: bool = False) -> pd.DataFrame:
         """
         Retourne les produits dont le stock est inférieur au seuil.
 
+        Le résultat est mémorisé pour la version courante des données et les
+        seuils en vigueur (voir _memoized).
+
+        Args:
+            with_thresholds (bool): Ajouter une colonne threshold donnant le
+                seuil appliqué à chaque produit
+
         Returns:
             pd.DataFrame: DataFrame contenant les produits en stock bas
         """
-        if self.inventory_df is None:
-            raise ValueError("Base de données non initialisée")
+        self._require_loaded()
+        return self._memoized(
+            ("low_stock", with_thresholds, self._threshold_signature()),
+            lambda: self._low_stock_products(with_thresholds),
+        )
+
+    def _threshold_signature(self) -> tuple:
+        """Seuils en vigueur, sous une forme utilisable comme clé de cache."""
+        return (
+            self.stock_threshold,
+            tuple(sorted(self.category_thresholds.items())),
+            tuple(sorted(self.product_thresholds.items())),
+        )
 
-        return self.inventory_df[
-            self.inventory_df["quantity"] <= self.stock_threshold
-        ].copy()
+    def _low_stock_products(self, with_thresholds: bool) -> pd.DataFrame:
+        """Produits en stock bas, non mémorisés (voir get_low_stock_products)."""
+        if self._from_snapshot():
+            # Filtre sur la colonne projetée : seules les lignes retenues
+            # sont décodées
+            thresholds = self._snapshot_thresholds()
+            low = self.snapshot.quantity <= thresholds
+            low_stock = self.snapshot.take(np.flatnonzero(low))
+        else:
+            thresholds = self.row_thresholds(self.inventory_df)
+            low = self.inventory_df["quantity"].to_numpy() <= thresholds
+            low_stock = self.inventory_df[low].copy()
+        if with_thresholds:
+            low_stock["threshold"] = thresholds[low]
+        return low_stock
 
-    def check_stock_alerts(self) -> list:
+    @profiled("check_stock_alerts")
+    def check_stock_alerts(
+        self,
+        summary: bool = False,
+        alert_file: Optional[str] = None,
+        low_stock: Optional[pd.DataFrame] = None,
+    ) -> list:
         """
         Vérifie et retourne les alertes de stock.
 
+        Les messages sont construits en une seule opération sur les colonnes.
+
+        Args:
+            summary (bool): Journaliser un seul message récapitulatif au lieu
+                d'un message par alerte
+            alert_file (str, optional): Fichier JSON Lines où écrire les
+                alertes (nom, catégorie, quantité, seuil), une par ligne
+            low_stock (pd.DataFrame, optional): Produits en stock bas déjà
+                calculés par get_low_stock_products(with_thresholds=True) ;
+                ils ne sont pas modifiés
+
         Returns:
             list: Liste des alertes formatées
         """
-        low_stock = self.get_low_stock_products()
-        alerts = []
+        if low_stock is None:
+            low_stock = self.get_low_stock_products(with_thresholds=True)
+        thresholds = low_stock["threshold"].to_numpy()
+        low_stock = low_stock.drop(columns="threshold")
+        alerts = (
+            "ALERTE: Stock bas pour "
+            + low_stock["name"].astype(str)
+            + " ("
+            + low_stock["quantity"].astype(str)
+            + " unités restantes, seuil: "
+            + pd.Series(thresholds, index=low_stock.index).astype(str)
+            + ")"
+        ).tolist()
 
-        for _, product in low_stock.iterrows():
-            alert = (
-                f"ALERTE: Stock bas pour {product['name']} "
-                f"({product['quantity']} unités restantes, "
-                f"seuil: {self.stock_threshold})"
+        if alert_file:
+            export_frame(
+                low_stock[["name", "category", "quantity"]].assign(
+                    threshold=thresholds
+                ),
+                "jsonl",
+                alert_file,
             )
-            alerts.append(alert)
-            logging.warning(alert)
+
+        if summary:
+            if alerts:
+                # Seuils réellement appliqués (par défaut, catégorie ou produit)
+                applied = np.unique(thresholds)
+                if len(applied) == 1:
+                    limits = f"seuil: {applied[0]}"
+                else:
+                    limits = f"seuils: {applied[0]} à {applied[-1]}"
+                logging.warning(f"{len(alerts)} alerte(s) de stock bas ({limits})")
+        else:
+            for alert in alerts:
+                logging.warning(alert)
 
         return alerts
 
+    @profiled("search_products")
     def search_products(
         self,
         name: Optional[str] = None,
         category: Optional[str] = None,
         min_price: Optional[float] = None,
         max_price: Optional[float] = None,
+        fuzzy: bool = False,
     ) -> pd.DataFrame:
         """
         Recherche des produits selon différents critères.
 
+        La recherche par nom ignore la casse et les accents (« ecouteurs »
+        trouve « Écouteurs »).
+
         Args:
             name (str, optional): Nom du produit (recherche partielle)
             category (str, optional): Catégorie du produit
             min_price (float, optional): Prix minimum
             max_price (float, optional): Prix maximum
+            fuzzy (bool): Recherche approchée sur le nom, tolérante aux
+                fautes de frappe ; les résultats sont triés par pertinence
 
         Returns:
-            pd.DataFrame: Résultats de la recherche
+            pd.DataFrame: Résultats de la recherche, mémorisés pour la
+                version courante des données (voir _memoized)
         """
-        if self.inventory_df is None:
-            raise ValueError("Base de données non initialisée")
+        self._require_loaded()
 
-        result = self.inventory_df.copy()
+        if not (name or category or min_price is not None or max_price is not None):
+            # Tout l'inventaire : rien à mémoriser
+            return self._search(name, category, min_price, max_price, fuzzy)
+        return self._memoized(
+            ("search", name, category, min_price, max_price, fuzzy),
+            lambda: self._search(name, category, min_price, max_price, fuzzy),
+        )
+
+    def _search(
+        self,
+        name: Optional[str],
+        category: Optional[str],
+        min_price: Optional[float],
+        max_price: Optional[float],
+        fuzzy: bool,
+    ) -> pd.DataFrame:
+        """Recherche non mémorisée (voir search_products)."""
+        if not (name or category or min_price is not None or max_price is not None):
+            return self.inventory_df.copy()
+
+        if self._from_snapshot():
+            positions = self._snapshot_positions(category, min_price, max_price)
+        elif self.build_indexes:
+            positions = self._indexed_positions(category, min_price, max_price)
+        else:
+            positions = self._scanned_positions(category, min_price, max_price)
+
+        if name and not (fuzzy or self.build_indexes or self._name_index is not None):
+            # Requête isolée : parcourir les noms coûte moins que l'index
+            if self._from_snapshot():
+                names = pd.Series(self.snapshot.names(positions), dtype="str")
+            elif positions is not None:
+                names = self.inventory_df["name"].iloc[positions]
+            else:
+                names = self.inventory_df["name"]
+            matches = scan_names(names, name)
+            positions = matches if positions is None else positions[matches]
+        elif name:
+            name_index = self._get_name_index()
+            if fuzzy:
+                ranked, _ = name_index.fuzzy_search(name)
+                if positions is not None:
+                    ranked = ranked[np.isin(ranked, positions)]
+                positions = ranked
+            else:
+                matches = name_index.search(name)
+                positions = (
+                    matches
+                    if positions is None
+                    else np.intersect1d(positions, matches, assume_unique=True)
+                )
 
-        if name:
-            result = result[result["name"].str.contains(name, case=False, na=False)]
+        # Seules les lignes retenues sont matérialisées
+        if self._from_snapshot():
+            return self.snapshot.take(positions)
+        return self.inventory_df.iloc[positions]
+
+    def _indexed_positions(
+        self,
+        category: Optional[str],
+        min_price: Optional[float],
+        max_price: Optional[float],
+    ) -> Optional[np.ndarray]:
+        """
+        Positions des lignes d'une catégorie et d'une plage de prix, trouvées
+        avec les index secondaires.
+
+        Returns:
+            Optional[np.ndarray]: Positions croissantes (None = toutes)
+        """
+        self._ensure_indexes()
+
+        # Positions des lignes candidates (None = toutes les lignes)
+        positions = None
+        if category:
+            positions = self._category_index.get(category, np.empty(0, dtype=np.intp))
+
+        if min_price is not None or max_price is not None:
+            if positions is not None:
+                # Peu de candidats : filtrer directement leurs prix
+                prices = self.inventory_df["unit_price"].to_numpy()[positions]
+                mask = np.ones(len(positions), dtype=bool)
+                if min_price is not None:
+                    mask &= prices >= min_price
+                if max_price is not None:
+                    mask &= prices <= max_price
+                positions = positions[mask]
+            else:
+                # Recherche dichotomique dans les prix triés
+                start = (
+                    np.searchsorted(self._sorted_prices, min_price, side="left")
+                    if min_price is not None
+                    else 0
+                )
+                stop = (
+                    np.searchsorted(self._sorted_prices, max_price, side="right")
+                    if max_price is not None
+                    else np.count_nonzero(~np.isnan(self._sorted_prices))
+                )
+                positions = np.sort(self._price_order[start:stop])
+
+        return positions
+
+    def _scanned_positions(
+        self,
+        category: Optional[str],
+        min_price: Optional[float],
+        max_price: Optional[float],
+    ) -> Optional[np.ndarray]:
+        """
+        Positions des lignes d'une catégorie et d'une plage de prix, filtrées
+        par masques booléens, sans index (requête isolée).
+
+        Returns:
+            Optional[np.ndarray]: Positions croissantes (None = toutes)
+        """
+        df = self.inventory_df
+        mask = None
         if category:
-            result = result[result["category"] == category]
-        if min_price is not None:
-            result = result[result["unit_price"] >= min_price]
-        if max_price is not None:
-            result = result[result["unit_price"] <= max_price]
+            mask = (df["category"] == category).to_numpy(dtype=bool)
+        prices = df["unit_price"].to_numpy()
+        for bound, keep in ((min_price, np.greater_equal), (max_price, np.less_equal)):
+            if bound is not None:
+                in_range = keep(prices, bound)
+                mask = in_range if mask is None else mask & in_range
+        return None if mask is None else np.flatnonzero(mask)
 
+    def _snapshot_positions(
+        self,
+        category: Optional[str],
+        min_price: Optional[float],
+        max_price: Optional[float],
+    ) -> Optional[np.ndarray]:
+        """
+        Positions des lignes d'une catégorie et d'une plage de prix, filtrées
+        directement sur les colonnes projetées de l'instantané.
+
+        Returns:
+            Optional[np.ndarray]: Positions croissantes (None = toutes)
+        """
+        snapshot = self.snapshot
+        mask = None
+        if category:
+            code = snapshot.category_code(category)
+            if code is None:
+                return np.empty(0, dtype=np.intp)
+            mask = snapshot.category_codes == code
+        for bound, keep in ((min_price, np.greater_equal), (max_price, np.less_equal)):
+            if bound is not None:
+                in_range = keep(snapshot.unit_price, bound)
+                mask = in_range if mask is None else mask & in_range
+        return None if mask is None else np.flatnonzero(mask)
+
+    def _invalidate_indexes(self) -> None:
+        """Invalide les index secondaires après un changement d'inventaire."""
+        self._bump_data_version()
+        self._indexed_df = None
+        self._category_index = None
+        self._price_order = None
+        self._sorted_prices = None
+        self._name_index = None
+
+    def _bump_data_version(self) -> None:
+        """Change de version de données : les résultats mémorisés expirent."""
+        self.data_version += 1
+        self._memo.clear()
+
+    def _memoized(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Résultat d'une requête pour la version courante des données, calculé
+        au premier appel puis conservé dans un cache LRU borné.
+
+        Les DataFrame et Series sont retournés en copie superficielle :
+        l'appelant peut ajouter ou retirer des colonnes, mais ne doit pas
+        modifier leurs valeurs en place.
+
+        Args:
+            key (tuple): Requête et ses paramètres
+            compute (Callable[[], Any]): Calcul du résultat
+
+        Returns:
+            Any: Résultat de la requête
+        """
+        result = self._memo.get((self.data_version, *key), compute)
+        if isinstance(result, (pd.DataFrame, pd.Series)):
+            return result.copy(deep=False)
         return result
 
-    def generate_report(self, output_file: str) -> None:
+    def memo_stats(self) -> Dict[str, int]:
+        """
+        Compteurs du cache des résultats mémorisés.
+
+        Returns:
+            Dict[str, int]: hits, misses, size, maxsize et version des données
+        """
+        return {**self._memo.stats(), "version": self.data_version}
+
+    def clear_memo(self) -> None:
+        """Oublie les résultats mémorisés, sans changer de version de données."""
+        self._memo.clear()
+
+    def stock_values(self) -> pd.Series:
+        """
+        Valeur en stock (quantité × prix unitaire) de chaque produit,
+        mémorisée pour la version courante des données.
+
+        Returns:
+            pd.Series: Valeurs, alignées sur l'inventaire consolidé
+        """
+        self._require_loaded()
+        return self._memoized(("stock_value",), self._compute_stock_values)
+
+    def _compute_stock_values(self) -> pd.Series:
+        """Calcule la valeur en stock de chaque produit."""
+        if self._from_snapshot():
+            return pd.Series(
+                self.snapshot.quantity * self.snapshot.unit_price, name="stock_value"
+            )
+        df = self.inventory_df
+        return (df["quantity"] * df["unit_price"]).rename("stock_value")
+
+    def _get_name_index(self) -> NameIndex:
+        """Retourne l'index de trigrammes des noms, construit à la demande."""
+        with self._index_lock:
+            if self._name_index is None:
+                if self._from_snapshot():
+                    self._name_index = NameIndex(self.snapshot.names())
+                else:
+                    self._name_index = NameIndex(self.inventory_df["name"])
+            return self._name_index
+
+    def _ensure_indexes(self) -> None:
+        """
+        Construit les index secondaires de l'inventaire courant si besoin.
+
+        - catégorie -> positions des lignes (recherche en O(1))
+        - positions triées par prix unitaire et prix triés (searchsorted)
+        - trigrammes des noms (voir _get_name_index)
+        """
+        with self._index_lock:
+            if self._indexed_df is self.inventory_df:
+                return
+
+            df = self.inventory_df
+            self._category_index = df.groupby(
+                "category", sort=False, observed=True
+            ).indices
+            prices = df["unit_price"].to_numpy(dtype=np.float64)
+            self._price_order = np.argsort(prices, kind="stable")
+            self._sorted_prices = prices[self._price_order]
+            # L'index des noms, plus coûteux, n'est reconstruit qu'à la demande
+            self._name_index = None
+            self._indexed_df = df
+
+    @profiled("generate_report")
+    def generate_report(
+        self, output_file: Optional[str] = None, output_format: Optional[str] = None
+    ) -> ReportResult:
         """
         Génère un rapport récapitulatif détaillé.
 
         Args:
-            output_file (str): Chemin du fichier de sortie
+            output_file (str, optional): Fichier où enregistrer le rapport
+                (aucun fichier si None)
+            output_format (str, optional): Format du fichier : csv, parquet,
+                json, xlsx ou markdown (par défaut : d'après l'extension)
+
+        Returns:
+            ReportResult: Statistiques globales et par catégorie
         """
-        if self.inventory_df is None:
-            raise ValueError("Base de données non initialisée")
+        result = self._memoized(("report",), self._report_stats)
+        self._save_report(result, output_file, output_format)
+        return result
 
-        # Statistiques globales
-        global_stats = pd.DataFrame(
-            [
-                {
-                    "Métrique": "Nombre total de produits",
-                    "Valeur": len(self.inventory_df),
-                },
-                {
-                    "Métrique": "Nombre de catégories",
-                    "Valeur": self.inventory_df["category"].nunique(),
-                },
-                {
-                    "Métrique": "Valeur totale du stock",
-                    "Valeur": (
-                        self.inventory_df["quantity"] * self.inventory_df["unit_price"]
-                    ).sum(),
-                },
+    @staticmethod
+    def _save_report(
+        result: ReportResult,
+        output_file: Optional[str],
+        output_format: Optional[str] = None,
+    ) -> None:
+        """Enregistre le rapport si un fichier est demandé."""
+        if output_file is not None and not save_report(
+            result, output_file, output_format
+        ):
+            raise Exception("Échec de la génération du rapport")
+
+    def _report_stats(self) -> ReportResult:
+        """Statistiques du rapport sur l'inventaire consolidé."""
+        self._require_loaded()
+        if self._from_snapshot():
+            # Les noms ne servent pas au rapport : ils ne sont pas décodés
+            df = self.snapshot.take(columns=["quantity", "unit_price", "category"])
+        else:
+            df = self.inventory_df
+        return self._compute_report_stats(df.assign(stock_value=self.stock_values()))
+
+    @profiled("generate_report")
+    def generate_report_streaming(
+        self,
+        output_file: Optional[str] = None,
+        chunksize: int = 100_000,
+        output_format: Optional[str] = None,
+    ) -> ReportResult:
+        """
+        Génère le rapport en lisant les fichiers CSV par blocs.
+
+        L'inventaire complet n'est jamais chargé en mémoire : chaque bloc est
+        réduit à des tableaux compacts (empreinte 64 bits de (name, category),
+        code de catégorie, quantité et prix), dédupliqué avec
+        drop_duplicates(keep="last") puis fusionné avec les produits déjà vus,
+        où la dernière occurrence gagne. Les noms ne sont pas conservés. Le
+        rapport est identique à celui de generate_report (à une collision
+        d'empreintes près, de probabilité négligeable).
+
+        Args:
+            output_file (str, optional): Fichier où enregistrer le rapport
+                (aucun fichier si None)
+            chunksize (int): Nombre de lignes lues par bloc
+            output_format (str, optional): Format du fichier (voir
+                generate_report)
+
+        Returns:
+            ReportResult: Statistiques globales et par catégorie
+        """
+        categories: Dict[str, int] = {}
+        pieces: List[pd.DataFrame] = []
+        retained = pending = 0
+        for chunk in FileHandler.iter_csv_chunks(self.data_directory, chunksize):
+            codes, uniques = pd.factorize(chunk["category"])
+            global_codes = np.array(
+                [
+                    categories.setdefault(category, len(categories))
+                    for category in uniques
+                ],
+                dtype=np.int32,
+            )
+            piece = pd.DataFrame(
                 {
-                    "Métrique": "Prix moyen",
-                    "Valeur": self.inventory_df["unit_price"].mean(),
-                },
+                    "key": pd.util.hash_pandas_object(
+                        chunk[["name", "category"]], index=False
+                    ).to_numpy(),
+                    "code": global_codes[codes],
+                    "quantity": chunk["quantity"].to_numpy(),
+                    "unit_price": chunk["unit_price"].to_numpy(),
+                }
+            ).drop_duplicates(subset="key", keep="last")
+            pieces.append(piece)
+            pending += len(piece)
+            # Fusion amortie : les blocs en attente ne sont fusionnés qu'une
+            # fois plus nombreux que les produits déjà retenus
+            if pending > retained:
+                merged = pd.concat(pieces, ignore_index=True).drop_duplicates(
+                    subset="key", keep="last"
+                )
+                pieces, retained, pending = [merged], len(merged), 0
+
+        if not pieces:
+            raise ValueError("Échec de la consolidation des fichiers")
+        products = pd.concat(pieces, ignore_index=True).drop_duplicates(
+            subset="key", keep="last"
+        )
+        if products.empty:
+            raise ValueError("Échec de la consolidation des fichiers")
+
+        result = self._compute_report_stats(
+            pd.DataFrame(
                 {
-                    "Métrique": "Produits en stock faible (<10)",
-                    "Valeur": len(
-                        self.inventory_df[self.inventory_df["quantity"] < 10]
+                    "quantity": products["quantity"].to_numpy(),
+                    "unit_price": products["unit_price"].to_numpy(),
+                    "category": pd.Categorical.from_codes(
+                        products["code"].to_numpy(), categories=list(categories)
                     ),
-                },
-            ]
+                }
+            )
         )
 
-        # Statistiques par catégorie
-        category_stats = []
-        for category in self.inventory_df["category"].unique():
-            cat_df = self.inventory_df[self.inventory_df["category"] == category]
-            category_stats.extend(
-                [
-                    {
-                        "Métrique": f"{category} - Nombre de produits",
-                        "Valeur": len(cat_df),
-                    },
-                    {
-                        "Métrique": f"{category} - Valeur totale",
-                        "Valeur": (cat_df["quantity"] * cat_df["unit_price"]).sum(),
-                    },
-                    {
-                        "Métrique": f"{category} - Prix moyen",
-                        "Valeur": cat_df["unit_price"].mean(),
-                    },
-                    {
-                        "Métrique": f"{category} - Stock total",
-                        "Valeur": cat_df["quantity"].sum(),
-                    },
-                ]
-            )
+        self._save_report(result, output_file, output_format)
+        return result
 
-        # Combiner les statistiques
-        stats_df = pd.concat(
-            [global_stats, pd.DataFrame(category_stats)], ignore_index=True
-        )
+    @staticmethod
+    def _compute_report_stats(df: pd.DataFrame) -> ReportResult:
+        """
+        Calcule les statistiques du rapport.
 
-        # Sauvegarder le rapport
-        if not FileHandler.save_report(stats_df, output_file):
-            raise Exception("Échec de la génération du rapport")
+        Args:
+            df (pd.DataFrame): Inventaire dédupliqué (colonnes category,
+                quantity et unit_price, et stock_value si elle est déjà
+                calculée)
+
+        Returns:
+            ReportResult: Statistiques globales et par catégorie
+        """
+        if "stock_value" not in df.columns:
+            df = df.assign(stock_value=df["quantity"] * df["unit_price"])
+        # Statistiques par catégorie : une seule agrégation groupée, les
+        # catégories restant dans leur ordre de première apparition
+        category_agg = df.groupby("category", sort=False, observed=True).agg(
+            count=("unit_price", "size"),
+            stock_value=("stock_value", "sum"),
+            mean_price=("unit_price", "mean"),
+            total_quantity=("quantity", "sum"),
+        )
+        return ReportResult(
+            totals={
+                "count": len(df),
+                "categories": df["category"].nunique(),
+                "stock_value": df["stock_value"].sum(),
+                "mean_price": df["unit_price"].mean(),
+                "low_stock": len(df[df["quantity"] < 10]),
+            },
+            categories=category_agg,
+        )
@@ -0,0 +1,230 @@
+import unicodedata
+from typing import Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Nombre de lignes converties à la fois lors de la construction de l'index
+BUILD_BATCH_SIZE = 100_000
+
+
+class _AccentTable(dict):
+    """Table de str.translate qui retire les accents, remplie à la demande."""
+
+    def __missing__(self, codepoint: int) -> str:
+        decomposed = unicodedata.normalize("NFKD", chr(codepoint))
+        stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+        self[codepoint] = stripped
+        return stripped
+
+
+_ACCENT_TABLE = _AccentTable()
+
+
+def normalize_name(text: str) -> str:
+    """
+    Normalise un nom pour la recherche : casse repliée et accents retirés.
+
+    Args:
+        text (str): Texte à normaliser
+
+    Returns:
+        str: Texte normalisé (« Écouteurs » -> « ecouteurs »)
+    """
+    if text.isascii():
+        return text.casefold()
+    return text.translate(_ACCENT_TABLE).casefold()
+
+
+def scan_names(names: Iterable[str], query: str) -> np.ndarray:
+    """
+    Recherche les noms contenant la requête (sans tenir compte de la casse ni
+    des accents) par un parcours vectorisé, sans index.
+
+    Pour une requête isolée, ce parcours coûte bien moins que la construction
+    d'un NameIndex ; les résultats sont ceux de NameIndex.search.
+
+    Args:
+        names (Iterable[str]): Noms des produits, dans l'ordre des lignes
+        query (str): Sous-chaîne recherchée
+
+    Returns:
+        np.ndarray: Positions triées des lignes correspondantes
+    """
+    if not isinstance(names, pd.Series):
+        names = pd.Series(list(names), dtype="str")
+    query = normalize_name(query)
+    # Pour un nom ASCII, ignorer la casse revient à le normaliser ; seuls les
+    # autres noms demandent la normalisation complète
+    matches = names.str.contains(query, case=False, regex=False).to_numpy(
+        dtype=bool, na_value=False, copy=True
+    )
+    accented = np.flatnonzero(~names.str.isascii().to_numpy(dtype=bool, na_value=True))
+    if len(accented):
+        matches[accented] = [
+            isinstance(name, str) and query in normalize_name(name)
+            for name in names.iloc[accented]
+        ]
+    return np.flatnonzero(matches)
+
+
+def _trigram_codes(codepoints: np.ndarray) -> np.ndarray:
+    """
+    Encode les trigrammes d'une matrice de points de code en entiers 64 bits.
+
+    Args:
+        codepoints (np.ndarray): Matrice (lignes x caractères) de uint32
+
+    Returns:
+        np.ndarray: Matrice (lignes x positions) des codes ; 0 hors du texte
+    """
+    c = codepoints.astype(np.uint64)
+    codes = (c[:, :-2] << np.uint64(42)) | (c[:, 1:-1] << np.uint64(21)) | c[:, 2:]
+    # Un trigramme qui déborde sur le remplissage n'existe pas
+    codes[codepoints[:, 2:] == 0] = 0
+    return codes
+
+
+class NameIndex:
+    """
+    Index inversé de trigrammes sur les noms de produits.
+
+    Les noms sont normalisés (casse et accents), entourés d'une espace pour
+    marquer leurs bords, puis découpés en trigrammes.
+    Chaque trigramme est encodé en entier ; l'index est stocké sous forme
+    compacte : codes triés, et pour chacun une tranche de positions de lignes.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Construit l'index.
+
+        Args:
+            names (Iterable[str]): Noms des produits, dans l'ordre des lignes
+        """
+        if isinstance(names, pd.Series):
+            names = names.tolist()
+        self._normalized = pd.Series(
+            [normalize_name(name) if isinstance(name, str) else "" for name in names],
+            dtype=object,
+        )
+        count = len(self._normalized)
+
+        all_codes = []
+        all_rows = []
+        for start in range(0, count, BUILD_BATCH_SIZE):
+            batch = " " + self._normalized.iloc[start : start + BUILD_BATCH_SIZE] + " "
+            width = max(3, int(batch.str.len().max() or 0))
+            codepoints = (
+                np.array(batch.tolist(), dtype=f"<U{width}")
+                .view(np.uint32)
+                .reshape(len(batch), width)
+            )
+            codes = _trigram_codes(codepoints)
+            rows, _ = np.nonzero(codes)
+            all_codes.append(codes[codes != 0])
+            all_rows.append(rows + start)
+
+        codes = np.concatenate(all_codes) if all_codes else np.empty(0, np.uint64)
+        rows = np.concatenate(all_rows) if all_rows else np.empty(0, np.intp)
+
+        # Tri par (code, ligne) puis suppression des trigrammes répétés ; les
+        # lignes sont déjà croissantes, un tri stable sur le code suffit
+        order = np.argsort(codes, kind="stable")
+        codes, rows = codes[order], rows[order]
+        distinct = np.ones(len(codes), dtype=bool)
+        distinct[1:] = (codes[1:] != codes[:-1]) | (rows[1:] != rows[:-1])
+        codes, rows = codes[distinct], rows[distinct]
+
+        # Codes triés : chaque liste de lignes commence là où le code change
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        self._codes = codes[starts]
+        self._offsets = np.append(starts, len(codes))
+        self._rows = rows
+        # Nombre de trigrammes distincts par nom, pour le score flou
+        self._trigram_counts = np.bincount(rows, minlength=count)
+
+    def __len__(self) -> int:
+        return len(self._normalized)
+
+    def _query_codes(self, query: str) -> np.ndarray:
+        """Codes distincts des trigrammes d'une requête normalisée."""
+        if len(query) < 3:
+            return np.empty(0, dtype=np.uint64)
+        codepoints = np.array([query], dtype=f"<U{len(query)}").view(np.uint32)
+        return np.unique(_trigram_codes(codepoints.reshape(1, -1)).ravel())
+
+    def _postings(self, code: np.uint64) -> np.ndarray:
+        """Positions des lignes contenant un trigramme."""
+        i = np.searchsorted(self._codes, code)
+        if i == len(self._codes) or self._codes[i] != code:
+            return np.empty(0, dtype=self._rows.dtype)
+        return self._rows[self._offsets[i] : self._offsets[i + 1]]
+
+    def search(self, query: str) -> np.ndarray:
+        """
+        Recherche les noms contenant la requête (sans tenir compte de la
+        casse ni des accents).
+
+        Args:
+            query (str): Sous-chaîne recherchée
+
+        Returns:
+            np.ndarray: Positions triées des lignes correspondantes
+        """
+        query = normalize_name(query)
+        if len(query) < 3:
+            matches = self._normalized.str.contains(query, regex=False)
+            return np.flatnonzero(matches.to_numpy(dtype=bool))
+
+        # Intersection des listes de trigrammes, de la plus courte à la plus
+        # longue, puis vérification exacte des candidats restants
+        postings = sorted(
+            (self._postings(code) for code in self._query_codes(query)), key=len
+        )
+        candidates = postings[0]
+        for posting in postings[1:]:
+            if not len(candidates):
+                break
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+
+        normalized = self._normalized.to_numpy()
+        return np.array(
+            [row for row in candidates if query in normalized[row]], dtype=np.intp
+        )
+
+    def fuzzy_search(
+        self, query: str, min_score: float = 0.5
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Recherche approchée, tolérante aux fautes de frappe.
+
+        Le score d'un nom est la part des trigrammes de la requête qu'il
+        contient ; à score égal, les noms les plus proches en taille passent
+        devant (coefficient de Dice).
+
+        Args:
+            query (str): Texte recherché
+            min_score (float): Score minimal entre 0 et 1
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Positions des lignes et scores,
+                triés par pertinence décroissante
+        """
+        query = normalize_name(query)
+        if len(query) < 3:
+            rows = self.search(query)
+            return rows, np.ones(len(rows))
+
+        # Les bords de la requête comptent, comme ceux des noms indexés
+        query_codes = self._query_codes(f" {query} ")
+
+        hits = [self._postings(code) for code in query_codes]
+        rows, common = np.unique(np.concatenate(hits), return_counts=True)
+        scores = common / len(query_codes)
+        dice = 2 * common / (len(query_codes) + self._trigram_counts[rows])
+
+        keep = scores >= min_score
+        rows, scores, dice = rows[keep], scores[keep], dice[keep]
+        order = np.lexsort((rows, -dice, -scores))
+        return rows[order], scores[order]
@@ -0,0 +1,279 @@
+import hmac
+import ipaddress
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .client import SERVER_STATE_FILE
+from .manager import InventoryManager
+from .watcher import DirectoryWatcher
+
+# Paramètres de chemin refusés : le serveur n'écrit aucun fichier
+FILE_PARAMS = ("alert_file", "output")
+
+
+def is_loopback(host: str) -> bool:
+    """
+    Indique si une adresse d'écoute n'est joignable que depuis la machine.
+
+    Args:
+        host (str): Adresse IP ou nom d'hôte
+
+    Returns:
+        bool: True pour localhost et les adresses de bouclage
+    """
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class InventoryServer:
+    """
+    Serveur HTTP local qui garde l'inventaire en mémoire.
+
+    L'inventaire est consolidé une seule fois puis les requêtes list, search,
+    alerts et report sont servies depuis la mémoire. Un thread surveille le
+    répertoire de données et relance une consolidation incrémentale quand
+    un fichier CSV est ajouté, modifié ou supprimé.
+
+    Le serveur ne fait que lire : il n'écrit aucun fichier pour un client.
+    Avec un jeton, chaque requête /query doit le présenter dans l'en-tête
+    « Authorization: Bearer <jeton> » ; il est obligatoire pour écouter sur
+    une adresse autre que locale.
+    """
+
+    def __init__(
+        self,
+        manager: InventoryManager,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        poll_interval: float = 1.0,
+        debounce: float = 0.2,
+        token: Optional[str] = None,
+    ):
+        """
+        Initialise le serveur.
+
+        Args:
+            manager (InventoryManager): Gestionnaire à servir
+            host (str): Adresse d'écoute (locale par défaut)
+            port (int): Port d'écoute (0 = port libre choisi par le système)
+            poll_interval (float): Intervalle de surveillance des fichiers (s)
+            debounce (float): Délai sans modification avant rechargement (s)
+            token (str, optional): Jeton d'accès exigé des clients
+
+        Raises:
+            ValueError: Si l'adresse n'est pas locale et qu'aucun jeton n'est
+                fourni
+        """
+        if not token and not is_loopback(host):
+            raise ValueError(
+                f"Un jeton d'accès est requis pour écouter sur l'adresse {host}"
+            )
+
+        self.manager = manager
+        self.token = token
+        self.poll_interval = poll_interval
+        self.lock = threading.Lock()
+        self._stop = threading.Event()
+        self.watcher = DirectoryWatcher(
+            manager.data_directory,
+            self._reload,
+            poll_interval=poll_interval,
+            debounce=debounce,
+        )
+
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/ping":
+                    self._send(200, {"status": "ok"})
+                else:
+                    self._send(404, {"status": "error", "error": "Route inconnue"})
+
+            def do_POST(self):
+                if self.path != "/query":
+                    self._send(404, {"status": "error", "error": "Route inconnue"})
+                    return
+                if not server.authorized(self.headers.get("Authorization", "")):
+                    self._send(
+                        401, {"status": "error", "error": "Jeton d'accès invalide"}
+                    )
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    request = json.loads(self.rfile.read(length))
+                    result = server.execute(
+                        request["command"], request.get("params", {})
+                    )
+                    self._send(200, {"status": "ok", "result": result})
+                except Exception as e:
+                    self._send(400, {"status": "error", "error": str(e)})
+
+            def _send(self, code: int, payload: Dict[str, Any]):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logging.debug("Serveur: " + format % args)
+
+        self.httpd = ThreadingHTTPServer((host, port), RequestHandler)
+
+    @property
+    def address(self) -> str:
+        """Adresse HTTP du serveur."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def authorized(self, header: str) -> bool:
+        """
+        Vérifie l'en-tête Authorization d'une requête.
+
+        Args:
+            header (str): Valeur de l'en-tête (vide si absent)
+
+        Returns:
+            bool: True si le serveur n'exige pas de jeton ou si le jeton est
+                le bon
+        """
+        if not self.token:
+            return True
+        return hmac.compare_digest(
+            header.encode("utf-8"), f"Bearer {self.token}".encode("utf-8")
+        )
+
+    @property
+    def state_path(self) -> Path:
+        """Chemin du fichier d'état dans le répertoire de données."""
+        return Path(self.manager.data_directory) / SERVER_STATE_FILE
+
+    def execute(self, command: str, params: Dict[str, Any]) -> Any:
+        """
+        Exécute une commande sur l'inventaire en mémoire.
+
+        Args:
+            command (str): list, search, alerts, low_stock ou report
+            params (Dict[str, Any]): Paramètres de la commande
+
+        Returns:
+            Any: Résultat sérialisable en JSON
+
+        Raises:
+            ValueError: Si la commande est inconnue ou demande l'écriture d'un
+                fichier
+        """
+        for param in FILE_PARAMS:
+            if params.get(param):
+                raise ValueError(
+                    f"Le serveur n'écrit pas de fichier ({param}) : "
+                    "le client écrit lui-même ses résultats"
+                )
+
+        with self.lock:
+            manager = self.manager
+            if command == "list":
+                return self._frame_to_json(manager.inventory_df)
+            if command == "search":
+                return self._frame_to_json(manager.search_products(**params))
+            if command in ("alerts", "low_stock"):
+                with self._thresholds(params):
+                    if command == "low_stock":
+                        return self._frame_to_json(
+                            manager.get_low_stock_products(
+                                with_thresholds=params.get("with_thresholds", False)
+                            )
+                        )
+                    return manager.check_stock_alerts(
+                        summary=params.get("summary", False)
+                    )
+            if command == "report":
+                return manager.generate_report().to_dict()
+        raise ValueError(f"Commande inconnue : {command}")
+
+    @contextmanager
+    def _thresholds(self, params: Dict[str, Any]):
+        """Applique les seuils d'une requête le temps de son exécution."""
+        manager = self.manager
+        previous = (
+            manager.stock_threshold,
+            manager.category_thresholds,
+            manager.product_thresholds,
+        )
+        try:
+            if params.get("threshold") is not None:
+                manager.set_stock_threshold(params["threshold"])
+            manager.category_thresholds = dict(params.get("category_thresholds", {}))
+            manager.product_thresholds = dict(params.get("product_thresholds", {}))
+            yield
+        finally:
+            (
+                manager.stock_threshold,
+                manager.category_thresholds,
+                manager.product_thresholds,
+            ) = previous
+
+    @staticmethod
+    def _frame_to_json(df: pd.DataFrame) -> Dict[str, Any]:
+        """Sérialise un DataFrame au format « split »."""
+        return json.loads(df.to_json(orient="split", index=False))
+
+    def refresh(self) -> bool:
+        """
+        Reconsolide l'inventaire si le répertoire de données a changé.
+
+        Returns:
+            bool: True si l'inventaire a été rechargé
+        """
+        changes = self.watcher.check()
+        if changes is None:
+            return False
+        self._reload(changes)
+        return True
+
+    def _reload(self, changes: Dict[str, List[str]]) -> None:
+        """Reconsolide les fichiers modifiés (voir DirectoryWatcher)."""
+        with self.lock:
+            self.manager.consolidate_files(
+                changed_paths=changes["added"] + changes["modified"]
+            )
+        logging.info("Inventaire rechargé après modification des fichiers")
+
+    def start(self) -> None:
+        """Démarre le serveur et la surveillance en arrière-plan."""
+        self.watcher.start()
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        # Le fichier d'état contient le jeton : lisible du seul propriétaire
+        state = {"address": self.address, "pid": os.getpid()}
+        if self.token:
+            state["token"] = self.token
+        self.state_path.unlink(missing_ok=True)
+        fd = os.open(self.state_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        logging.info(f"Serveur d'inventaire démarré sur {self.address}")
+
+    def stop(self) -> None:
+        """Arrête le serveur et supprime le fichier d'état."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self.watcher.stop()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.state_path.unlink(missing_ok=True)
+        logging.info("Serveur d'inventaire arrêté")
@@ -0,0 +1,371 @@
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..models.report import ReportResult
+from ..utils.file_handler import FileHandler
+from ..utils.profiling import profiled
+from .manager import InventoryManager
+from .name_index import NameIndex, normalize_name
+
+# Base SQLite créée dans le répertoire du cache
+DATABASE_FILE = "inventory.sqlite"
+
+PRODUCT_COLUMNS = ["name", "quantity", "unit_price", "category"]
+
+# Types des colonnes produits lues depuis la base, même sans aucune ligne
+PRODUCT_DTYPES = {
+    "name": str,
+    "quantity": "int64",
+    "unit_price": "float64",
+    "category": str,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    position INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    unit_price REAL NOT NULL,
+    category TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    UNIQUE (name, category)
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TEMP TABLE IF NOT EXISTS category_thresholds (
+    category TEXT PRIMARY KEY, threshold INTEGER NOT NULL
+);
+CREATE TEMP TABLE IF NOT EXISTS product_thresholds (
+    name TEXT PRIMARY KEY, threshold INTEGER NOT NULL
+);
+"""
+
+# Version du schéma : une base d'une autre version est vidée puis rechargée
+SCHEMA_VERSION = "3"
+
+# Index secondaires de la table des produits, supprimés pendant un chargement
+# puis reconstruits en une fois
+PRODUCT_INDEXES = {
+    "idx_products_category": "category",
+    "idx_products_unit_price": "unit_price",
+    "idx_products_quantity": "quantity",
+}
+
+
+class SQLiteInventoryManager(InventoryManager):
+    """
+    Gestionnaire d'inventaire stocké dans une base SQLite.
+
+    Expose la même interface qu'InventoryManager, avec des résultats
+    identiques, mais les données vivent dans une table indexée : une base
+    persistante n'est rechargée que si les fichiers CSV ont changé, et les
+    filtres de recherche et d'alertes sont exécutés en SQL.
+
+    La clé unique (name, category) et INSERT ... ON CONFLICT DO UPDATE
+    remplacent drop_duplicates(keep="last") : la mise à jour donne au
+    produit la position (rowid) de sa dernière occurrence.
+    """
+
+    # La connexion SQLite est partagée : les appels concurrents se font sous
+    # verrou, jamais en parallèle
+    concurrent_reads = False
+
+    def __init__(
+        self,
+        data_directory: str,
+        jobs: int = 1,
+        cache_directory: Optional[str] = None,
+        pyarrow_strings: bool = False,
+    ):
+        """
+        Initialise le gestionnaire.
+
+        Args:
+            data_directory (str): Chemin vers le répertoire contenant les fichiers CSV
+            jobs (int): Nombre de fichiers CSV lus en parallèle (défaut: 1)
+            cache_directory (str, optional): Répertoire de la base SQLite
+                persistante (base en mémoire si None)
+            pyarrow_strings (bool): Stocker les noms en chaînes pyarrow
+
+        Raises:
+            ValueError: Si le nombre de jobs n'est pas strictement positif
+        """
+        self._frame: Optional[pd.DataFrame] = None
+        self._loaded = False
+        super().__init__(data_directory, jobs=jobs, pyarrow_strings=pyarrow_strings)
+
+        if cache_directory:
+            Path(cache_directory).mkdir(parents=True, exist_ok=True)
+            self.database = str(Path(cache_directory) / DATABASE_FILE)
+        else:
+            self.database = ":memory:"
+        # Le serveur et la surveillance appellent le gestionnaire depuis
+        # d'autres threads, toujours sous verrou
+        self.connection = sqlite3.connect(self.database, check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+        self._check_schema()
+
+    @property
+    def inventory_df(self) -> Optional[pd.DataFrame]:
+        """Inventaire consolidé, lu depuis la base à la demande."""
+        if not self._loaded:
+            return None
+        if self._frame is None:
+            self._frame = FileHandler.optimize_dtypes(
+                self._query(f"SELECT {', '.join(PRODUCT_COLUMNS)} FROM products"),
+                pyarrow_strings=self.pyarrow_strings,
+            )
+        return self._frame
+
+    @inventory_df.setter
+    def inventory_df(self, df: Optional[pd.DataFrame]) -> None:
+        """Remplace le contenu de la base par un inventaire."""
+        if df is None:
+            self._frame = None
+            return
+        with self.connection:
+            self._replace_products([df])
+        self._invalidate_indexes()
+        self._loaded = True
+
+    def _query(
+        self, sql: str, params: Iterable[Any] = (), order_by: str = "rowid"
+    ) -> pd.DataFrame:
+        """Exécute une requête sur les produits, dans l'ordre des rowid."""
+        df = pd.read_sql_query(
+            f"{sql} ORDER BY {order_by}", self.connection, params=params
+        )
+        return df.astype(
+            {column: dtype for column, dtype in PRODUCT_DTYPES.items() if column in df}
+        )
+
+    def _check_schema(self) -> None:
+        """Vide une base créée avec une autre version du schéma."""
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'schema'"
+        ).fetchone()
+        if row and row[0] == SCHEMA_VERSION:
+            return
+        with self.connection:
+            self.connection.execute("DELETE FROM meta")
+            self.connection.execute("DROP TABLE products")
+        self.connection.executescript(SCHEMA)
+        with self.connection:
+            self._create_indexes()
+            self.connection.execute(
+                "INSERT INTO meta (key, value) VALUES ('schema', ?)",
+                (SCHEMA_VERSION,),
+            )
+
+    def _create_indexes(self) -> None:
+        """Crée les index de la table des produits."""
+        for index, columns in PRODUCT_INDEXES.items():
+            self.connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {index} ON products ({columns})"
+            )
+
+    def _replace_products(self, frames: List[pd.DataFrame]) -> None:
+        """
+        Remplace les produits de la base, dans la transaction en cours.
+
+        Les index secondaires sont reconstruits après l'insertion : les tenir
+        à jour ligne à ligne multiplie le temps de chargement.
+
+        Args:
+            frames (List[pd.DataFrame]): Produits, dans l'ordre de chargement
+        """
+        self.connection.execute("DELETE FROM products")
+        for index in PRODUCT_INDEXES:
+            self.connection.execute(f"DROP INDEX IF EXISTS {index}")
+        position = 0
+        for df in frames:
+            names = df["name"].astype(str).tolist()
+            self.connection.executemany(
+                "INSERT INTO products "
+                "(position, name, quantity, unit_price, category, name_key) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (name, category) DO UPDATE SET "
+                "position = excluded.position, quantity = excluded.quantity, "
+                "unit_price = excluded.unit_price",
+                zip(
+                    range(position, position + len(df)),
+                    names,
+                    df["quantity"].astype("int64").tolist(),
+                    df["unit_price"].astype("float64").tolist(),
+                    df["category"].astype(str).tolist(),
+                    map(normalize_name, names),
+                ),
+            )
+            position += len(df)
+        self._create_indexes()
+
+    def _stored_manifest(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Manifeste des fichiers chargés dans la base."""
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'manifest'"
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    @profiled("consolidate_files")
+    def consolidate_files(
+        self,
+        rebuild_cache: bool = False,
+        changed_paths: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Charge les fichiers CSV du répertoire dans la base.
+
+        La base n'est rechargée que si un fichier a été ajouté, modifié ou
+        supprimé depuis le dernier chargement, y compris par un autre
+        processus quand la base est persistante. Les fichiers sont insérés
+        dans leur ordre trié : le dernier fichier gagne.
+
+        Args:
+            rebuild_cache (bool): Recharger la base même si rien n'a changé
+            changed_paths (Iterable[str], optional): Fichiers modifiés depuis le
+                dernier appel (voir InventoryManager.consolidate_files)
+        """
+        manifest = self._build_manifest(changed_paths)
+        if not rebuild_cache and manifest == self._stored_manifest():
+            if not self._loaded:
+                logging.info(f"Inventaire chargé depuis la base {self.database}")
+            self._manifest = manifest
+            self._loaded = True
+            return
+
+        frames = FileHandler.read_csv_paths(
+            [Path(source) for source in manifest], jobs=self.jobs
+        )
+        if all(frame is None for frame in frames):
+            raise ValueError("Échec de la consolidation des fichiers")
+
+        with self.connection:
+            self._replace_products([frame for frame in frames if frame is not None])
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('manifest', ?)",
+                (json.dumps(manifest),),
+            )
+        self._manifest = manifest
+        self._loaded = True
+        self._invalidate_indexes()
+
+    def _invalidate_indexes(self) -> None:
+        """Oublie les données lues depuis la base après un rechargement."""
+        super()._invalidate_indexes()
+        self._frame = None
+
+    def _require_loaded(self) -> None:
+        if not self._loaded:
+            raise ValueError("Base de données non initialisée")
+
+    def _low_stock_products(self, with_thresholds: bool) -> pd.DataFrame:
+        """
+        Produits en stock bas, non mémorisés (voir get_low_stock_products).
+
+        Les seuils par catégorie et par produit sont joints à la table.
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM category_thresholds")
+            self.connection.execute("DELETE FROM product_thresholds")
+            self.connection.executemany(
+                "INSERT INTO category_thresholds VALUES (?, ?)",
+                self.category_thresholds.items(),
+            )
+            self.connection.executemany(
+                "INSERT INTO product_thresholds VALUES (?, ?)",
+                self.product_thresholds.items(),
+            )
+
+        threshold = (
+            "COALESCE(pt.threshold, ct.threshold, ?)"
+            if self.category_thresholds or self.product_thresholds
+            else "?"
+        )
+        low_stock = self._query(
+            f"SELECT p.name, p.quantity, p.unit_price, p.category, "
+            f"{threshold} AS threshold FROM products AS p "
+            "LEFT JOIN product_thresholds AS pt ON pt.name = p.name "
+            "LEFT JOIN category_thresholds AS ct ON ct.category = p.category "
+            f"WHERE p.quantity <= {threshold}",
+            (self.stock_threshold, self.stock_threshold),
+            order_by="p.rowid",
+        )
+        if not with_thresholds:
+            low_stock = low_stock.drop(columns="threshold")
+        return low_stock
+
+    def _search(
+        self,
+        name: Optional[str],
+        category: Optional[str],
+        min_price: Optional[float],
+        max_price: Optional[float],
+        fuzzy: bool,
+    ) -> pd.DataFrame:
+        """
+        Recherche non mémorisée (voir search_products).
+
+        Les filtres sont traduits en une clause WHERE servie par les index
+        de la table ; le nom est comparé à sa forme normalisée (casse et
+        accents), calculée au chargement.
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        if min_price is not None:
+            clauses.append("unit_price >= ?")
+            params.append(min_price)
+        if max_price is not None:
+            clauses.append("unit_price <= ?")
+            params.append(max_price)
+        if name and not fuzzy:
+            clauses.append("instr(name_key, ?) > 0")
+            params.append(normalize_name(name))
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        if not (name and fuzzy):
+            return self._query(
+                f"SELECT {', '.join(PRODUCT_COLUMNS)} FROM products{where}", params
+            )
+
+        # Recherche approchée : index de trigrammes sur tous les noms, dans
+        # l'ordre des rowid, puis restriction aux lignes filtrées en SQL
+        rows = self._query(
+            f"SELECT rowid AS row_id, {', '.join(PRODUCT_COLUMNS)} FROM products"
+        )
+        ranked, _ = self._get_name_index(rows["name"]).fuzzy_search(name)
+        if clauses:
+            candidates = self._query(
+                f"SELECT rowid AS row_id FROM products{where}", params
+            )
+            ranked = ranked[
+                np.isin(rows["row_id"].to_numpy()[ranked], candidates["row_id"])
+            ]
+        return rows.iloc[ranked][PRODUCT_COLUMNS]
+
+    def _get_name_index(self, names: Optional[pd.Series] = None) -> NameIndex:
+        """Retourne l'index de trigrammes des noms, construit à la demande."""
+        if self._name_index is None:
+            if names is None:
+                names = self._query("SELECT name FROM products")["name"]
+            self._name_index = NameIndex(names)
+        return self._name_index
+
+    def _report_stats(self) -> ReportResult:
+        """
+        Statistiques du rapport.
+
+        Seules les colonnes du rapport sont lues, dans l'ordre des rowid ;
+        les réductions sont celles du stockage pandas, pour des sommes
+        identiques au bit près.
+        """
+        self._require_loaded()
+        df = self._query("SELECT quantity, unit_price, category FROM products")
+        return self._compute_report_stats(df.astype({"category": "category"}))
@@ -0,0 +1,152 @@
+import logging
+import threading
+from importlib.util import find_spec
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..utils.file_handler import FileHandler
+
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+def diff_snapshots(before: Snapshot, after: Snapshot) -> Dict[str, List[str]]:
+    """
+    Compare deux relevés du répertoire de données.
+
+    Args:
+        before (Snapshot): Relevé précédent (voir FileHandler.directory_snapshot)
+        after (Snapshot): Relevé actuel
+
+    Returns:
+        Dict[str, List[str]]: Fichiers « added », « modified » et « removed »
+    """
+    return {
+        "added": sorted(after.keys() - before.keys()),
+        "modified": sorted(
+            path for path in after.keys() & before.keys() if after[path] != before[path]
+        ),
+        "removed": sorted(before.keys() - after.keys()),
+    }
+
+
+class DirectoryWatcher:
+    """
+    Surveille les fichiers CSV d'un répertoire de données.
+
+    Avec watchdog (si installé), les notifications du système (inotify,
+    FSEvents, ...) réveillent la surveillance dès qu'un fichier change ; sans
+    watchdog, le répertoire est relevé toutes les poll_interval secondes.
+    Une rafale de modifications n'est signalée qu'une fois, quand le
+    répertoire n'a plus changé depuis debounce secondes.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        callback: Callable[[Dict[str, List[str]]], None],
+        poll_interval: float = 1.0,
+        debounce: float = 0.5,
+        use_watchdog: Optional[bool] = None,
+    ):
+        """
+        Initialise la surveillance.
+
+        Args:
+            directory (str): Répertoire de données
+            callback (Callable): Appelée avec les fichiers ajoutés, modifiés et
+                supprimés (voir diff_snapshots)
+            poll_interval (float): Intervalle entre deux relevés (s)
+            debounce (float): Délai sans modification avant de signaler (s)
+            use_watchdog (bool, optional): Utiliser watchdog (par défaut : s'il
+                est installé)
+        """
+        self.directory = directory
+        self.callback = callback
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        if use_watchdog is None:
+            use_watchdog = find_spec("watchdog") is not None
+        self.use_watchdog = use_watchdog
+        self._snapshot = FileHandler.directory_snapshot(directory)
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._observer = None
+
+    def check(self) -> Optional[Dict[str, List[str]]]:
+        """
+        Relève le répertoire et retourne les changements depuis le relevé
+        précédent.
+
+        Returns:
+            Optional[Dict[str, List[str]]]: Changements, ou None si aucun
+        """
+        snapshot = FileHandler.directory_snapshot(self.directory)
+        if snapshot == self._snapshot:
+            return None
+        changes = diff_snapshots(self._snapshot, snapshot)
+        self._snapshot = snapshot
+        return changes
+
+    def _wait_until_stable(self) -> Snapshot:
+        """Attend que le répertoire n'ait plus changé depuis debounce secondes."""
+        snapshot = FileHandler.directory_snapshot(self.directory)
+        while not self._stop.wait(self.debounce):
+            latest = FileHandler.directory_snapshot(self.directory)
+            if latest == snapshot:
+                break
+            snapshot = latest
+        return snapshot
+
+    def _run(self) -> None:
+        """Boucle de surveillance."""
+        while not self._stop.is_set():
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            if self._stop.is_set():
+                break
+            try:
+                if FileHandler.directory_snapshot(self.directory) == self._snapshot:
+                    continue
+                snapshot = self._wait_until_stable()
+                changes = diff_snapshots(self._snapshot, snapshot)
+                self._snapshot = snapshot
+                if any(changes.values()):
+                    self.callback(changes)
+            except Exception as e:
+                logging.error(f"Erreur lors du traitement des modifications: {str(e)}")
+
+    def _start_observer(self) -> None:
+        """Démarre les notifications watchdog, qui réveillent la boucle."""
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        wakeup = self._wakeup
+
+        class WakeupHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                wakeup.set()
+
+        self._observer = Observer()
+        self._observer.schedule(WakeupHandler(), self.directory, recursive=False)
+        self._observer.start()
+
+    def start(self) -> None:
+        """Démarre la surveillance en arrière-plan."""
+        if self.use_watchdog:
+            self._start_observer()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        mode = "watchdog" if self.use_watchdog else "relevés périodiques"
+        logging.info(f"Surveillance de {self.directory} démarrée ({mode})")
+
+    def stop(self) -> None:
+        """Arrête la surveillance."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._wakeup.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+        if self._thread is not None:
+            self._thread.join()
@@ -1,3 +1,16 @@
 from .product import Product
 
-__all__ = ["Product"]
+__all__ = ["Product", "ProductBatch", "ProductView", "ReportResult"]
+
+
+def __getattr__(name):
+    """Importe les lots de produits et le rapport à la demande (NumPy et pandas)."""
+    if name in ("ProductBatch", "ProductView"):
+        from . import product_batch
+
+        return getattr(product_batch, name)
+    if name == "ReportResult":
+        from .report import ReportResult
+
+        return ReportResult
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
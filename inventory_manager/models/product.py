@@ -9,9 +9,14 @@ class ProductValidationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
-    """Classe représentant un produit dans l'inventaire."""
+    """
+    Classe représentant un produit dans l'inventaire.
+
+    Les attributs sont stockés dans des slots (pas de __dict__ par instance).
+    Pour de grands volumes, voir ProductBatch.
+    """
 
     name: str
     quantity: int
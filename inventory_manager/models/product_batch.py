@@ -0,0 +1,194 @@
+import sys
+from typing import Any, Dict, Iterable, Iterator, List
+
+import numpy as np
+import pandas as pd
+
+from .product import Product
+
+
+class ProductView:
+    """
+    Vue légère sur une ligne d'un ProductBatch.
+
+    Lors d'une itération sur un lot, la même vue est réutilisée et déplacée de
+    ligne en ligne : utiliser to_product() pour conserver un produit.
+    """
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "ProductBatch", index: int = 0):
+        self._batch = batch
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        return self._batch.names[self._index]
+
+    @property
+    def quantity(self) -> int:
+        return int(self._batch.quantities[self._index])
+
+    @property
+    def unit_price(self) -> float:
+        return float(self._batch.unit_prices[self._index])
+
+    @property
+    def category(self) -> str:
+        return self._batch.categories[self._batch.category_codes[self._index]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit la ligne en dictionnaire (même format que Product)."""
+        return {
+            "name": self.name,
+            "quantity": self.quantity,
+            "unit_price": self.unit_price,
+            "category": self.category,
+        }
+
+    def to_product(self) -> Product:
+        """Crée un Product indépendant à partir de la ligne."""
+        return Product(self.name, self.quantity, self.unit_price, self.category)
+
+    def __repr__(self) -> str:
+        return f"ProductView({self.to_dict()})"
+
+
+class ProductBatch:
+    """
+    Lot de produits stocké en colonnes.
+
+    Les quantités et les prix sont des tableaux NumPy typés, les catégories
+    sont des codes entiers vers une table de chaînes internées. Les données
+    sont supposées déjà validées (par Product ou validate_products).
+    """
+
+    __slots__ = ("names", "quantities", "unit_prices", "category_codes", "categories")
+
+    def __init__(
+        self,
+        names: np.ndarray,
+        quantities: np.ndarray,
+        unit_prices: np.ndarray,
+        category_codes: np.ndarray,
+        categories: List[str],
+    ):
+        """
+        Initialise le lot.
+
+        Args:
+            names (np.ndarray): Noms des produits
+            quantities (np.ndarray): Quantités (type entier)
+            unit_prices (np.ndarray): Prix unitaires (float64)
+            category_codes (np.ndarray): Index de chaque catégorie dans
+                categories
+            categories (List[str]): Catégories distinctes
+
+        Raises:
+            ValueError: Si les colonnes n'ont pas la même longueur
+        """
+        if not (
+            len(names) == len(quantities) == len(unit_prices) == len(category_codes)
+        ):
+            raise ValueError("Les colonnes du lot doivent avoir la même longueur")
+
+        self.names = names
+        self.quantities = quantities
+        self.unit_prices = unit_prices
+        self.category_codes = category_codes
+        self.categories = [sys.intern(str(category)) for category in categories]
+
+    @classmethod
+    def from_products(cls, products: Iterable[Product]) -> "ProductBatch":
+        """
+        Crée un lot à partir de produits.
+
+        Args:
+            products (Iterable[Product]): Produits validés
+
+        Returns:
+            ProductBatch: Lot de produits
+        """
+        products = list(products)
+        codes, categories = pd.factorize(
+            pd.Series([p.category for p in products], dtype=object)
+        )
+        return cls(
+            names=np.array([p.name for p in products], dtype=object),
+            quantities=np.array([p.quantity for p in products], dtype=np.int64),
+            unit_prices=np.array([p.unit_price for p in products], dtype=np.float64),
+            category_codes=codes.astype(np.int32),
+            categories=list(categories),
+        )
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "ProductBatch":
+        """
+        Crée un lot à partir de l'inventaire.
+
+        Les colonnes numériques et les codes d'une catégorie Categorical sont
+        repris sans copie.
+
+        Args:
+            df (pd.DataFrame): Inventaire (colonnes name, quantity, unit_price,
+                category)
+
+        Returns:
+            ProductBatch: Lot de produits
+        """
+        category = df["category"]
+        if isinstance(category.dtype, pd.CategoricalDtype):
+            codes = category.cat.codes.to_numpy()
+            categories = list(category.cat.categories)
+        else:
+            codes, categories = pd.factorize(category)
+            categories = list(categories)
+        return cls(
+            names=df["name"].to_numpy(dtype=object),
+            quantities=df["quantity"].to_numpy(),
+            unit_prices=df["unit_price"].to_numpy(),
+            category_codes=codes,
+            categories=categories,
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Convertit le lot au format de l'inventaire, sans copier les colonnes
+        numériques.
+
+        Returns:
+            pd.DataFrame: Inventaire avec une catégorie Categorical
+        """
+        return pd.DataFrame(
+            {
+                "name": self.names,
+                "quantity": self.quantities,
+                "unit_price": self.unit_prices,
+                "category": pd.Categorical.from_codes(
+                    self.category_codes, self.categories
+                ),
+            },
+            copy=False,
+        )
+
+    def to_products(self) -> List[Product]:
+        """Convertit le lot en liste de Product."""
+        return [view.to_product() for view in self]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> ProductView:
+        """Retourne une vue sur la ligne demandée."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Index hors du lot")
+        return ProductView(self, index)
+
+    def __iter__(self) -> Iterator[ProductView]:
+        """Parcourt le lot avec une seule vue déplacée de ligne en ligne."""
+        view = ProductView(self)
+        for index in range(len(self)):
+            view._index = index
+            yield view
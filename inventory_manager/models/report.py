@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+
+# Colonnes du rapport au format Métrique/Valeur
+METRIC_COLUMNS = ["Métrique", "Valeur"]
+
+# Libellés des statistiques globales du rapport, dans l'ordre d'affichage
+GLOBAL_METRIC_LABELS = {
+    "count": "Nombre total de produits",
+    "categories": "Nombre de catégories",
+    "stock_value": "Valeur totale du stock",
+    "mean_price": "Prix moyen",
+    "low_stock": "Produits en stock faible (<10)",
+}
+
+# Libellés des métriques par catégorie du rapport, dans l'ordre d'affichage
+CATEGORY_METRIC_LABELS = {
+    "count": "Nombre de produits",
+    "stock_value": "Valeur totale",
+    "mean_price": "Prix moyen",
+    "total_quantity": "Stock total",
+}
+
+
+@dataclass(eq=False)
+class ReportResult:
+    """
+    Statistiques du rapport récapitulatif.
+
+    totals contient les statistiques globales (clés de GLOBAL_METRIC_LABELS) ;
+    categories est indexé par catégorie, dans l'ordre de première apparition,
+    avec une colonne par métrique de CATEGORY_METRIC_LABELS.
+    """
+
+    totals: Dict[str, Any]
+    categories: pd.DataFrame
+
+    def global_stats(self) -> List[Tuple[str, Any]]:
+        """
+        Statistiques globales avec leur libellé.
+
+        Returns:
+            List[Tuple[str, Any]]: Couples (libellé, valeur)
+        """
+        return [
+            (label, self.totals[key]) for key, label in GLOBAL_METRIC_LABELS.items()
+        ]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Met le rapport au format Métrique/Valeur du fichier CSV.
+
+        Les métriques par catégorie sont préfixées par leur catégorie
+        (« Books - Prix moyen »).
+
+        Returns:
+            pd.DataFrame: Statistiques globales puis par catégorie
+        """
+        global_stats = pd.DataFrame(self.global_stats(), columns=METRIC_COLUMNS)
+
+        category_stats = self.categories[list(CATEGORY_METRIC_LABELS)].stack()
+        metric_labels = category_stats.index.get_level_values(1).map(
+            CATEGORY_METRIC_LABELS
+        )
+        category_stats = pd.DataFrame(
+            {
+                "Métrique": category_stats.index.get_level_values(0).astype(str)
+                + " - "
+                + metric_labels,
+                "Valeur": category_stats.to_numpy(),
+            }
+        )
+
+        return pd.concat([global_stats, category_stats], ignore_index=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Sérialise le rapport en types Python natifs (JSON sans perte).
+
+        Returns:
+            Dict[str, Any]: Statistiques globales (« totals ») et colonnes des
+                statistiques par catégorie (« categories »)
+        """
+        categories = {"category": [str(c) for c in self.categories.index]}
+        for column in CATEGORY_METRIC_LABELS:
+            categories[column] = self.categories[column].tolist()
+        return {
+            "totals": {
+                key: value.item() if hasattr(value, "item") else value
+                for key, value in self.totals.items()
+            },
+            "categories": categories,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReportResult":
+        """
+        Reconstruit un rapport sérialisé par to_dict.
+
+        Args:
+            data (Dict[str, Any]): Rapport sérialisé
+
+        Returns:
+            ReportResult: Rapport
+        """
+        categories = pd.DataFrame(data["categories"]).set_index("category")
+        return cls(totals=dict(data["totals"]), categories=categories)
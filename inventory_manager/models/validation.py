@@ -0,0 +1,152 @@
+from itertools import repeat
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+# Motifs de rejet, dans l'ordre des contrôles de Product._validate
+REASON_NAME_TYPE = "Le nom doit être une chaîne de caractères"
+REASON_QUANTITY_TYPE = "La quantité doit être un entier"
+REASON_PRICE_TYPE = "Le prix unitaire doit être un nombre"
+REASON_CATEGORY_TYPE = "La catégorie doit être une chaîne de caractères"
+REASON_NAME_EMPTY = "Le nom ne peut pas être vide"
+REASON_QUANTITY_NEGATIVE = "La quantité ne peut pas être négative"
+REASON_PRICE_NEGATIVE = "Le prix unitaire ne peut pas être négatif"
+REASON_CATEGORY_EMPTY = "La catégorie ne peut pas être vide"
+
+# Borne (exclue) des quantités représentables en int64
+INT64_LIMIT = 2.0**63
+
+
+def _clean_strings(column: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Contrôle et nettoie une colonne texte.
+
+    Le type est contrôlé par le masque des valeurs manquantes pour une
+    colonne StringDtype ; les espaces sont retirés par str.strip appliqué
+    en C (map), bien moins coûteux que des opérations ligne à ligne.
+
+    Args:
+        column (pd.Series): Colonne lue
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Masque des chaînes, valeurs
+            sans espaces autour ("" pour les autres valeurs) et masque des
+            valeurs modifiées par le nettoyage
+    """
+    # Sans copie pour une colonne StringDtype ; le tableau n'est pas modifié
+    values = np.asarray(column.array, dtype=object)
+    if isinstance(column.dtype, pd.StringDtype):
+        is_str = column.notna().to_numpy(dtype=bool)
+    else:
+        is_str = np.fromiter(
+            map(isinstance, values, repeat(str)), dtype=bool, count=len(values)
+        )
+    if not is_str.all():
+        values = np.where(is_str, values, "")
+    stripped = np.empty(len(values), dtype=object)
+    stripped[:] = list(map(str.strip, values))
+    return is_str, stripped, stripped != values
+
+
+def round_prices(prices: np.ndarray) -> np.ndarray:
+    """
+    Arrondit des prix à 2 décimales exactement comme round(prix, 2).
+
+    np.round multiplie par 100 avant d'arrondir, ce qui décale les valeurs
+    proches d'un demi-centime ; celles-ci sont arrondies une à une par
+    Python pour garder le même résultat que Product.
+
+    Args:
+        prices (np.ndarray): Prix à arrondir
+
+    Returns:
+        np.ndarray: Prix arrondis
+    """
+    scaled = prices * 100
+    rounded = np.round(scaled) / 100
+    ambiguous = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    rounded[ambiguous] = [round(float(price), 2) for price in prices[ambiguous]]
+    return rounded
+
+
+def validate_products(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Valide un DataFrame de produits colonne par colonne.
+
+    Applique les règles de Product à toutes les lignes à la fois : nom et
+    catégorie non vides une fois nettoyés des espaces, quantité entière et
+    positive (représentable en int64), prix numérique et positif arrondi à
+    2 décimales.
+
+    Args:
+        df (pd.DataFrame): Produits (colonnes name, quantity, unit_price,
+            category)
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: Lignes valides nettoyées, et lignes
+            rejetées telles que lues avec une colonne « reason » donnant la
+            première règle non respectée
+    """
+    # Contrôles numériques, vectorisés
+    quantity = pd.to_numeric(df["quantity"], errors="coerce").to_numpy(dtype=np.float64)
+    unit_price = pd.to_numeric(df["unit_price"], errors="coerce").to_numpy(
+        dtype=np.float64
+    )
+    with np.errstate(invalid="ignore"):
+        # Une quantité hors de l'intervalle int64 déborderait à la conversion
+        quantity_valid = (
+            np.isfinite(quantity)
+            & (np.mod(quantity, 1) == 0)
+            & (quantity >= -INT64_LIMIT)
+            & (quantity < INT64_LIMIT)
+        )
+    price_valid = ~np.isnan(unit_price)
+
+    name_is_str, name, name_changed = _clean_strings(df["name"])
+    category_is_str, category, category_changed = _clean_strings(df["category"])
+
+    checks = [
+        ~name_is_str,
+        ~quantity_valid,
+        ~price_valid,
+        ~category_is_str,
+        name == "",
+        quantity < 0,
+        unit_price < 0,
+        category == "",
+    ]
+    invalid = np.logical_or.reduce(checks)
+    valid = ~invalid
+
+    # Copie superficielle : les colonnes remplacées ne touchent pas df
+    clean = df[valid] if invalid.any() else df.copy(deep=False)
+    # Seules les colonnes texte modifiées par le nettoyage sont réécrites
+    for column, values, changed in (
+        ("name", name, name_changed),
+        ("category", category, category_changed),
+    ):
+        if changed[valid].any():
+            clean[column] = pd.Series(values[valid], index=clean.index).astype(
+                df[column].dtype
+            )
+    clean["quantity"] = quantity[valid].astype(np.int64)
+    clean["unit_price"] = round_prices(unit_price[valid])
+
+    # Motif de rejet (première règle non respectée) des seules lignes rejetées
+    reasons = np.select(
+        [check[invalid] for check in checks],
+        [
+            REASON_NAME_TYPE,
+            REASON_QUANTITY_TYPE,
+            REASON_PRICE_TYPE,
+            REASON_CATEGORY_TYPE,
+            REASON_NAME_EMPTY,
+            REASON_QUANTITY_NEGATIVE,
+            REASON_PRICE_NEGATIVE,
+            REASON_CATEGORY_EMPTY,
+        ],
+        default="",
+    )
+    rejected = df[invalid].assign(reason=reasons)
+    return clean, rejected
@@ -1,3 +1,14 @@
-from .file_handler import FileHandler
+__all__ = ["FileHandler", "InventoryCache"]
 
-__all__ = ["FileHandler"]
+
+def __getattr__(name):
+    """Importe les utilitaires à la demande (pandas est coûteux)."""
+    if name == "FileHandler":
+        from .file_handler import FileHandler
+
+        return FileHandler
+    if name == "InventoryCache":
+        from .cache import InventoryCache
+
+        return InventoryCache
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
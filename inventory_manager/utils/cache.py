@@ -0,0 +1,315 @@
+import hashlib
+import json
+import logging
+import os
+import stat
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .file_handler import FileHandler
+
+# Version du format du cache : un cache d'une autre version est ignoré
+CACHE_FORMAT_VERSION = 2
+
+
+def default_cache_directory(data_directory: str) -> Path:
+    """
+    Répertoire de cache par défaut d'un répertoire de données.
+
+    Le cache est placé hors du répertoire de données, dans le cache de
+    l'utilisateur (INVENTORY_CACHE_DIR, sinon XDG_CACHE_HOME, sinon
+    ~/.cache), sous un nom dérivé du chemin des données : quiconque peut
+    écrire dans le répertoire de données ne peut pas y déposer de cache.
+
+    Args:
+        data_directory (str): Répertoire des fichiers CSV
+
+    Returns:
+        Path: Répertoire du cache
+    """
+    root = os.environ.get("INVENTORY_CACHE_DIR")
+    if not root:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        root = Path(xdg_cache) / "inventory_manager"
+    key = hashlib.blake2b(
+        str(Path(data_directory).resolve()).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    return Path(root) / f"{Path(data_directory).resolve().name}-{key}"
+
+
+def is_private_file(path: Path) -> bool:
+    """
+    Indique si un fichier appartient à l'utilisateur courant et n'est
+    modifiable par personne d'autre (toujours vrai hors POSIX).
+
+    Args:
+        path (Path): Fichier à vérifier
+
+    Returns:
+        bool: True si le fichier est privé
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    info = path.stat()
+    return info.st_uid == os.getuid() and not info.st_mode & (
+        stat.S_IWGRP | stat.S_IWOTH
+    )
+
+
+class InventoryCache:
+    """
+    Cache disque de l'inventaire consolidé et des fragments par fichier.
+
+    Le manifeste peut ne référencer aucun inventaire consolidé (voir
+    save_manifest) : l'inventaire est alors reconstruit à partir des
+    fragments au prochain chargement, puis réenregistré.
+    """
+
+    MANIFEST_FILE = "manifest.json"
+    FRAGMENTS_DIR = "fragments"
+
+    def __init__(self, cache_directory: str, options: Optional[Dict[str, Any]] = None):
+        """
+        Initialise le cache.
+
+        Args:
+            cache_directory (str): Répertoire où stocker le cache
+            options (Dict[str, Any], optional): Options de chargement dont
+                dépend l'inventaire consolidé (ex. pyarrow_strings) ; un cache
+                écrit avec d'autres options est ignoré
+        """
+        self.cache_directory = Path(cache_directory)
+        self.options = dict(options or {})
+        # Parquet si un moteur est disponible, pickle sinon
+        self.format = (
+            "parquet" if find_spec("pyarrow") or find_spec("fastparquet") else "pickle"
+        )
+
+    @property
+    def manifest_path(self) -> Path:
+        """Chemin du manifeste du cache."""
+        return self.cache_directory / self.MANIFEST_FILE
+
+    @property
+    def fragments_directory(self) -> Path:
+        """Répertoire des fragments (un par fichier source)."""
+        return self.cache_directory / self.FRAGMENTS_DIR
+
+    def _fragment_path(self, source: str, signature: Dict[str, Any]) -> Path:
+        """
+        Chemin du fragment d'un fichier source.
+
+        Le nom dérive du chemin et de la signature du fichier : un fichier
+        modifié produit un nouveau fragment, sans registre à maintenir.
+        """
+        key = hashlib.blake2b(
+            json.dumps(
+                [CACHE_FORMAT_VERSION, source, signature], sort_keys=True
+            ).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        return self.fragments_directory / f"{key}.{self.format}"
+
+    def _read_frame(self, path: Path) -> pd.DataFrame:
+        """
+        Lit un DataFrame au format du cache.
+
+        Charger un pickle peut exécuter du code : un pickle qui n'est pas un
+        fichier privé de l'utilisateur (voir is_private_file) est refusé.
+
+        Raises:
+            ValueError: Si le pickle n'est pas un fichier privé
+        """
+        if path.suffix == ".parquet":
+            return pd.read_parquet(path)
+        if not is_private_file(path):
+            raise ValueError(f"Fichier de cache non sûr ignoré : {path}")
+        return pd.read_pickle(path)
+
+    def _write_frame(self, df: pd.DataFrame, path: Path) -> None:
+        """Écrit un DataFrame au format du cache via un renommage atomique."""
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        if self.format == "parquet":
+            df.to_parquet(tmp_path)
+        else:
+            df.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def build_manifest(csv_files: List[Path]) -> Dict[str, Dict[str, Any]]:
+        """
+        Construit le manifeste des fichiers sources.
+
+        Args:
+            csv_files (List[Path]): Fichiers CSV sources
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Signature de chaque fichier, par chemin
+        """
+        return {
+            str(path.resolve()): FileHandler.file_signature(path) for path in csv_files
+        }
+
+    def load(self, manifest: Dict[str, Dict[str, Any]]) -> Optional[pd.DataFrame]:
+        """
+        Charge l'inventaire depuis le cache s'il correspond aux fichiers sources.
+
+        Le cache doit aussi avoir été écrit dans la version courante du format
+        (CACHE_FORMAT_VERSION) et avec les mêmes options de chargement.
+
+        Args:
+            manifest (Dict[str, Dict[str, Any]]): Manifeste des fichiers actuels
+
+        Returns:
+            Optional[pd.DataFrame]: Inventaire en cache ou None si absent/périmé
+        """
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                cached_manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            cached_manifest.get("version") != CACHE_FORMAT_VERSION
+            or cached_manifest.get("options") != self.options
+            or cached_manifest.get("files") != manifest
+        ):
+            logging.info("Cache de l'inventaire périmé")
+            return None
+        if not cached_manifest.get("data"):
+            logging.info("Inventaire consolidé absent du cache")
+            return None
+
+        data_path = self.cache_directory / Path(cached_manifest["data"]).name
+        try:
+            df = self._read_frame(data_path)
+        except Exception as e:
+            logging.warning(f"Lecture du cache impossible: {str(e)}")
+            return None
+
+        logging.info(f"Inventaire chargé depuis le cache {data_path}")
+        return df
+
+    def save(self, df: pd.DataFrame, manifest: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Enregistre l'inventaire consolidé dans le cache.
+
+        Les écritures passent par un fichier temporaire renommé ensuite, pour
+        qu'un lecteur concurrent ne voie jamais un cache partiel.
+
+        Args:
+            df (pd.DataFrame): Inventaire consolidé
+            manifest (Dict[str, Dict[str, Any]]): Manifeste des fichiers lus
+
+        Returns:
+            bool: True si succès, False sinon
+        """
+        data_file = f"inventory.{self.format}"
+        try:
+            self._write_frame(df, self.cache_directory / data_file)
+            self._write_manifest(manifest, data_file)
+            return True
+        except Exception as e:
+            logging.error(f"Erreur lors de l'écriture du cache: {str(e)}")
+            return False
+
+    def save_manifest(self, manifest: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Enregistre le manifeste seul, sans inventaire consolidé.
+
+        Utilisé après une consolidation incrémentale dont les fragments
+        modifiés sont déjà enregistrés : réécrire l'inventaire consolidé
+        coûterait une écriture de toutes les lignes à chaque mise à jour.
+
+        Args:
+            manifest (Dict[str, Dict[str, Any]]): Manifeste des fichiers lus
+
+        Returns:
+            bool: True si succès, False sinon
+        """
+        try:
+            self._write_manifest(manifest, None)
+            (self.cache_directory / f"inventory.{self.format}").unlink(missing_ok=True)
+            return True
+        except Exception as e:
+            logging.error(f"Erreur lors de l'écriture du cache: {str(e)}")
+            return False
+
+    def _write_manifest(
+        self, manifest: Dict[str, Dict[str, Any]], data_file: Optional[str]
+    ) -> None:
+        """Écrit le manifeste via un renommage atomique, puis élague les fragments."""
+        self.cache_directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_manifest = self.manifest_path.with_name(self.MANIFEST_FILE + ".tmp")
+        with open(tmp_manifest, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": CACHE_FORMAT_VERSION,
+                    "format": self.format,
+                    "options": self.options,
+                    "data": data_file,
+                    "files": manifest,
+                },
+                f,
+            )
+        os.replace(tmp_manifest, self.manifest_path)
+        self._prune_fragments(manifest)
+
+    def load_fragment(
+        self, source: str, signature: Dict[str, Any]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Charge le fragment d'un fichier source s'il est à jour.
+
+        Args:
+            source (str): Chemin du fichier source
+            signature (Dict[str, Any]): Signature actuelle du fichier
+
+        Returns:
+            Optional[pd.DataFrame]: Données du fichier ou None si absent
+        """
+        path = self._fragment_path(source, signature)
+        if not path.exists():
+            return None
+        try:
+            return self._read_frame(path)
+        except Exception as e:
+            logging.warning(f"Lecture du fragment {path} impossible: {str(e)}")
+            return None
+
+    def save_fragment(
+        self, source: str, signature: Dict[str, Any], df: pd.DataFrame
+    ) -> bool:
+        """
+        Enregistre les données lues d'un fichier source.
+
+        Args:
+            source (str): Chemin du fichier source
+            signature (Dict[str, Any]): Signature du fichier lu
+            df (pd.DataFrame): Données du fichier
+
+        Returns:
+            bool: True si succès, False sinon
+        """
+        try:
+            self._write_frame(df, self._fragment_path(source, signature))
+            return True
+        except Exception as e:
+            logging.error(f"Erreur lors de l'écriture du fragment: {str(e)}")
+            return False
+
+    def _prune_fragments(self, manifest: Dict[str, Dict[str, Any]]) -> None:
+        """Supprime les fragments des fichiers modifiés ou supprimés."""
+        if not self.fragments_directory.exists():
+            return
+        current = {
+            self._fragment_path(source, signature).name
+            for source, signature in manifest.items()
+        }
+        for path in self.fragments_directory.iterdir():
+            if path.name not in current:
+                path.unlink(missing_ok=True)
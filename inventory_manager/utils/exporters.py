@@ -0,0 +1,87 @@
+import sys
+from contextlib import nullcontext
+from importlib.util import find_spec
+from typing import Iterator, Optional, TextIO
+
+import pandas as pd
+
+# Formats d'export des résultats de list et search
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+
+# Nombre de lignes converties et écrites à la fois
+EXPORT_CHUNK_SIZE = 50_000
+
+
+def iter_chunks(df: pd.DataFrame, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Découpe un DataFrame en blocs consécutifs de chunksize lignes."""
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start : start + chunksize]
+
+
+def write_csv(df: pd.DataFrame, output: TextIO, chunksize: int) -> None:
+    """Écrit un DataFrame en CSV, en-tête compris, bloc par bloc."""
+    if df.empty:
+        df.to_csv(output, index=False, lineterminator="\n")
+    for i, chunk in enumerate(iter_chunks(df, chunksize)):
+        chunk.to_csv(output, header=i == 0, index=False, lineterminator="\n")
+
+
+def write_jsonl(df: pd.DataFrame, output: TextIO, chunksize: int) -> None:
+    """Écrit un DataFrame en JSON Lines (un objet par ligne), bloc par bloc."""
+    for chunk in iter_chunks(df, chunksize):
+        output.write(chunk.to_json(orient="records", lines=True, force_ascii=False))
+
+
+def write_parquet(df: pd.DataFrame, output_file: str, chunksize: int) -> None:
+    """Écrit un DataFrame en Parquet, un groupe de lignes par bloc."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+    with pq.ParquetWriter(output_file, schema) as writer:
+        for chunk in iter_chunks(df, chunksize):
+            writer.write_table(
+                pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            )
+
+
+def export_frame(
+    df: pd.DataFrame,
+    output_format: str,
+    output_file: Optional[str] = None,
+    chunksize: int = EXPORT_CHUNK_SIZE,
+) -> None:
+    """
+    Exporte des résultats dans un format lisible par d'autres outils.
+
+    Les lignes sont converties et écrites par blocs : la sortie commence
+    aussitôt et aucune copie complète des résultats n'est construite.
+
+    Args:
+        df (pd.DataFrame): Résultats à exporter
+        output_format (str): csv, jsonl ou parquet
+        output_file (Optional[str]): Fichier de sortie (sortie standard si
+            None, sauf pour parquet)
+        chunksize (int): Nombre de lignes par bloc
+
+    Raises:
+        ValueError: Si le format est inconnu ou inutilisable
+    """
+    if output_format not in EXPORT_FORMATS:
+        raise ValueError(f"Format d'export inconnu : {output_format}")
+
+    if output_format == "parquet":
+        if output_file is None:
+            raise ValueError("Le format parquet nécessite un fichier de sortie")
+        if not find_spec("pyarrow"):
+            raise ValueError("Le format parquet nécessite le paquet pyarrow")
+        write_parquet(df, output_file, chunksize)
+        return
+
+    writer = write_csv if output_format == "csv" else write_jsonl
+    if output_file is None:
+        output = nullcontext(sys.stdout)
+    else:
+        output = open(output_file, "w", encoding="utf-8", newline="")
+    with output as f:
+        writer(df, f, chunksize)
@@ -1,47 +1,178 @@
+import hashlib
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import logging
+from ..models.validation import validate_products
+from .profiling import timed
+
+REQUIRED_COLUMNS = {"name", "quantity", "unit_price", "category"}
+
+# Types explicites des colonnes texte à la lecture ; les colonnes numériques
+# sont typées puis réduites par optimize_dtypes
+CSV_DTYPES = {"name": str, "category": str}
 
 
 class FileHandler:
     """Gestionnaire de fichiers pour l'inventaire."""
 
     @staticmethod
-    def read_csv_files(directory: str) -> Optional[pd.DataFrame]:
+    def list_csv_files(directory: str) -> List[Path]:
         """
-        Lit tous les fichiers CSV d'un répertoire.
+        Liste les fichiers CSV d'un répertoire dans un ordre déterministe.
 
         Args:
             directory (str): Chemin vers le répertoire contenant les fichiers CSV
 
         Returns:
-            Optional[pd.DataFrame]: DataFrame consolidé ou None si erreur
+            List[Path]: Chemins des fichiers CSV triés par nom
+        """
+        return sorted(Path(directory).glob("*.csv"))
+
+    @staticmethod
+    def directory_snapshot(directory: str) -> Dict[str, Tuple[int, int]]:
+        """
+        Relève la date de modification et la taille des fichiers CSV.
+
+        Moins précis que file_signature mais sans lecture du contenu, il
+        permet de détecter rapidement un changement dans le répertoire.
+
+        Args:
+            directory (str): Chemin vers le répertoire contenant les fichiers CSV
+
+        Returns:
+            Dict[str, Tuple[int, int]]: (mtime en ns, taille) par chemin
+        """
+        snapshot = {}
+        for path in FileHandler.list_csv_files(directory):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[str(path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    @staticmethod
+    def file_signature(file_path: Path) -> Dict[str, Any]:
+        """
+        Calcule la signature d'un fichier (date de modification, taille, contenu).
+
+        Args:
+            file_path (Path): Chemin du fichier
+
+        Returns:
+            Dict[str, Any]: Signature du fichier
+        """
+        stat = file_path.stat()
+        digest = hashlib.blake2b()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": digest.hexdigest(),
+        }
+
+    @staticmethod
+    def read_csv_file(file_path: Path) -> Optional[pd.DataFrame]:
         """
-        data_dir = Path(directory)
-        all_data = []
+        Lit un fichier CSV d'inventaire.
+
+        Args:
+            file_path (Path): Chemin du fichier CSV
 
+        Returns:
+            Optional[pd.DataFrame]: Données du fichier ou None si invalide
+        """
         try:
-            csv_files = list(data_dir.glob("*.csv"))
-            if not csv_files:
-                raise FileNotFoundError(f"Aucun fichier CSV trouvé dans {directory}")
+            with timed("read_csv", Path(file_path).name):
+                df = pd.read_csv(file_path, dtype=CSV_DTYPES)
+
+            if not REQUIRED_COLUMNS.issubset(df.columns):
+                logging.warning(f"Colonnes manquantes dans {file_path}")
+                return None
+
+            df = FileHandler.validate(df, file_path)
+            logging.info(f"Fichier {file_path} traité avec succès")
+            return df
+
+        except Exception as e:
+            logging.error(f"Erreur lors du traitement de {file_path}: {str(e)}")
+            return None
+
+    @staticmethod
+    def validate(df: pd.DataFrame, file_path: Path) -> pd.DataFrame:
+        """
+        Valide les lignes lues et journalise les lignes rejetées.
+
+        Args:
+            df (pd.DataFrame): Lignes lues
+            file_path (Path): Fichier d'origine (pour le journal)
+
+        Returns:
+            pd.DataFrame: Lignes valides
+        """
+        clean, rejected = validate_products(df)
+        if not rejected.empty:
+            reasons = rejected["reason"].value_counts()
+            details = ", ".join(f"{reason} ({n})" for reason, n in reasons.items())
+            logging.warning(
+                f"{len(rejected)} ligne(s) rejetée(s) dans {file_path}: {details}"
+            )
+        return clean
+
+    @staticmethod
+    def read_csv_paths(
+        csv_files: List[Path], jobs: int = 1
+    ) -> List[Optional[pd.DataFrame]]:
+        """
+        Lit une liste de fichiers CSV, éventuellement en parallèle.
+
+        Args:
+            csv_files (List[Path]): Fichiers à lire
+            jobs (int): Nombre de fichiers lus en parallèle (1 = séquentiel)
+
+        Returns:
+            List[Optional[pd.DataFrame]]: Données de chaque fichier (None si
+                invalide), dans l'ordre de csv_files
+        """
+        if jobs > 1 and len(csv_files) > 1:
+            # map() conserve l'ordre des fichiers quel que soit l'ordre
+            # de fin des lectures
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                return list(executor.map(FileHandler.read_csv_file, csv_files))
+        return [FileHandler.read_csv_file(path) for path in csv_files]
 
-            for file_path in csv_files:
-                try:
-                    df = pd.read_csv(file_path)
-                    required_columns = {"name", "quantity", "unit_price", "category"}
+    @staticmethod
+    def read_csv_files(directory: str, jobs: int = 1) -> Optional[pd.DataFrame]:
+        """
+        Lit tous les fichiers CSV d'un répertoire.
 
-                    if not required_columns.issubset(df.columns):
-                        logging.warning(f"Colonnes manquantes dans {file_path}")
-                        continue
+        Conservée pour compatibilité : le gestionnaire n'y fait plus appel et
+        lit les fichiers avec read_csv_paths (voir
+        InventoryManager.consolidate_files, qui gère aussi le cache).
 
-                    all_data.append(df)
-                    logging.info(f"Fichier {file_path} traité avec succès")
+        Les fichiers sont toujours concaténés dans l'ordre trié de leurs noms,
+        que la lecture soit séquentielle ou parallèle, afin que la
+        déduplication « dernier fichier gagnant » reste déterministe.
 
-                except Exception as e:
-                    logging.error(f"Erreur lors du traitement de {file_path}: {str(e)}")
-                    continue
+        Args:
+            directory (str): Chemin vers le répertoire contenant les fichiers CSV
+            jobs (int): Nombre de fichiers lus en parallèle (1 = séquentiel)
 
+        Returns:
+            Optional[pd.DataFrame]: DataFrame consolidé ou None si erreur
+        """
+        try:
+            csv_files = FileHandler.list_csv_files(directory)
+            if not csv_files:
+                raise FileNotFoundError(f"Aucun fichier CSV trouvé dans {directory}")
+
+            frames = FileHandler.read_csv_paths(csv_files, jobs=jobs)
+            all_data = [df for df in frames if df is not None]
             if all_data:
                 return pd.concat(all_data, ignore_index=True)
             return None
@@ -50,11 +181,89 @@ class FileHandler:
             logging.error(f"Erreur lors de la lecture des fichiers: {str(e)}")
             return None
 
+    @staticmethod
+    def iter_csv_chunks(directory: str, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Parcourt les fichiers CSV d'un répertoire par blocs de lignes.
+
+        Les fichiers sont lus dans le même ordre que read_csv_files et ceux
+        auxquels il manque des colonnes sont ignorés.
+
+        Args:
+            directory (str): Chemin vers le répertoire contenant les fichiers CSV
+            chunksize (int): Nombre de lignes par bloc
+
+        Yields:
+            pd.DataFrame: Bloc de lignes d'un fichier
+        """
+        for file_path in FileHandler.list_csv_files(directory):
+            try:
+                with pd.read_csv(
+                    file_path, dtype=CSV_DTYPES, chunksize=chunksize
+                ) as reader:
+                    for chunk in reader:
+                        if not REQUIRED_COLUMNS.issubset(chunk.columns):
+                            logging.warning(f"Colonnes manquantes dans {file_path}")
+                            break
+                        yield FileHandler.validate(chunk, file_path)
+                    else:
+                        logging.info(f"Fichier {file_path} traité avec succès")
+            except Exception as e:
+                logging.error(f"Erreur lors du traitement de {file_path}: {str(e)}")
+
+    @staticmethod
+    def optimize_dtypes(
+        df: pd.DataFrame, pyarrow_strings: bool = False
+    ) -> pd.DataFrame:
+        """
+        Convertit l'inventaire vers des types compacts.
+
+        La catégorie devient une colonne Categorical et la quantité est réduite
+        au plus petit type entier suffisant. Le prix unitaire reste en float64 :
+        un float32 ne représente pas exactement les prix arrondis au centime et
+        fausserait les totaux du rapport.
+
+        Args:
+            df (pd.DataFrame): Inventaire à convertir
+            pyarrow_strings (bool): Stocker les noms en chaînes pyarrow si le
+                module est disponible
+
+        Returns:
+            pd.DataFrame: Inventaire aux types compacts
+        """
+        df = df.copy()
+        df["category"] = df["category"].astype("category")
+        if pd.api.types.is_integer_dtype(df["quantity"]):
+            df["quantity"] = pd.to_numeric(df["quantity"], downcast="integer")
+
+        if pyarrow_strings:
+            if find_spec("pyarrow"):
+                df["name"] = df["name"].astype("string[pyarrow]")
+            else:
+                logging.warning("pyarrow indisponible, noms conservés en str")
+        return df
+
+    @staticmethod
+    def memory_usage(df: pd.DataFrame) -> pd.Series:
+        """
+        Calcule l'empreinte mémoire de chaque colonne, index compris.
+
+        Args:
+            df (pd.DataFrame): Données à mesurer
+
+        Returns:
+            pd.Series: Octets occupés par colonne
+        """
+        return df.memory_usage(deep=True)
+
     @staticmethod
     def save_report(data: pd.DataFrame, output_file: str) -> bool:
         """
         Sauvegarde un rapport au format CSV.
 
+        Conservée pour compatibilité : les rapports sont écrits par
+        utils.report_sinks.save_report (écriture atomique, plusieurs formats).
+
         Args:
             data (pd.DataFrame): Données à sauvegarder
             output_file (str): Chemin du fichier de sortie
@@ -0,0 +1,59 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+DEFAULT_LOG_FILE = "inventory.log"
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(log_file: str = DEFAULT_LOG_FILE) -> Optional[QueueListener]:
+    """
+    Configure le système de logging.
+
+    Les messages sont déposés dans une file par un QueueHandler ; un thread
+    QueueListener les formate et les écrit dans le fichier de log et sur la
+    console. Les écritures disque ne ralentissent donc pas l'appelant. La
+    file est vidée à la fin du programme.
+
+    Comme logging.basicConfig, ne fait rien si le logger racine a déjà des
+    handlers.
+
+    Args:
+        log_file (str): Fichier de log (inventory.log par défaut)
+
+    Returns:
+        Optional[QueueListener]: Thread d'écriture démarré, ou None si le
+            logging était déjà configuré
+    """
+    global _listener
+
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.FileHandler(log_file, delay=True), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(flush_logging)
+    return _listener
+
+
+def flush_logging() -> None:
+    """Écrit les messages en attente et arrête le thread d'écriture."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
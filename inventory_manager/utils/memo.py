@@ -0,0 +1,89 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+# Nombre de résultats conservés par défaut
+DEFAULT_MEMO_SIZE = 128
+
+
+class ResultCache:
+    """
+    Cache LRU borné de résultats calculés.
+
+    Les clés incluent la version des données sur laquelle porte le résultat :
+    après un changement de version, les anciens résultats ne sont plus
+    demandés et sortent du cache au fil des nouveaux calculs. Le cache peut
+    être utilisé depuis plusieurs threads ; deux calculs simultanés d'une même
+    clé donnent le même résultat, le second remplace le premier.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MEMO_SIZE):
+        """
+        Initialise le cache.
+
+        Args:
+            maxsize (int): Nombre maximal de résultats conservés (0 : aucun)
+
+        Raises:
+            ValueError: Si la taille est négative
+        """
+        if maxsize < 0:
+            raise ValueError("La taille du cache doit être un entier positif")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Nombre de résultats conservés."""
+        return len(self._entries)
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Retourne le résultat d'une clé, calculé par compute s'il est absent.
+
+        Args:
+            key (Hashable): Clé du résultat
+            compute (Callable[[], Any]): Calcul du résultat ; une exception
+                est propagée et rien n'est conservé
+
+        Returns:
+            Any: Résultat conservé ou calculé
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            if self.maxsize:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Oublie tous les résultats (les compteurs sont conservés)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Compteurs du cache.
+
+        Returns:
+            Dict[str, int]: hits, misses, size et maxsize
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
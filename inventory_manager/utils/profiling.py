@@ -0,0 +1,201 @@
+import cProfile
+import functools
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterator, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Profileur actif, None tant que le profilage n'est pas activé
+_profiler: Optional["Profiler"] = None
+
+# Contexte vide renvoyé par timed quand le profilage est désactivé
+_NO_TIMING = nullcontext()
+
+
+class Profiler:
+    """
+    Mesures d'une exécution : durée de chaque étape, pic mémoire et, en
+    option, statistiques cProfile.
+
+    Les durées sont cumulées par étape (nombre d'appels, durée totale et
+    maximale) ; un détail facultatif (un nom de fichier, par exemple) garde
+    aussi la durée de chaque élément. Une étape appelée à l'intérieur
+    d'elle-même dans le même thread n'est comptée qu'une fois.
+    """
+
+    def __init__(self, memory: bool = True, cprofile: bool = False):
+        """
+        Initialise le profileur (voir start).
+
+        Args:
+            memory (bool): Mesurer le pic mémoire avec tracemalloc
+            cprofile (bool): Collecter les statistiques cProfile
+        """
+        self.memory = memory
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.peak_memory: Optional[int] = None
+        self.total_seconds = 0.0
+        self._cprofile = cProfile.Profile() if cprofile else None
+        self._lock = threading.Lock()
+        self._active = threading.local()
+        self._start = 0.0
+
+    def start(self) -> None:
+        """Démarre les mesures globales."""
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if self._cprofile is not None:
+            self._cprofile.enable()
+        self._start = time.perf_counter()
+
+    def stop(self) -> None:
+        """Arrête les mesures globales."""
+        self.total_seconds = time.perf_counter() - self._start
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        if self.memory and tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name: str, detail: Optional[str] = None) -> Iterator[None]:
+        """
+        Chronomètre une étape.
+
+        Args:
+            name (str): Nom de l'étape
+            detail (str, optional): Élément traité par cet appel
+        """
+        active = getattr(self._active, "stages", None)
+        if active is None:
+            active = self._active.stages = set()
+        if name in active:
+            yield
+            return
+
+        active.add(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            active.discard(name)
+            with self._lock:
+                stats = self.stages.setdefault(
+                    name, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0}
+                )
+                stats["calls"] += 1
+                stats["seconds"] += seconds
+                stats["max_seconds"] = max(stats["max_seconds"], seconds)
+                if detail is not None:
+                    details = stats.setdefault("details", {})
+                    details[detail] = details.get(detail, 0.0) + seconds
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Mesures sérialisables en JSON.
+
+        Returns:
+            Dict[str, Any]: Durée totale, pic mémoire (octets, None si non
+                mesuré) et étapes par ordre de première exécution
+        """
+        with self._lock:
+            stages = [{"stage": name, **stats} for name, stats in self.stages.items()]
+        return {
+            "total_seconds": self.total_seconds,
+            "peak_memory_bytes": self.peak_memory,
+            "stages": stages,
+        }
+
+    def save_json(self, path: str) -> None:
+        """Enregistre les mesures en JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.metrics(), f, indent=2, ensure_ascii=False)
+
+    def dump_stats(self, path: str) -> None:
+        """
+        Enregistre les statistiques cProfile (lisibles avec pstats).
+
+        Raises:
+            ValueError: Si cProfile n'a pas été activé
+        """
+        if self._cprofile is None:
+            raise ValueError("Statistiques cProfile non collectées")
+        self._cprofile.dump_stats(path)
+
+
+def enable_profiling(memory: bool = True, cprofile: bool = False) -> Profiler:
+    """
+    Active le profilage : timed et profiled mesurent désormais leurs étapes.
+
+    Args:
+        memory (bool): Mesurer le pic mémoire avec tracemalloc
+        cprofile (bool): Collecter les statistiques cProfile
+
+    Returns:
+        Profiler: Profileur démarré
+    """
+    global _profiler
+    _profiler = Profiler(memory=memory, cprofile=cprofile)
+    _profiler.start()
+    return _profiler
+
+
+def disable_profiling() -> Optional[Profiler]:
+    """
+    Désactive le profilage.
+
+    Returns:
+        Optional[Profiler]: Profileur arrêté, ou None s'il n'était pas actif
+    """
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Profileur actif, ou None si le profilage est désactivé."""
+    return _profiler
+
+
+def timed(name: str, detail: Optional[str] = None) -> ContextManager[None]:
+    """
+    Chronomètre un bloc si le profilage est activé.
+
+    Désactivé, renvoie un contexte vide partagé : rien n'est mesuré ni alloué.
+
+    Args:
+        name (str): Nom de l'étape
+        detail (str, optional): Élément traité (fichier, par exemple)
+    """
+    if _profiler is None:
+        return _NO_TIMING
+    return _profiler.stage(name, detail)
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """
+    Décorateur chronométrant chaque appel de la fonction si le profilage est
+    activé ; désactivé, la fonction est appelée directement.
+
+    Args:
+        name (str): Nom de l'étape
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return func(*args, **kwargs)
+            with _profiler.stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,378 @@
+import json
+import logging
+import math
+import os
+import uuid
+import zipfile
+from contextlib import contextmanager
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, TextIO
+from xml.sax.saxutils import escape
+
+import pandas as pd
+
+from ..models.report import (
+    CATEGORY_METRIC_LABELS,
+    GLOBAL_METRIC_LABELS,
+    ReportResult,
+)
+from .exporters import iter_chunks
+
+# Formats de rapport et extension de fichier associée
+REPORT_FORMATS = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "json": ".json",
+    "xlsx": ".xlsx",
+    "markdown": ".md",
+}
+
+# Nombre de catégories converties et écrites à la fois
+REPORT_CHUNK_SIZE = 10_000
+
+# Clé des métadonnées Parquet contenant les statistiques globales (JSON)
+PARQUET_TOTALS_KEY = b"inventory_report_totals"
+
+
+def report_format(output_file: str, output_format: Optional[str] = None) -> str:
+    """
+    Détermine le format d'un rapport, à défaut d'après l'extension du fichier.
+
+    Args:
+        output_file (str): Fichier de sortie
+        output_format (str, optional): Format demandé (voir REPORT_FORMATS)
+
+    Returns:
+        str: Format du rapport
+
+    Raises:
+        ValueError: Si le format est inconnu
+    """
+    if output_format is None:
+        suffix = Path(output_file).suffix.lower()
+        formats = {extension: name for name, extension in REPORT_FORMATS.items()}
+        output_format = formats.get(suffix, "csv")
+    if output_format not in REPORT_FORMATS:
+        raise ValueError(f"Format de rapport inconnu : {output_format}")
+    return output_format
+
+
+@contextmanager
+def atomic_path(path: str) -> Iterator[str]:
+    """
+    Fournit un fichier temporaire renommé en path une fois écrit.
+
+    Le fichier temporaire, au nom unique, est placé dans le même répertoire :
+    le renommage est atomique et un lecteur voit l'ancien rapport ou le
+    nouveau, jamais un rapport partiel. En cas d'erreur, le fichier temporaire
+    est supprimé.
+
+    Args:
+        path (str): Fichier final
+
+    Yields:
+        str: Fichier temporaire à écrire
+    """
+    target = Path(path)
+    tmp_path = str(target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp"))
+    try:
+        yield tmp_path
+        os.replace(tmp_path, target)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def category_table(result: ReportResult) -> pd.DataFrame:
+    """
+    Statistiques par catégorie au format large : une ligne par catégorie, une
+    colonne typée par métrique.
+
+    Args:
+        result (ReportResult): Rapport
+
+    Returns:
+        pd.DataFrame: Colonnes category puis celles de CATEGORY_METRIC_LABELS
+    """
+    table = result.categories[list(CATEGORY_METRIC_LABELS)].astype(
+        {
+            "count": "int64",
+            "stock_value": "float64",
+            "mean_price": "float64",
+            "total_quantity": "int64",
+        }
+    )
+    table.insert(0, "category", table.index.astype(str))
+    return table.reset_index(drop=True)
+
+
+def _finite_or_none(values: list) -> list:
+    """
+    Remplace les flottants non finis (NaN, ±inf) d'une liste par None : ni
+    JSON ni une cellule numérique XLSX ne peuvent les représenter.
+    """
+    return [
+        None if isinstance(value, float) and not math.isfinite(value) else value
+        for value in values
+    ]
+
+
+def native_totals(result: ReportResult) -> dict:
+    """
+    Statistiques globales en types Python (sérialisables en JSON), une
+    valeur manquante (prix moyen d'un inventaire vide) ou non finie valant
+    None.
+    """
+    totals = result.to_dict()["totals"]
+    return dict(zip(totals, _finite_or_none(list(totals.values()))))
+
+
+def iter_records(table: pd.DataFrame, chunksize: int) -> Iterator[list]:
+    """
+    Lignes d'un tableau en types Python natifs, bloc par bloc ; les valeurs
+    manquantes ou non finies valent None.
+    """
+    for chunk in iter_chunks(table, chunksize):
+        columns = [_finite_or_none(chunk[column].tolist()) for column in chunk.columns]
+        yield list(zip(*columns))
+
+
+def write_csv_report(result: ReportResult, path: str, chunksize: int) -> None:
+    """
+    Écrit le rapport au format CSV Métrique/Valeur historique : statistiques
+    globales, puis celles des catégories, bloc par bloc.
+    """
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        ReportResult(result.totals, result.categories.iloc[:0]).to_frame().to_csv(
+            f, index=False
+        )
+        skipped = len(result.global_stats())
+        for chunk in iter_chunks(result.categories, chunksize):
+            ReportResult(result.totals, chunk).to_frame().iloc[skipped:].to_csv(
+                f, header=False, index=False
+            )
+
+
+def write_json_report(result: ReportResult, path: str, chunksize: int) -> None:
+    """
+    Écrit le rapport en JSON : {"totals": {...}, "categories": [{...}, ...]}.
+
+    Les catégories sont écrites bloc par bloc ; les nombres sont écrits sans
+    perte de précision.
+    """
+    table = category_table(result)
+    columns = list(table.columns)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"totals": ')
+        json.dump(native_totals(result), f, ensure_ascii=False)
+        f.write(', "categories": [')
+        separator = "\n"
+        for rows in iter_records(table, chunksize):
+            for row in rows:
+                f.write(separator)
+                json.dump(dict(zip(columns, row)), f, ensure_ascii=False)
+                separator = ",\n"
+        f.write("\n]}\n")
+
+
+def write_parquet_report(result: ReportResult, path: str, chunksize: int) -> None:
+    """
+    Écrit les statistiques par catégorie en Parquet, un groupe de lignes par
+    bloc ; les statistiques globales sont dans les métadonnées du schéma.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = category_table(result)
+    schema = pa.Schema.from_pandas(table.iloc[:0], preserve_index=False)
+    schema = schema.with_metadata(
+        {
+            **(schema.metadata or {}),
+            PARQUET_TOTALS_KEY: json.dumps(native_totals(result)).encode("utf-8"),
+        }
+    )
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in iter_chunks(table, chunksize):
+            writer.write_table(
+                pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            )
+
+
+def _markdown_cell(value: Any) -> str:
+    """Texte d'une cellule Markdown (vide pour une valeur manquante)."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value).replace("|", "\\|")
+
+
+def _write_markdown_rows(f: TextIO, rows: Iterable[Iterable[Any]]) -> None:
+    """Écrit des lignes de tableau Markdown."""
+    f.write(
+        "".join("| " + " | ".join(map(_markdown_cell, row)) + " |\n" for row in rows)
+    )
+
+
+def write_markdown_report(result: ReportResult, path: str, chunksize: int) -> None:
+    """Écrit le rapport en Markdown : un tableau global, un par catégorie."""
+    table = category_table(result)
+    header = ["Catégorie", *CATEGORY_METRIC_LABELS.values()]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# Rapport d'inventaire\n\n## Statistiques globales\n\n")
+        f.write("| Métrique | Valeur |\n| --- | ---: |\n")
+        _write_markdown_rows(f, result.global_stats())
+        f.write("\n## Statistiques par catégorie\n\n")
+        _write_markdown_rows(f, [header])
+        f.write("| --- |" + " ---: |" * len(CATEGORY_METRIC_LABELS) + "\n")
+        for rows in iter_records(table, chunksize):
+            _write_markdown_rows(f, rows)
+
+
+# Parties fixes d'un classeur XLSX à deux feuilles (SpreadsheetML minimal)
+_XLSX_SHEETS = ("Global", "Catégories")
+_XLSX_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_XLSX_RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_XLSX_DOC_RELS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'content-types">'
+        '<Default Extension="rels" ContentType="application/'
+        'vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        + "".join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            'ContentType="application/'
+            'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for i in range(1, len(_XLSX_SHEETS) + 1)
+        )
+        + "</Types>"
+    ),
+    "_rels/.rels": (
+        f'<Relationships xmlns="{_XLSX_RELS}">'
+        f'<Relationship Id="rId1" Type="{_XLSX_DOC_RELS}/officeDocument" '
+        'Target="xl/workbook.xml"/></Relationships>'
+    ),
+    "xl/workbook.xml": (
+        f'<workbook xmlns="{_XLSX_MAIN}" xmlns:r="{_XLSX_DOC_RELS}"><sheets>'
+        + "".join(
+            f'<sheet name="{name}" sheetId="{i}" r:id="rId{i}"/>'
+            for i, name in enumerate(_XLSX_SHEETS, 1)
+        )
+        + "</sheets></workbook>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        f'<Relationships xmlns="{_XLSX_RELS}">'
+        + "".join(
+            f'<Relationship Id="rId{i}" Type="{_XLSX_DOC_RELS}/worksheet" '
+            f'Target="worksheets/sheet{i}.xml"/>'
+            for i in range(1, len(_XLSX_SHEETS) + 1)
+        )
+        + "</Relationships>"
+    ),
+}
+
+
+def _xlsx_row(values: Iterable[Any]) -> str:
+    """
+    Ligne de feuille XLSX : nombres finis en valeurs, textes en chaînes
+    inline, cellule vide pour une valeur manquante ou non finie.
+    """
+    cells = []
+    for value in values:
+        if value is None or (isinstance(value, float) and not math.isfinite(value)):
+            cells.append("<c/>")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            cells.append(f"<c><v>{value!r}</v></c>")
+        else:
+            cells.append(f'<c t="inlineStr"><is><t>{escape(str(value))}</t></is></c>')
+    return "<row>" + "".join(cells) + "</row>"
+
+
+def write_xlsx_report(result: ReportResult, path: str, chunksize: int) -> None:
+    """
+    Écrit le rapport en XLSX : feuille « Global » (Métrique/Valeur) et feuille
+    « Catégories » au format large.
+
+    Le classeur est produit sans dépendance ; les lignes de la feuille des
+    catégories sont écrites dans l'archive bloc par bloc.
+    """
+    declaration = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    table = category_table(result)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_PARTS.items():
+            archive.writestr(name, declaration + content)
+
+        totals = native_totals(result)
+        sheets = {
+            "xl/worksheets/sheet1.xml": (
+                ["Métrique", "Valeur"],
+                [[(GLOBAL_METRIC_LABELS[key], value) for key, value in totals.items()]],
+            ),
+            "xl/worksheets/sheet2.xml": (
+                ["Catégorie", *CATEGORY_METRIC_LABELS.values()],
+                iter_records(table, chunksize),
+            ),
+        }
+        for name, (header, blocks) in sheets.items():
+            with archive.open(name, "w") as sheet:
+                sheet.write(
+                    (
+                        declaration
+                        + f'<worksheet xmlns="{_XLSX_MAIN}"><sheetData>'
+                        + _xlsx_row(header)
+                    ).encode("utf-8")
+                )
+                for rows in blocks:
+                    sheet.write("".join(map(_xlsx_row, rows)).encode("utf-8"))
+                sheet.write(b"</sheetData></worksheet>")
+
+
+# Fonction d'écriture de chaque format
+REPORT_WRITERS = {
+    "csv": write_csv_report,
+    "parquet": write_parquet_report,
+    "json": write_json_report,
+    "xlsx": write_xlsx_report,
+    "markdown": write_markdown_report,
+}
+
+
+def save_report(
+    result: ReportResult,
+    output_file: str,
+    output_format: Optional[str] = None,
+    chunksize: int = REPORT_CHUNK_SIZE,
+) -> bool:
+    """
+    Enregistre un rapport dans un fichier, via un fichier temporaire renommé.
+
+    Args:
+        result (ReportResult): Rapport à enregistrer
+        output_file (str): Fichier de sortie
+        output_format (str, optional): csv, parquet, json, xlsx ou markdown
+            (par défaut : d'après l'extension, csv sinon)
+        chunksize (int): Nombre de catégories écrites à la fois
+
+    Returns:
+        bool: True si succès, False sinon
+
+    Raises:
+        ValueError: Si le format est inconnu ou inutilisable
+    """
+    output_format = report_format(output_file, output_format)
+    if output_format == "parquet" and not find_spec("pyarrow"):
+        raise ValueError("Le format parquet nécessite le paquet pyarrow")
+
+    try:
+        with atomic_path(output_file) as tmp_path:
+            REPORT_WRITERS[output_format](result, tmp_path, chunksize)
+        logging.info(f"Rapport sauvegardé avec succès: {output_file}")
+        return True
+    except Exception as e:
+        logging.error(f"Erreur lors de la sauvegarde du rapport: {str(e)}")
+        return False
@@ -0,0 +1,274 @@
+import json
+import logging
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .file_handler import FileHandler
+
+# Instantané créé dans le répertoire du cache par la commande snapshot
+SNAPSHOT_FILE = "inventory.snapshot"
+
+# Signature du format, suivie de la taille de l'en-tête JSON
+SNAPSHOT_MAGIC = b"INVSNAP1"
+
+# Alignement des sections : chaque tableau NumPy commence sur 8 octets
+SECTION_ALIGNMENT = 8
+
+
+def _string_table(values: Sequence[str]) -> Dict[str, np.ndarray]:
+    """Encode des chaînes en un tas UTF-8 et une table de n+1 positions."""
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    return {
+        "offsets": offsets,
+        "heap": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+    }
+
+
+def write_snapshot(
+    df: pd.DataFrame,
+    path: str,
+    manifest: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> bool:
+    """
+    Écrit l'inventaire consolidé dans un instantané binaire.
+
+    Disposition du fichier : signature, taille et contenu d'un en-tête JSON
+    (nombre de lignes, manifeste des fichiers sources, type et position de
+    chaque section), puis les sections alignées sur 8 octets :
+
+    - quantity et unit_price : colonnes numériques à largeur fixe ;
+    - name_offsets et name_heap : noms encodés en UTF-8 bout à bout, le nom
+      de la ligne i occupant name_heap[name_offsets[i]:name_offsets[i + 1]] ;
+    - category_codes, category_offsets et category_heap : code de la
+      catégorie de chaque ligne, et libellés des catégories sur le même
+      principe que les noms.
+
+    Le fichier est écrit sous un nom temporaire puis renommé.
+
+    Args:
+        df (pd.DataFrame): Inventaire consolidé
+        path (str): Fichier de l'instantané
+        manifest (Dict[str, Dict[str, Any]], optional): Signature des
+            fichiers sources de l'inventaire
+
+    Returns:
+        bool: True si succès, False sinon
+    """
+    categories = df["category"].astype("category")
+    names = _string_table(df["name"].astype(str).tolist())
+    labels = _string_table([str(label) for label in categories.cat.categories])
+    sections = {
+        "quantity": np.ascontiguousarray(df["quantity"].to_numpy()),
+        "unit_price": np.ascontiguousarray(df["unit_price"].to_numpy(dtype=np.float64)),
+        "name_offsets": names["offsets"],
+        "name_heap": names["heap"],
+        "category_codes": np.ascontiguousarray(categories.cat.codes.to_numpy()),
+        "category_offsets": labels["offsets"],
+        "category_heap": labels["heap"],
+    }
+
+    # Positions relatives au début des données, qui suivent l'en-tête
+    layout = {}
+    position = 0
+    for key, values in sections.items():
+        layout[key] = {
+            "dtype": values.dtype.str,
+            "count": len(values),
+            "offset": position,
+        }
+        position += -(-values.nbytes // SECTION_ALIGNMENT) * SECTION_ALIGNMENT
+    header = json.dumps(
+        {"rows": len(df), "manifest": manifest or {}, "sections": layout},
+        ensure_ascii=False,
+    ).encode("utf-8")
+    header += b" " * (-len(header) % SECTION_ALIGNMENT)
+
+    tmp_path = Path(str(path) + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for values in sections.values():
+                f.write(values.tobytes())
+                f.write(b"\0" * (-values.nbytes % SECTION_ALIGNMENT))
+        os.replace(tmp_path, path)
+        logging.info(f"Instantané enregistré: {path} ({len(df)} produits)")
+        return True
+    except Exception as e:
+        logging.error(f"Erreur lors de l'écriture de l'instantané: {str(e)}")
+        return False
+
+
+class InventorySnapshot:
+    """
+    Instantané binaire de l'inventaire, projeté en mémoire (mmap).
+
+    L'ouverture ne lit que l'en-tête : son coût ne dépend pas du nombre de
+    produits. Les colonnes quantity, unit_price et category_codes sont des
+    vues NumPy sur le fichier projeté, sans copie ; les noms ne sont décodés
+    que pour les lignes demandées.
+    """
+
+    def __init__(self, path: str, buffer: mmap.mmap, header: Dict[str, Any]):
+        """
+        Initialise l'instantané (voir open).
+
+        Args:
+            path (str): Fichier de l'instantané
+            buffer (mmap.mmap): Fichier projeté en mémoire
+            header (Dict[str, Any]): En-tête JSON du fichier
+        """
+        self.path = path
+        self.manifest: Dict[str, Dict[str, Any]] = header["manifest"]
+        self._buffer = buffer
+        self._rows = header["rows"]
+        self._data_start = header["data_start"]
+        self._sections = header["sections"]
+
+        self.quantity = self._section("quantity")
+        self.unit_price = self._section("unit_price")
+        self.category_codes = self._section("category_codes")
+        self._name_offsets = self._section("name_offsets")
+        self._name_start = self._data_start + self._sections["name_heap"]["offset"]
+        category_start = self._data_start + self._sections["category_heap"]["offset"]
+        offsets = self._section("category_offsets").tolist()
+        self.categories: List[str] = [
+            buffer[category_start + start : category_start + stop].decode("utf-8")
+            for start, stop in zip(offsets[:-1], offsets[1:])
+        ]
+
+    @classmethod
+    def open(cls, path: str) -> "InventorySnapshot":
+        """
+        Ouvre un instantané écrit par write_snapshot.
+
+        Args:
+            path (str): Fichier de l'instantané
+
+        Returns:
+            InventorySnapshot: Instantané projeté en mémoire
+
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas
+            ValueError: Si le fichier n'est pas un instantané
+        """
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        prefix = len(SNAPSHOT_MAGIC)
+        if buffer[:prefix] != SNAPSHOT_MAGIC:
+            buffer.close()
+            raise ValueError(f"Fichier d'instantané invalide : {path}")
+        header_size = int.from_bytes(buffer[prefix : prefix + 8], "little")
+        header = json.loads(buffer[prefix + 8 : prefix + 8 + header_size])
+        header["data_start"] = prefix + 8 + header_size
+        return cls(path, buffer, header)
+
+    def __len__(self) -> int:
+        """Nombre de produits de l'instantané."""
+        return self._rows
+
+    def _section(self, key: str) -> np.ndarray:
+        """Vue NumPy en lecture seule sur une section du fichier."""
+        section = self._sections[key]
+        return np.frombuffer(
+            self._buffer,
+            dtype=np.dtype(section["dtype"]),
+            count=section["count"],
+            offset=self._data_start + section["offset"],
+        )
+
+    def is_stale(self, data_directory: str) -> bool:
+        """
+        Indique si les fichiers CSV ont changé depuis l'instantané.
+
+        Seuls la liste des fichiers, leur date de modification et leur taille
+        sont comparées, sans relire leur contenu.
+
+        Args:
+            data_directory (str): Répertoire des fichiers CSV
+
+        Returns:
+            bool: True si un fichier a été ajouté, supprimé ou modifié
+        """
+        csv_files = FileHandler.list_csv_files(data_directory)
+        if len(csv_files) != len(self.manifest):
+            return True
+        for path in csv_files:
+            signature = self.manifest.get(str(path.resolve()))
+            stat = path.stat()
+            if signature is None or (signature["mtime_ns"], signature["size"]) != (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                return True
+        return False
+
+    def names(self, positions: Optional[np.ndarray] = None) -> List[str]:
+        """
+        Décode les noms de certaines lignes.
+
+        Args:
+            positions (np.ndarray, optional): Positions des lignes (toutes si
+                None)
+
+        Returns:
+            List[str]: Noms, dans l'ordre des positions
+        """
+        if positions is None:
+            offsets = self._name_offsets.tolist()
+            starts, stops = offsets[:-1], offsets[1:]
+        else:
+            starts = self._name_offsets[positions].tolist()
+            stops = self._name_offsets[np.asarray(positions) + 1].tolist()
+        buffer, base = self._buffer, self._name_start
+        return [
+            buffer[base + start : base + stop].decode("utf-8")
+            for start, stop in zip(starts, stops)
+        ]
+
+    def category_code(self, category: str) -> Optional[int]:
+        """Code d'une catégorie, ou None si elle est absente de l'instantané."""
+        try:
+            return self.categories.index(category)
+        except ValueError:
+            return None
+
+    def take(
+        self,
+        positions: Optional[np.ndarray] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Matérialise certaines lignes en DataFrame.
+
+        Args:
+            positions (np.ndarray, optional): Positions des lignes (toutes si
+                None) ; elles servent d'index au DataFrame
+            columns (List[str], optional): Colonnes à matérialiser (toutes si
+                None) ; les noms ne sont décodés que s'ils sont demandés
+
+        Returns:
+            pd.DataFrame: Lignes aux types de l'inventaire consolidé
+        """
+        columns = columns or ["name", "quantity", "unit_price", "category"]
+        rows = slice(None) if positions is None else positions
+        data = {}
+        for column in columns:
+            if column == "name":
+                data["name"] = pd.Series(self.names(positions), dtype=str).array
+            elif column == "category":
+                data["category"] = pd.Categorical.from_codes(
+                    np.array(self.category_codes[rows]), categories=self.categories
+                )
+            else:
+                data[column] = np.array(getattr(self, column)[rows])
+        index = pd.RangeIndex(self._rows) if positions is None else pd.Index(positions)
+        return pd.DataFrame(data, index=index)
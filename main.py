@@ -1,23 +1,65 @@
 import argparse
 import sys
 import logging
+import os
+import signal
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-import pandas as pd
-from inventory_manager.core.manager import InventoryManager
-from rich.console import Console
-from rich.table import Table
-from rich import print as rprint
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-console = Console()
+# pandas, rich et le gestionnaire ne sont importés que par les commandes qui
+# en ont besoin : --help ou une erreur d'argument restent instantanés
+if TYPE_CHECKING:
+    from inventory_manager.core.manager import InventoryManager
 
 
 def setup_logging():
     """Configure le système de logging."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        handlers=[logging.FileHandler("inventory.log"), logging.StreamHandler()],
+    from inventory_manager.utils.logging_setup import setup_logging as configure
+
+    configure()
+
+
+@lru_cache(maxsize=None)
+def get_console():
+    """Retourne la console rich, créée au premier affichage."""
+    from rich.console import Console
+
+    return Console()
+
+
+def rprint(*objects, **kwargs):
+    """Affiche un message formaté avec rich."""
+    from rich import print as rich_print
+
+    rich_print(*objects, **kwargs)
+
+
+def add_display_arguments(parser: argparse.ArgumentParser):
+    """Ajoute les options d'affichage des commandes listant des produits."""
+    parser.add_argument("--limit", type=int, help="Nombre maximal de produits listés")
+    parser.add_argument(
+        "--offset",
+        type=int,
+        default=0,
+        help="Nombre de produits ignorés avant le premier affiché (défaut: 0)",
+    )
+    parser.add_argument(
+        "--pager", action="store_true", help="Afficher les résultats dans un pager"
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=["table", "csv", "jsonl", "parquet"],
+        default="table",
+        help="Format de sortie (défaut: table ; csv, jsonl et parquet pour "
+        "d'autres outils)",
+    )
+    parser.add_argument(
+        "--output-file",
+        help="Fichier de sortie des formats csv, jsonl et parquet "
+        "(défaut: sortie standard)",
     )
 
 
@@ -36,6 +78,80 @@ def create_parser() -> argparse.ArgumentParser:
         help="Répertoire contenant les fichiers CSV (défaut: ./data)",
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Nombre de fichiers CSV lus en parallèle (défaut: 1)",
+    )
+
+    parser.add_argument(
+        "--pyarrow-strings",
+        action="store_true",
+        help="Stocker les noms de produits en chaînes pyarrow (si disponible)",
+    )
+
+    parser.add_argument(
+        "--backend",
+        choices=["pandas", "sqlite"],
+        default="pandas",
+        help="Stockage de l'inventaire : DataFrame pandas ou base SQLite indexée "
+        "(défaut: pandas)",
+    )
+
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="Lire l'inventaire depuis un instantané binaire (voir 'snapshot') "
+        "au lieu des fichiers CSV",
+    )
+
+    parser.add_argument(
+        "--snapshot-file",
+        metavar="FICHIER",
+        help="Fichier de l'instantané "
+        "(défaut: inventory.snapshot dans le répertoire du cache)",
+    )
+
+    parser.add_argument(
+        "--no-server",
+        action="store_true",
+        help="Ne pas interroger un serveur d'inventaire actif (voir 'serve')",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Afficher la durée de chaque étape et le pic mémoire (sur la sortie "
+        "d'erreur)",
+    )
+
+    parser.add_argument(
+        "--profile-json",
+        metavar="FICHIER",
+        help="Enregistrer les mesures du profilage en JSON (active --profile)",
+    )
+
+    parser.add_argument(
+        "--profile-stats",
+        metavar="FICHIER",
+        help="Enregistrer les statistiques cProfile, lisibles avec pstats "
+        "(active --profile)",
+    )
+
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ne pas utiliser le cache de l'inventaire consolidé",
+    )
+    cache_group.add_argument(
+        "--rebuild-cache",
+        action="store_true",
+        help="Relire tous les fichiers CSV et reconstruire le cache",
+    )
+
     # Sous-commandes
     subparsers = parser.add_subparsers(dest="command", help="Commandes disponibles")
 
@@ -50,20 +166,52 @@ def create_parser() -> argparse.ArgumentParser:
         "--desc", action="store_true", help="Trier par ordre décroissant"
     )
 
+    add_display_arguments(list_parser)
+
     # Commande: alert
     alert_parser = subparsers.add_parser("alerts", help="Gestion des alertes de stock")
     alert_parser.add_argument(
-        "--threshold", type=int, help="Définir un nouveau seuil d'alerte"
+        "--threshold",
+        type=int,
+        help="Définir un nouveau seuil d'alerte, conservé entre les exécutions",
+    )
+    threshold_target = alert_parser.add_mutually_exclusive_group()
+    threshold_target.add_argument(
+        "--category", help="Appliquer --threshold à une seule catégorie"
+    )
+    threshold_target.add_argument(
+        "--product", help="Appliquer --threshold à un seul produit (par nom)"
     )
     alert_parser.add_argument(
         "--check", action="store_true", help="Vérifier les alertes de stock"
     )
+    alert_parser.add_argument(
+        "--changes",
+        action="store_true",
+        help="Ne signaler que les alertes nouvelles, aggravées ou levées "
+        "depuis la dernière vérification",
+    )
+    alert_parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Journaliser un seul message récapitulatif au lieu d'une ligne "
+        "par alerte",
+    )
+    alert_parser.add_argument(
+        "--alert-file",
+        help="Écrire les alertes dans un fichier JSON Lines (une par ligne)",
+    )
 
     # Commande: search
     search_parser = subparsers.add_parser("search", help="Rechercher des produits")
     search_parser.add_argument(
         "--name", "-n", help="Nom du produit (recherche partielle)"
     )
+    search_parser.add_argument(
+        "--fuzzy",
+        action="store_true",
+        help="Recherche approchée sur le nom, résultats triés par pertinence",
+    )
     search_parser.add_argument("--category", "-c", help="Catégorie du produit")
     search_parser.add_argument("--min-price", type=float, help="Prix minimum")
     search_parser.add_argument("--max-price", type=float, help="Prix maximum")
@@ -73,66 +221,379 @@ def create_parser() -> argparse.ArgumentParser:
         help="Afficher uniquement les produits en stock faible (<10)",
     )
 
+    add_display_arguments(search_parser)
+
     # Commande: report
     report_parser = subparsers.add_parser("report", help="Générer un rapport")
     report_parser.add_argument(
         "--output",
         "-o",
-        default="report.csv",
-        help="Fichier de sortie (défaut: report.csv)",
+        help="Fichier de sortie (défaut: report.csv, report.parquet, "
+        "report.json, report.xlsx ou report.md selon le format ; au format "
+        "console, aucun fichier ou format d'après l'extension)",
     )
     report_parser.add_argument(
         "--format",
-        choices=["csv", "console"],
+        choices=["csv", "parquet", "json", "xlsx", "markdown", "console"],
         default="csv",
         help="Format de sortie (défaut: csv)",
     )
+    report_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Lire les fichiers CSV par blocs sans charger tout l'inventaire",
+    )
+    report_parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=100_000,
+        help="Nombre de lignes par bloc en mode --stream (défaut: 100000)",
+    )
+
+    # Commande: stats
+    stats_parser = subparsers.add_parser(
+        "stats", help="Afficher les types et l'empreinte mémoire de l'inventaire"
+    )
+    stats_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Comparer l'empreinte mémoire avant/après compactage des types",
+    )
+
+    # Commande: snapshot
+    subparsers.add_parser(
+        "snapshot",
+        help="Écrire l'inventaire consolidé dans un instantané binaire, "
+        "ouvert instantanément avec --snapshot",
+    )
+
+    # Commande: serve
+    serve_parser = subparsers.add_parser(
+        "serve", help="Garder l'inventaire en mémoire et servir les requêtes"
+    )
+    serve_parser.add_argument(
+        "--host", default="127.0.0.1", help="Adresse d'écoute (défaut: 127.0.0.1)"
+    )
+    serve_parser.add_argument(
+        "--port", type=int, default=0, help="Port d'écoute (défaut: port libre)"
+    )
+    serve_parser.add_argument(
+        "--token",
+        help="Jeton d'accès exigé des clients, obligatoire hors adresse locale "
+        "(défaut: variable INVENTORY_SERVER_TOKEN)",
+    )
+    serve_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Intervalle de détection des fichiers modifiés en secondes (défaut: 1)",
+    )
+
+    # Commande: watch
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Surveiller le répertoire de données et signaler les changements "
+        "d'alertes",
+    )
+    watch_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Intervalle de détection des fichiers modifiés en secondes (défaut: 1)",
+    )
+    watch_parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.5,
+        help="Délai sans modification avant de recharger, en secondes (défaut: 0.5)",
+    )
+    watch_parser.add_argument(
+        "--report",
+        help="Régénérer ce rapport après chaque modification (format d'après "
+        "l'extension : .csv, .parquet, .json, .xlsx ou .md)",
+    )
+
+    # Commande: batch
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Exécuter les tâches d'un fichier YAML ou JSON sur un seul chargement",
+    )
+    batch_parser.add_argument(
+        "jobs_file", help="Fichier de tâches (.json, .yaml ou .yml)"
+    )
+    batch_parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Nombre de tâches exécutées en parallèle (défaut: 4)",
+    )
 
     return parser
 
 
-def display_results(df, title: Optional[str] = None):
-    """Affiche les résultats dans un tableau formaté."""
+# Commandes pouvant être servies par un serveur d'inventaire actif
+REMOTE_COMMANDS = {"list", "alerts", "search", "report"}
+
+# Commandes qui servent plusieurs requêtes : les index de recherche y sont
+# construits, une requête isolée filtre directement les colonnes
+LONG_LIVED_COMMANDS = {"serve", "watch", "batch"}
+
+# Commandes en lecture seule pouvant lire un instantané (--snapshot)
+SNAPSHOT_COMMANDS = {"list", "alerts", "search", "report", "stats"}
+
+
+# Nombre de lignes formatées et affichées à la fois
+RENDER_CHUNK_SIZE = 1_000
+
+# Séparateur des colonnes des grands résultats, affichés en texte brut
+COLUMN_SEPARATOR = "  "
+
+
+def iter_row_chunks(df, chunksize: int = RENDER_CHUNK_SIZE):
+    """
+    Formate les lignes d'un DataFrame par blocs, colonne par colonne.
+
+    Args:
+        df (pd.DataFrame): Données à formater
+        chunksize (int): Nombre de lignes par bloc
+
+    Yields:
+        List[Tuple[str, ...]]: Lignes du bloc, valeurs converties en texte
+    """
+    for start in range(0, len(df), chunksize):
+        chunk = df.iloc[start : start + chunksize]
+        columns = [list(map(str, chunk[col].tolist())) for col in chunk.columns]
+        yield list(zip(*columns))
+
+
+def column_width(series) -> int:
+    """Largeur maximale du texte d'une colonne, en-tête compris."""
+    import pandas as pd
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        values = series.cat.categories
+    elif pd.api.types.is_integer_dtype(series.dtype):
+        values = [series.min(), series.max()]
+    else:
+        values = series
+    width = len(str(series.name))
+    for start in range(0, len(values), RENDER_CHUNK_SIZE):
+        chunk = values[start : start + RENDER_CHUNK_SIZE]
+        width = max(width, max(map(len, map(str, list(chunk)))))
+    return width
+
+
+@contextmanager
+def open_pager(console):
+    """
+    Ouvre le pager du système ($PAGER, less par défaut) et y redirige une
+    console : les lignes lui parviennent au fil de l'affichage.
+
+    Args:
+        console (Console): Console d'origine
+
+    Yields:
+        Console: Console écrivant dans le pager, ou la console d'origine si
+            aucun pager n'est disponible
+    """
+    import shlex
+    import shutil
+    import subprocess
+
+    from rich.console import Console
+
+    command = os.environ.get("PAGER") or "less -RS"
+    if not shutil.which(shlex.split(command)[0]):
+        yield console
+        return
+
+    process = subprocess.Popen(
+        command, shell=True, stdin=subprocess.PIPE, text=True, encoding="utf-8"
+    )
+    try:
+        yield Console(file=process.stdin, force_terminal=True, width=console.width)
+        process.stdin.close()
+    except BrokenPipeError:
+        # Le pager a été quitté avant la fin de l'affichage
+        pass
+    finally:
+        process.wait()
+
+
+def display_results(
+    df,
+    title: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    pager: bool = False,
+    console=None,
+):
+    """
+    Affiche les résultats dans un tableau formaté.
+
+    Au-delà de RENDER_CHUNK_SIZE lignes, le tableau est écrit en texte brut
+    par blocs, à partir des colonnes : les premiers résultats apparaissent
+    aussitôt et la mémoire reste constante, quelle que soit la taille du
+    DataFrame.
+
+    Args:
+        df (pd.DataFrame): Résultats à afficher
+        title (Optional[str]): Titre affiché au-dessus du tableau
+        limit (Optional[int]): Nombre maximal de lignes affichées
+        offset (int): Nombre de lignes ignorées au début
+        pager (bool): Afficher les résultats dans un pager
+        console (Optional[Console]): Console de sortie (console par défaut)
+
+    Raises:
+        ValueError: Si limit ou offset est négatif
+    """
+    from rich.table import Table
+
+    console = console or get_console()
+
     if df.empty:
-        rprint("[yellow]Aucun résultat trouvé.[/yellow]")
+        console.print("[yellow]Aucun résultat trouvé.[/yellow]")
         return
 
-    table = Table(show_header=True, header_style="bold magenta")
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("--limit et --offset doivent être des entiers positifs")
 
-    # Ajout des colonnes
-    for col in df.columns:
-        table.add_column(col)
+    total = len(df)
+    stop = total if limit is None else min(total, offset + limit)
+    page = df.iloc[offset:stop]
+    if page.empty:
+        console.print(f"[yellow]Aucun résultat après les {offset} premiers.[/yellow]")
+        return
 
-    # Ajout des lignes
-    for _, row in df.iterrows():
-        table.add_row(*[str(val) for val in row])
+    def render(console):
+        if title:
+            console.print(f"\n[bold blue]{title}[/bold blue]")
 
-    if title:
-        rprint(f"\n[bold blue]{title}[/bold blue]")
-    console.print(table)
-    rprint(f"\nTotal: [green]{len(df)}[/green] produits")
+        if len(page) <= RENDER_CHUNK_SIZE:
+            table = Table(show_header=True, header_style="bold magenta")
+            for col in page.columns:
+                table.add_column(col)
+            for rows in iter_row_chunks(page):
+                for row in rows:
+                    table.add_row(*row)
+            console.print(table)
+        else:
+            widths = [column_width(page[col]) for col in page.columns]
+            template = COLUMN_SEPARATOR.join(f"{{:<{width}}}" for width in widths)
+            console.print(
+                template.format(*page.columns).rstrip(),
+                style="bold magenta",
+                markup=False,
+                highlight=False,
+                soft_wrap=True,
+            )
+            console.print(
+                "─" * (sum(widths) + len(COLUMN_SEPARATOR) * (len(widths) - 1))
+            )
+            for rows in iter_row_chunks(page):
+                console.file.write(
+                    "".join(template.format(*row).rstrip() + "\n" for row in rows)
+                )
+
+        if len(page) < total:
+            console.print(
+                f"\nLignes {offset + 1}-{offset + len(page)}"
+                f" sur [green]{total}[/green] produits"
+            )
+        else:
+            console.print(f"\nTotal: [green]{total}[/green] produits")
 
+    if pager and console.is_terminal:
+        with open_pager(console) as pager_console:
+            render(pager_console)
+    else:
+        render(console)
 
-def handle_list_command(manager: InventoryManager, args):
+
+def show_results(df, title: str, args):
+    """
+    Affiche les résultats en tableau ou les exporte au format demandé.
+
+    Les formats d'export n'importent pas rich et n'écrivent sur la sortie
+    standard que les données : elle peut être envoyée à un autre outil.
+    """
+    if args.output_format == "table":
+        display_results(
+            df, title, limit=args.limit, offset=args.offset, pager=args.pager
+        )
+        return
+
+    from inventory_manager.utils.exporters import export_frame
+
+    if args.offset < 0 or (args.limit is not None and args.limit < 0):
+        raise ValueError("--limit et --offset doivent être des entiers positifs")
+    stop = None if args.limit is None else args.offset + args.limit
+    try:
+        export_frame(df.iloc[args.offset : stop], args.output_format, args.output_file)
+    except BrokenPipeError:
+        # Le lecteur (head, ...) a fermé le tube : rien de plus à écrire
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return
+    if args.output_file:
+        logging.info(f"Résultats exportés vers {args.output_file}")
+
+
+def print_error(message: str, args):
+    """Affiche une erreur, sur la sortie d'erreur pour les formats d'export."""
+    if getattr(args, "output_format", "table") == "table":
+        rprint(f"[red]{message}[/red]")
+    else:
+        print(message, file=sys.stderr)
+
+
+def handle_list_command(manager: "InventoryManager", args):
     """Gère la commande 'list'."""
     try:
         df = manager.inventory_df
         if args.sort_by:
             df = df.sort_values(by=args.sort_by, ascending=not args.desc)
-        display_results(df, "Liste des produits")
+        show_results(df, "Liste des produits", args)
     except Exception as e:
-        rprint(f"[red]Erreur lors de l'affichage : {str(e)}[/red]")
+        print_error(f"Erreur lors de l'affichage : {str(e)}", args)
 
 
-def handle_alerts_command(manager: InventoryManager, args):
+def print_alert_changes(changes):
+    """Affiche et journalise les alertes nouvelles, aggravées et levées."""
+    for alert in changes["new"] + changes["worsened"]:
+        logging.warning(alert)
+        rprint(f"[yellow]• {alert}[/yellow]")
+    for alert in changes["resolved"]:
+        logging.info(alert)
+        rprint(f"[green]• {alert}[/green]")
+    if not any(changes.values()):
+        rprint("[green]Aucun changement des alertes de stock[/green]")
+
+
+def handle_alerts_command(manager: "InventoryManager", args):
     """Gère la commande 'alerts'."""
+    from inventory_manager.core.alert_state import ALERT_STATE_FILE, AlertState
+
     try:
+        state = AlertState.load(str(Path(args.data_dir) / ALERT_STATE_FILE))
+        state.apply_thresholds(manager)
+
         if args.threshold is not None:
-            manager.set_stock_threshold(args.threshold)
-            rprint(f"[green]Seuil d'alerte mis à jour : {args.threshold}[/green]")
+            manager.set_stock_threshold(
+                args.threshold, category=args.category, product=args.product
+            )
+            state.store_thresholds(manager)
+            state.save()
+            target = args.product or args.category
+            suffix = f" ({target})" if target else ""
+            rprint(
+                f"[green]Seuil d'alerte mis à jour{suffix} : {args.threshold}[/green]"
+            )
 
         if args.check:
-            alerts = manager.check_stock_alerts()
+            alerts = manager.check_stock_alerts(
+                summary=args.summary, alert_file=args.alert_file
+            )
             if alerts:
                 rprint("\n[bold red]🚨 Alertes de stock bas[/bold red]")
                 for alert in alerts:
@@ -140,11 +601,16 @@ def handle_alerts_command(manager: InventoryManager, args):
             else:
                 rprint("[green]Aucune alerte de stock bas[/green]")
 
+        if args.changes:
+            changes = state.diff(manager.get_low_stock_products(with_thresholds=True))
+            state.save()
+            print_alert_changes(changes)
+
     except Exception as e:
         rprint(f"[red]Erreur lors de la gestion des alertes : {str(e)}[/red]")
 
 
-def handle_search_command(manager: InventoryManager, args):
+def handle_search_command(manager: "InventoryManager", args):
     """Gère la commande 'search'."""
     try:
         results = manager.search_products(
@@ -152,78 +618,431 @@ def handle_search_command(manager: InventoryManager, args):
             category=args.category,
             min_price=args.min_price,
             max_price=args.max_price,
+            fuzzy=args.fuzzy,
         )
 
         if args.low_stock:
             results = results[results["quantity"] < 10]
 
-        display_results(results, "Résultats de la recherche")
+        show_results(results, "Résultats de la recherche", args)
     except Exception as e:
-        rprint(f"[red]Erreur lors de la recherche : {str(e)}[/red]")
+        print_error(f"Erreur lors de la recherche : {str(e)}", args)
+
+
+def format_report_value(value) -> str:
+    """Formate une valeur du rapport : séparateur de milliers, 2 décimales."""
+    import numbers
+
+    if isinstance(value, numbers.Integral):
+        return f"{value:,}"
+    if isinstance(value, numbers.Real):
+        return f"{value:,.2f}"
+    return str(value)
+
+
+def render_report(result, console=None):
+    """
+    Affiche un rapport : statistiques globales puis un tableau par catégorie.
+
+    Args:
+        result (ReportResult): Rapport à afficher
+        console (Console, optional): Console de sortie (console par défaut)
+    """
+    from inventory_manager.models.report import CATEGORY_METRIC_LABELS
+    from rich.markup import escape
+    from rich.table import Table
+
+    console = console or get_console()
 
+    def metric_table(rows):
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Métrique")
+        table.add_column("Valeur")
+        for metric, value in rows:
+            table.add_row(metric, format_report_value(value))
+        return table
 
-def handle_report_command(manager: InventoryManager, args):
+    console.print("\n[bold blue]Statistiques Globales[/bold blue]")
+    console.print(metric_table(result.global_stats()))
+
+    labels = list(CATEGORY_METRIC_LABELS.values())
+    metrics = result.categories[list(CATEGORY_METRIC_LABELS)]
+    for category, *values in metrics.itertuples(name=None):
+        console.print(f"\n[bold blue]Statistiques {escape(str(category))}[/bold blue]")
+        console.print(metric_table(zip(labels, values)))
+
+
+def handle_report_command(manager: "InventoryManager", args):
     """Gère la commande 'report'."""
+    from inventory_manager.utils.report_sinks import REPORT_FORMATS
+
     try:
-        # Générer le rapport
-        manager.generate_report(args.output)
+        # Au format console, un fichier n'est écrit que si --output est donné,
+        # dans le format indiqué par son extension
+        output = args.output
+        output_format = None if args.format == "console" else args.format
+        if output is None and output_format is not None:
+            output = "report" + REPORT_FORMATS[output_format]
 
-        if args.format == "csv":
-            rprint(f"[green]Rapport généré avec succès : {args.output}[/green]")
+        if args.stream:
+            result = manager.generate_report_streaming(
+                output, chunksize=args.chunksize, output_format=output_format
+            )
         else:
-            # Lire et afficher le rapport
-            report_df = pd.read_csv(args.output)
-
-            # Tableau pour les statistiques globales
-            global_table = Table(show_header=True, header_style="bold magenta")
-            global_table.add_column("Métrique")
-            global_table.add_column("Valeur")
-
-            # Filtrer les statistiques globales (celles qui ne commencent pas par une catégorie)
-            global_stats = report_df[~report_df["Métrique"].str.contains(" - ")]
-            for _, row in global_stats.iterrows():
-                value = (
-                    f"{row['Valeur']:,.2f}"
-                    if isinstance(row["Valeur"], (int, float))
-                    else str(row["Valeur"])
-                )
-                global_table.add_row(row["Métrique"], value)
-
-            rprint("\n[bold blue]Statistiques Globales[/bold blue]")
-            console.print(global_table)
-
-            # Tableaux pour chaque catégorie
-            categories = {
-                s.split(" - ")[0] for s in report_df["Métrique"] if " - " in s
-            }
-
-            for category in categories:
-                cat_table = Table(show_header=True, header_style="bold magenta")
-                cat_table.add_column("Métrique")
-                cat_table.add_column("Valeur")
-
-                cat_stats = report_df[report_df["Métrique"].str.startswith(category)]
-                for _, row in cat_stats.iterrows():
-                    metric = row["Métrique"].split(" - ")[
-                        1
-                    ]  # Retirer le préfixe de la catégorie
-                    value = (
-                        f"{row['Valeur']:,.2f}"
-                        if isinstance(row["Valeur"], (int, float))
-                        else str(row["Valeur"])
-                    )
-                    cat_table.add_row(metric, value)
-
-                rprint(f"\n[bold blue]Statistiques {category}[/bold blue]")
-                console.print(cat_table)
+            result = manager.generate_report(output, output_format)
+
+        if output_format is not None:
+            rprint(f"[green]Rapport généré avec succès : {output}[/green]")
+        else:
+            render_report(result)
 
     except Exception as e:
         rprint(f"[red]Erreur lors de la génération du rapport : {str(e)}[/red]")
 
 
+def format_bytes(size: float) -> str:
+    """Formate une taille en octets de façon lisible."""
+    for unit in ["o", "Ko", "Mo", "Go"]:
+        if size < 1024 or unit == "Go":
+            return f"{size:,.1f} {unit}"
+        size /= 1024
+
+
+def render_profile(metrics, console=None):
+    """
+    Affiche les mesures du profilage : durée de chaque étape, détail par
+    fichier et pic mémoire.
+
+    Args:
+        metrics (dict): Mesures (voir Profiler.metrics)
+        console (rich.console.Console, optional): Console de sortie (sortie
+            d'erreur par défaut)
+    """
+    from rich.console import Console
+    from rich.markup import escape
+    from rich.table import Table
+
+    console = console or Console(stderr=True)
+    total = metrics["total_seconds"]
+    table = Table(
+        title="Profil d'exécution", show_header=True, header_style="bold magenta"
+    )
+    table.add_column("Étape")
+    table.add_column("Appels", justify="right")
+    table.add_column("Durée (s)", justify="right")
+    table.add_column("Max (s)", justify="right")
+    table.add_column("Part", justify="right")
+
+    for stage in metrics["stages"]:
+        share = stage["seconds"] / total if total else 0.0
+        table.add_row(
+            stage["stage"],
+            str(stage["calls"]),
+            f"{stage['seconds']:.4f}",
+            f"{stage['max_seconds']:.4f}",
+            f"{share:.1%}",
+        )
+        for detail, seconds in stage.get("details", {}).items():
+            table.add_row(f"  [dim]{escape(detail)}[/dim]", "", f"{seconds:.4f}")
+    table.add_row("[bold]Total[/bold]", "", f"{total:.4f}", "", "")
+
+    console.print(table)
+    if metrics["peak_memory_bytes"] is not None:
+        console.print(
+            f"Pic mémoire (tracemalloc) : {format_bytes(metrics['peak_memory_bytes'])}"
+        )
+
+
+def handle_stats_command(manager: "InventoryManager", args):
+    """Gère la commande 'stats'."""
+    from rich.table import Table
+
+    try:
+        df = manager.inventory_df
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Colonne")
+        table.add_column("Type")
+
+        if args.memory:
+            memory = manager.memory_report()
+            table.add_column("Avant", justify="right")
+            table.add_column("Après", justify="right")
+            for column, row in memory.iterrows():
+                dtype = str(df[column].dtype) if column in df.columns else "-"
+                table.add_row(
+                    column,
+                    dtype,
+                    format_bytes(row["avant"]),
+                    format_bytes(row["après"]),
+                )
+            totals = memory.sum()
+            table.add_row(
+                "[bold]Total[/bold]",
+                "",
+                format_bytes(totals["avant"]),
+                format_bytes(totals["après"]),
+            )
+        else:
+            for column in df.columns:
+                table.add_row(column, str(df[column].dtype))
+
+        rprint(f"\n[bold blue]Inventaire : {len(df)} produits[/bold blue]")
+        get_console().print(table)
+    except Exception as e:
+        rprint(f"[red]Erreur lors du calcul des statistiques : {str(e)}[/red]")
+
+
+def handle_batch_command(manager: "InventoryManager", args) -> int:
+    """Gère la commande 'batch'."""
+    from rich.markup import escape
+    from rich.table import Table
+
+    from inventory_manager.core.alert_state import ALERT_STATE_FILE, AlertState
+    from inventory_manager.core.batch import BatchRunner, load_jobs
+
+    try:
+        jobs = load_jobs(args.jobs_file)
+        # Seuils enregistrés par 'alerts --threshold', comme pour 'alerts'
+        AlertState.load(str(Path(args.data_dir) / ALERT_STATE_FILE)).apply_thresholds(
+            manager
+        )
+        results = BatchRunner(manager, workers=args.workers).run(jobs)
+    except Exception as e:
+        rprint(f"[red]Erreur lors de l'exécution des tâches : {str(e)}[/red]")
+        return 1
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Tâche", justify="right")
+    table.add_column("Commande")
+    table.add_column("Sortie")
+    table.add_column("Résultat")
+    table.add_column("Durée (s)", justify="right")
+    for number, result in enumerate(results, 1):
+        if result["status"] == "ok":
+            outcome = f"[green]{result['count']}[/green]"
+        else:
+            outcome = f"[red]{escape(result['error'])}[/red]"
+        table.add_row(
+            str(number),
+            result["command"],
+            escape(result["output"] or "-"),
+            outcome,
+            f"{result['seconds']:.3f}",
+        )
+    get_console().print(table)
+    memo = manager.memo_stats()
+    rprint(
+        f"[dim]Résultats mémorisés : {memo['hits']} réutilisé(s), "
+        f"{memo['misses']} calculé(s)[/dim]"
+    )
+
+    failures = sum(result["status"] != "ok" for result in results)
+    if failures:
+        rprint(f"[red]{failures} tâche(s) en échec sur {len(results)}[/red]")
+        return 1
+    rprint(f"[green]{len(results)} tâche(s) exécutée(s)[/green]")
+    return 0
+
+
+def run_command(manager, args):
+    """
+    Exécute la commande demandée sur un gestionnaire ou un client.
+
+    Returns:
+        Optional[int]: Code de sortie de la commande, si elle en fixe un
+    """
+    if args.command == "list":
+        handle_list_command(manager, args)
+    elif args.command == "alerts":
+        handle_alerts_command(manager, args)
+    elif args.command == "search":
+        handle_search_command(manager, args)
+    elif args.command == "report":
+        handle_report_command(manager, args)
+    elif args.command == "stats":
+        handle_stats_command(manager, args)
+    elif args.command == "snapshot":
+        handle_snapshot_command(manager, args)
+    elif args.command == "serve":
+        return handle_serve_command(manager, args)
+    elif args.command == "watch":
+        handle_watch_command(manager, args)
+    elif args.command == "batch":
+        return handle_batch_command(manager, args)
+
+
+def snapshot_path(args) -> Path:
+    """Fichier de l'instantané : --snapshot-file, ou dans le répertoire du cache."""
+    from inventory_manager.utils.cache import default_cache_directory
+    from inventory_manager.utils.snapshot import SNAPSHOT_FILE
+
+    if args.snapshot_file:
+        return Path(args.snapshot_file)
+    return default_cache_directory(args.data_dir) / SNAPSHOT_FILE
+
+
+def handle_snapshot_command(manager: "InventoryManager", args):
+    """Gère la commande 'snapshot'."""
+    path = snapshot_path(args)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if manager.save_snapshot(str(path)):
+        rprint(
+            f"[green]Instantané enregistré : {path} "
+            f"({len(manager.inventory_df)} produits)[/green]"
+        )
+    else:
+        rprint(f"[red]Erreur lors de l'écriture de l'instantané {path}[/red]")
+
+
+def handle_serve_command(manager: "InventoryManager", args):
+    """Gère la commande 'serve'."""
+    from inventory_manager.core.client import SERVER_TOKEN_ENV
+    from inventory_manager.core.server import InventoryServer
+
+    try:
+        server = InventoryServer(
+            manager,
+            host=args.host,
+            port=args.port,
+            poll_interval=args.poll_interval,
+            token=args.token or os.environ.get(SERVER_TOKEN_ENV),
+        )
+    except ValueError as e:
+        rprint(f"[red]Erreur : {str(e)}[/red]")
+        return 1
+    server.start()
+    rprint(f"[green]Serveur d'inventaire démarré sur {server.address}[/green]")
+    rprint("[yellow]Ctrl+C pour arrêter.[/yellow]")
+    # SIGTERM arrête proprement le serveur, comme Ctrl+C
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        while True:
+            time.sleep(3600)
+    finally:
+        server.stop()
+
+
+def handle_watch_command(manager: "InventoryManager", args):
+    """Gère la commande 'watch'."""
+    from inventory_manager.core.alert_state import ALERT_STATE_FILE, AlertState
+    from inventory_manager.core.watcher import DirectoryWatcher
+
+    state = AlertState.load(str(Path(args.data_dir) / ALERT_STATE_FILE))
+    state.apply_thresholds(manager)
+
+    def check_alerts():
+        changes = state.diff(manager.get_low_stock_products(with_thresholds=True))
+        state.save()
+        print_alert_changes(changes)
+        if args.report:
+            manager.generate_report(args.report)
+
+    def on_change(changes):
+        manager.consolidate_files(changed_paths=changes["added"] + changes["modified"])
+        rprint(
+            f"\n[blue]Fichiers ajoutés : {len(changes['added'])}, modifiés : "
+            f"{len(changes['modified'])}, supprimés : {len(changes['removed'])}"
+            "[/blue]"
+        )
+        check_alerts()
+
+    check_alerts()
+    watcher = DirectoryWatcher(
+        args.data_dir,
+        on_change,
+        poll_interval=args.poll_interval,
+        debounce=args.debounce,
+    )
+    watcher.start()
+    rprint(f"[green]Surveillance de {args.data_dir} démarrée.[/green]")
+    rprint("[yellow]Ctrl+C pour arrêter.[/yellow]")
+    # SIGTERM arrête proprement la surveillance, comme Ctrl+C
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        while True:
+            time.sleep(3600)
+    finally:
+        watcher.stop()
+
+
+class RemoteInventory:
+    """
+    Commandes list, search, alerts et report servies par un serveur actif.
+
+    Le client ne retourne que du JSON décodé : les DataFrame ne sont construits
+    que pour l'affichage ou l'export, et les fichiers demandés (alertes,
+    rapport) sont écrits ici, le serveur n'en écrivant aucun. Les seuils et
+    set_stock_threshold sont ceux du client.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    @staticmethod
+    def _frame(result):
+        """Construit un DataFrame depuis le format « split »."""
+        import pandas as pd
+
+        return pd.DataFrame(result["data"], columns=result["columns"])
+
+    @property
+    def inventory_df(self):
+        return self._frame(self.client.list_products())
+
+    def search_products(self, **criteria):
+        return self._frame(self.client.search_products(**criteria))
+
+    def get_low_stock_products(self, with_thresholds: bool = False):
+        return self._frame(self.client.get_low_stock_products(with_thresholds))
+
+    def check_stock_alerts(self, summary: bool = False, alert_file=None):
+        alerts = self.client.check_stock_alerts(summary=summary)
+        if alert_file:
+            from inventory_manager.utils.exporters import export_frame
+
+            low_stock = self.get_low_stock_products(with_thresholds=True)
+            export_frame(
+                low_stock[["name", "category", "quantity", "threshold"]],
+                "jsonl",
+                alert_file,
+            )
+        return alerts
+
+    def generate_report(self, output_file=None, output_format=None):
+        from inventory_manager.models.report import ReportResult
+        from inventory_manager.utils.report_sinks import save_report
+
+        result = ReportResult.from_dict(self.client.generate_report())
+        if output_file and not save_report(result, output_file, output_format):
+            raise Exception("Échec de la génération du rapport")
+        return result
+
+
+def local_loading_options(args) -> list:
+    """
+    Options de chargement local données sur la ligne de commande.
+
+    Un serveur actif a déjà chargé l'inventaire : ces options n'auraient
+    aucun effet sur lui.
+
+    Returns:
+        list: Options données (ex. ["--rebuild-cache"])
+    """
+    options = []
+    if args.rebuild_cache:
+        options.append("--rebuild-cache")
+    if args.jobs != 1:
+        options.append("--jobs")
+    if args.backend != "pandas":
+        options.append("--backend")
+    return options
+
+
 def main():
     """Point d'entrée principal."""
-    setup_logging()
     parser = create_parser()
     args = parser.parse_args()
 
@@ -231,6 +1050,45 @@ def main():
         parser.print_help()
         return 1
 
+    if args.snapshot:
+        if args.command not in SNAPSHOT_COMMANDS:
+            parser.error(f"--snapshot n'est pas utilisable avec '{args.command}'")
+        if args.backend != "pandas":
+            parser.error("--snapshot nécessite le stockage pandas")
+
+    setup_logging()
+
+    profiling = bool(args.profile or args.profile_json or args.profile_stats)
+    if not profiling:
+        return run(args)
+
+    from inventory_manager.utils.profiling import disable_profiling, enable_profiling
+
+    enable_profiling(cprofile=args.profile_stats is not None)
+    try:
+        return run(args)
+    finally:
+        profiler = disable_profiling()
+        render_profile(profiler.metrics())
+        try:
+            if args.profile_json:
+                profiler.save_json(args.profile_json)
+            if args.profile_stats:
+                profiler.dump_stats(args.profile_stats)
+        except OSError as e:
+            print(f"Erreur lors de l'enregistrement du profil : {e}", file=sys.stderr)
+
+
+def run(args) -> int:
+    """
+    Exécute la commande demandée.
+
+    Args:
+        args (argparse.Namespace): Arguments de la ligne de commande
+
+    Returns:
+        int: Code de sortie
+    """
     try:
         # Vérification du répertoire de données
         data_dir = Path(args.data_dir)
@@ -238,21 +1096,46 @@ def main():
             rprint(f"[red]Erreur : Le répertoire {args.data_dir} n'existe pas.[/red]")
             return 1
 
+        # Un serveur actif répond sans consolidation locale, sauf si des
+        # options de chargement local sont données : elles seraient ignorées
+        client = None
+        local_options = local_loading_options(args)
+        use_server = not (args.no_server or args.snapshot or local_options)
+        if args.command in REMOTE_COMMANDS and use_server:
+            if not (args.command == "report" and args.stream):
+                from inventory_manager.core.client import InventoryClient
+
+                client = InventoryClient.discover(str(data_dir))
+        if client is not None:
+            run_command(RemoteInventory(client), args)
+            return 0
+        if local_options and args.command in REMOTE_COMMANDS:
+            logging.info(
+                f"Mode local imposé par {', '.join(local_options)} : "
+                "serveur d'inventaire non interrogé"
+            )
+
+        from inventory_manager.core.backends import get_backend
+        from inventory_manager.utils.cache import default_cache_directory
+
         # Initialisation du gestionnaire
-        manager = InventoryManager(str(data_dir))
-        manager.consolidate_files()
-
-        # Exécution de la commande
-        if args.command == "list":
-            handle_list_command(manager, args)
-        elif args.command == "alerts":
-            handle_alerts_command(manager, args)
-        elif args.command == "search":
-            handle_search_command(manager, args)
-        elif args.command == "report":
-            handle_report_command(manager, args)
-
-        return 0
+        cache_dir = None if args.no_cache else str(default_cache_directory(data_dir))
+        manager = get_backend(args.backend)(
+            str(data_dir),
+            jobs=args.jobs,
+            cache_directory=cache_dir,
+            pyarrow_strings=args.pyarrow_strings,
+        )
+        manager.build_indexes = args.command in LONG_LIVED_COMMANDS
+        # Le rapport en streaming lit lui-même les fichiers par blocs
+        if not (args.command == "report" and args.stream):
+            if args.snapshot:
+                # Instantané en lecture seule : les CSV ne sont pas relus
+                manager.open_snapshot(str(snapshot_path(args)))
+            else:
+                manager.consolidate_files(rebuild_cache=args.rebuild_cache)
+
+        return run_command(manager, args) or 0
 
     except KeyboardInterrupt:
         rprint("\n[yellow]Opération annulée par l'utilisateur.[/yellow]")
@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from inventory_manager.core.alert_state import AlertState, row_thresholds
+
+
+def low_stock(rows):
+    """Produits en stock bas : (nom, catégorie, quantité, seuil)."""
+    return pd.DataFrame(rows, columns=["name", "category", "quantity", "threshold"])
+
+
+class TestAlertState(unittest.TestCase):
+    def setUp(self):
+        """Préparation d'un état vide."""
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "alerts.json")
+        self.state = AlertState(self.path)
+
+    def tearDown(self):
+        """Nettoyage après les tests."""
+        shutil.rmtree(self.test_dir)
+
+    def test_only_changes_are_reported(self):
+        """Test que seules les alertes nouvelles, aggravées ou levées sont émises."""
+        first = self.state.diff(low_stock([("A", "Cat1", 5, 10), ("B", "Cat1", 8, 10)]))
+        self.assertEqual(len(first["new"]), 2)
+
+        unchanged = self.state.diff(
+            low_stock([("A", "Cat1", 5, 10), ("B", "Cat1", 8, 10)])
+        )
+        self.assertEqual(unchanged, {"new": [], "worsened": [], "resolved": []})
+
+        changes = self.state.diff(
+            low_stock([("A", "Cat1", 2, 10), ("C", "Cat2", 1, 5)])
+        )
+        self.assertEqual(
+            changes["new"],
+            ["NOUVELLE ALERTE: Stock bas pour C (1 unités restantes, seuil: 5)"],
+        )
+        self.assertEqual(
+            changes["worsened"],
+            [
+                "ALERTE AGGRAVÉE: Stock bas pour A "
+                "(2 unités restantes, contre 5, seuil: 10)"
+            ],
+        )
+        self.assertEqual(changes["resolved"], ["ALERTE LEVÉE: B"])
+
+    def test_persistence(self):
+        """Test que seuils et alertes actives survivent à un rechargement."""
+        self.state.default_threshold = 12
+        self.state.category_thresholds = {"Cat1": 20}
+        self.state.product_thresholds = {"A": 3}
+        self.state.diff(low_stock([("A", "Cat1", 2, 3)]))
+        self.assertTrue(self.state.save())
+
+        loaded = AlertState.load(self.path)
+        self.assertEqual(loaded.default_threshold, 12)
+        self.assertEqual(loaded.category_thresholds, {"Cat1": 20})
+        self.assertEqual(loaded.product_thresholds, {"A": 3})
+        self.assertEqual(
+            loaded.diff(low_stock([("A", "Cat1", 2, 3)])),
+            {"new": [], "worsened": [], "resolved": []},
+        )
+
+    def test_missing_or_corrupt_file(self):
+        """Test qu'un fichier absent ou illisible donne un état vide."""
+        self.assertIsNone(AlertState.load(self.path).default_threshold)
+        with open(self.path, "w") as f:
+            f.write("{corrompu")
+        self.assertTrue(AlertState.load(self.path).alerts.empty)
+
+    def test_row_thresholds_precedence(self):
+        """Test que le seuil produit l'emporte sur celui de la catégorie."""
+        df = pd.DataFrame(
+            {
+                "name": ["A", "B", "C"],
+                "category": pd.Categorical(["Cat1", "Cat1", "Cat2"]),
+            }
+        )
+        thresholds = row_thresholds(df, 10, {"Cat1": 20}, {"A": 3})
+        self.assertEqual(thresholds.tolist(), [3, 20, 10])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import json
+import shutil
+import tempfile
+import unittest
+from importlib.util import find_spec
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+from inventory_manager.core.batch import BatchRunner, load_jobs
+from inventory_manager.core.manager import InventoryManager
+from inventory_manager.core.sqlite_manager import SQLiteInventoryManager
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        """Préparation des tests avec des données temporaires."""
+        self.temp_dir = tempfile.mkdtemp()
+        pd.DataFrame(
+            {
+                "name": ["Produit1", "Produit2", "Produit3", "Produit4"],
+                "quantity": [5, 20, 8, 40],
+                "unit_price": [10.0, 20.0, 30.0, 40.0],
+                "category": ["Cat1", "Cat2", "Cat1", "Cat2"],
+            }
+        ).to_csv(Path(self.temp_dir) / "test.csv", index=False)
+        self.manager = InventoryManager(self.temp_dir)
+        self.manager.consolidate_files()
+
+    def tearDown(self):
+        """Nettoyage après les tests."""
+        shutil.rmtree(self.temp_dir)
+
+    def path(self, name: str) -> str:
+        """Chemin d'un fichier du répertoire de test."""
+        return str(Path(self.temp_dir) / name)
+
+    def write_jobs(self, name: str, text: str) -> str:
+        """Écrit un fichier de tâches."""
+        path = self.path(name)
+        Path(path).write_text(text, encoding="utf-8")
+        return path
+
+    def test_load_json_jobs(self):
+        """Test de la lecture d'une liste de tâches JSON."""
+        jobs = [{"command": "report", "output": "r.csv"}, {"command": "alerts"}]
+        path = self.write_jobs("jobs.json", json.dumps(jobs))
+        self.assertEqual(load_jobs(path), jobs)
+
+    @unittest.skipUnless(find_spec("yaml"), "PyYAML non installé")
+    def test_load_yaml_jobs(self):
+        """Test de la lecture d'un fichier YAML avec une clé jobs."""
+        path = self.write_jobs(
+            "jobs.yaml",
+            "jobs:\n  - command: search\n    category: Cat1\n    output: s.csv\n",
+        )
+        self.assertEqual(
+            load_jobs(path),
+            [{"command": "search", "category": "Cat1", "output": "s.csv"}],
+        )
+
+    def test_invalid_jobs(self):
+        """Test du rejet des tâches invalides."""
+        for jobs in (
+            {"tasks": []},
+            [{"command": "delete"}],
+            [{"command": "report"}],
+            [{"command": "search", "output": "s.csv", "limit": 3}],
+        ):
+            with self.subTest(jobs=jobs):
+                path = self.write_jobs("jobs.json", json.dumps(jobs))
+                with self.assertRaises(ValueError):
+                    load_jobs(path)
+
+    def test_jobs_share_intermediate_results(self):
+        """Test que stock bas et rapport ne sont calculés qu'une fois."""
+        jobs = [
+            {"command": "report", "output": self.path("report.json")},
+            {"command": "report", "output": self.path("report.md")},
+            {"command": "alerts", "output": self.path("alerts.jsonl")},
+            {"command": "low_stock", "output": self.path("low.csv")},
+            {"command": "search", "category": "Cat2", "output": self.path("s.jsonl")},
+            {"command": "list", "sort_by": "quantity", "output": self.path("l.csv")},
+        ]
+        # Une tâche à la fois : deux calculs simultanés d'un même résultat
+        # mémorisé ne sont pas fusionnés (voir ResultCache)
+        with mock.patch.object(
+            self.manager,
+            "_low_stock_products",
+            wraps=self.manager._low_stock_products,
+        ) as low_stock, mock.patch.object(
+            self.manager, "_report_stats", wraps=self.manager._report_stats
+        ) as report:
+            results = BatchRunner(self.manager, workers=1).run(jobs)
+
+        self.assertEqual([r["status"] for r in results], ["ok"] * len(jobs))
+        self.assertEqual([r["count"] for r in results], [2, 2, 2, 2, 2, 4])
+        self.assertEqual(low_stock.call_count, 1)
+        self.assertEqual(report.call_count, 1)
+
+        self.assertEqual(
+            pd.read_csv(self.path("low.csv"))["name"].tolist(),
+            ["Produit1", "Produit3"],
+        )
+        self.assertEqual(
+            pd.read_csv(self.path("l.csv"))["quantity"].tolist(), [5, 8, 20, 40]
+        )
+        with open(self.path("report.json"), encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["totals"]["count"], 4)
+
+    def test_failed_job_does_not_stop_others(self):
+        """Test qu'une tâche en échec n'interrompt pas les autres."""
+        jobs = [
+            {"command": "report", "output": self.path("r.txt"), "format": "xml"},
+            {"command": "low_stock", "output": self.path("low.csv")},
+        ]
+        results = BatchRunner(self.manager).run(jobs)
+
+        self.assertEqual(results[0]["status"], "erreur")
+        self.assertIn("xml", results[0]["error"])
+        self.assertEqual(results[1]["status"], "ok")
+        self.assertFalse(Path(self.path("r.txt")).exists())
+
+    def test_failed_alerts_keep_previous_file(self):
+        """Test qu'un échec d'écriture des alertes laisse l'ancien fichier."""
+        output = self.path("alerts.jsonl")
+        Path(output).write_text("ancien\n", encoding="utf-8")
+
+        with mock.patch(
+            "inventory_manager.core.manager.export_frame",
+            side_effect=OSError("disque plein"),
+        ):
+            results = BatchRunner(self.manager).run(
+                [{"command": "alerts", "output": output}]
+            )
+
+        self.assertEqual(results[0]["status"], "erreur")
+        self.assertEqual(Path(output).read_text(encoding="utf-8"), "ancien\n")
+        self.assertEqual(
+            sorted(p.name for p in Path(self.temp_dir).iterdir()),
+            ["alerts.jsonl", "test.csv"],
+        )
+
+    def test_sqlite_jobs_run_one_at_a_time(self):
+        """Test que le stockage SQLite exécute les tâches une à une."""
+        manager = SQLiteInventoryManager(self.temp_dir)
+        manager.consolidate_files()
+        runner = BatchRunner(manager, workers=4)
+        self.assertEqual(runner.workers, 1)
+
+        results = runner.run([{"command": "low_stock", "output": self.path("l.csv")}])
+        self.assertEqual(results[0]["count"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.generator import generate_inventory, main, write_inventory_files
+from inventory_manager.core.manager import InventoryManager
+
+
+class TestInventoryGenerator(unittest.TestCase):
+    def test_deterministic(self):
+        """Test qu'une même graine produit le même inventaire."""
+        pd.testing.assert_frame_equal(
+            generate_inventory(1000, duplicate_rate=0.2, skew=1.0, seed=3),
+            generate_inventory(1000, duplicate_rate=0.2, skew=1.0, seed=3),
+        )
+        self.assertFalse(
+            generate_inventory(1000, seed=3).equals(generate_inventory(1000, seed=4))
+        )
+
+    def test_duplicates_and_skew(self):
+        """Test du taux de doublons et de l'asymétrie des catégories."""
+        df = generate_inventory(10_000, categories=20, duplicate_rate=0.25, skew=1.5)
+        self.assertEqual(len(df), 10_000)
+        self.assertEqual(len(df.drop_duplicates(["name", "category"])), 7_500)
+        counts = df["category"].value_counts()
+        self.assertEqual(counts.index[0], "Cat0")
+        self.assertGreater(counts.iloc[0], 5 * counts.iloc[-1])
+
+        uniform = generate_inventory(10_000, categories=20)
+        self.assertLess(uniform["category"].value_counts().iloc[0], 2 * 10_000 / 20)
+
+    def test_write_files(self):
+        """Test de la répartition en fichiers, consolidés sans doublon."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        paths = write_inventory_files(temp_dir, files=3, rows=900, duplicate_rate=0.1)
+        self.assertEqual(len(paths), 3)
+
+        manager = InventoryManager(temp_dir)
+        manager.consolidate_files()
+        self.assertEqual(len(manager.inventory_df), 810)
+
+    def test_command_line_creates_directory(self):
+        """Test de la ligne de commande, vers un répertoire inexistant."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        out = Path(temp_dir) / "new" / "data"
+        with redirect_stdout(StringIO()):
+            code = main(["--out", str(out), "--files", "2", "--rows", "100"])
+
+        self.assertEqual(code, 0)
+        self.assertEqual(
+            sorted(path.name for path in out.iterdir()),
+            ["inventory_000.csv", "inventory_001.csv"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
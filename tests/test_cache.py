@@ -0,0 +1,181 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+from inventory_manager.core.manager import InventoryManager
+from inventory_manager.utils.cache import InventoryCache, default_cache_directory
+from inventory_manager.utils.file_handler import FileHandler
+
+
+class TestInventoryCache(unittest.TestCase):
+    def setUp(self):
+        """Préparation d'un répertoire de données et d'un répertoire de cache."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_dir = Path(self.temp_dir) / "data"
+        self.cache_dir = Path(self.temp_dir) / "cache"
+        self.data_dir.mkdir()
+        self.csv_file = self.data_dir / "test.csv"
+        pd.DataFrame(
+            {
+                "name": ["Produit1", "Produit2"],
+                "quantity": [5, 20],
+                "unit_price": [10.0, 20.0],
+                "category": ["Cat1", "Cat2"],
+            }
+        ).to_csv(self.csv_file, index=False)
+
+    def tearDown(self):
+        """Nettoyage après les tests."""
+        shutil.rmtree(self.temp_dir)
+
+    def new_manager(self):
+        return InventoryManager(str(self.data_dir), cache_directory=str(self.cache_dir))
+
+    def test_save_and_load(self):
+        """Test de l'aller-retour de l'inventaire dans le cache."""
+        cache = InventoryCache(str(self.cache_dir))
+        manifest = cache.build_manifest(FileHandler.list_csv_files(self.data_dir))
+        df = pd.read_csv(self.csv_file)
+
+        self.assertIsNone(cache.load(manifest))
+        self.assertTrue(cache.save(df, manifest))
+        pd.testing.assert_frame_equal(cache.load(manifest), df)
+
+    def test_cache_skips_csv_parsing(self):
+        """Test qu'un second chargement ne relit pas les CSV."""
+        first = self.new_manager()
+        first.consolidate_files()
+
+        second = self.new_manager()
+        with mock.patch.object(FileHandler, "read_csv_file") as read_csv_file:
+            second.consolidate_files()
+        read_csv_file.assert_not_called()
+        pd.testing.assert_frame_equal(second.inventory_df, first.inventory_df)
+
+    def test_cache_invalidated_when_file_touched(self):
+        """Test de l'invalidation du cache quand un fichier est modifié."""
+        self.new_manager().consolidate_files()
+
+        stat = self.csv_file.stat()
+        os.utime(self.csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        manager = self.new_manager()
+        with mock.patch.object(
+            FileHandler, "read_csv_file", wraps=FileHandler.read_csv_file
+        ) as read_csv_file:
+            manager.consolidate_files()
+        read_csv_file.assert_called_once()
+
+    def test_cache_invalidated_when_content_changes(self):
+        """Test de l'invalidation du cache quand le contenu change."""
+        self.new_manager().consolidate_files()
+
+        with open(self.csv_file, "a", encoding="utf-8") as f:
+            f.write("Produit3,1,30.0,Cat1\n")
+
+        manager = self.new_manager()
+        manager.consolidate_files()
+        self.assertEqual(len(manager.inventory_df), 3)
+
+    def test_rebuild_cache(self):
+        """Test de la reconstruction forcée du cache."""
+        self.new_manager().consolidate_files()
+
+        manager = self.new_manager()
+        with mock.patch.object(
+            FileHandler, "read_csv_file", wraps=FileHandler.read_csv_file
+        ) as read_csv_file:
+            manager.consolidate_files(rebuild_cache=True)
+        read_csv_file.assert_called_once()
+
+    def test_fragments_reused_across_processes(self):
+        """Test qu'un nouveau processus ne relit que le fichier modifié."""
+        other_file = self.data_dir / "other.csv"
+        pd.DataFrame(
+            {
+                "name": ["Produit9"],
+                "quantity": [1],
+                "unit_price": [9.0],
+                "category": ["Cat9"],
+            }
+        ).to_csv(other_file, index=False)
+        self.new_manager().consolidate_files()
+
+        with open(other_file, "a", encoding="utf-8") as f:
+            f.write("Produit10,2,10.0,Cat9\n")
+
+        manager = self.new_manager()
+        with mock.patch.object(
+            FileHandler, "read_csv_file", wraps=FileHandler.read_csv_file
+        ) as read_csv_file:
+            manager.consolidate_files()
+        read_csv_file.assert_called_once_with(other_file.resolve())
+        self.assertEqual(len(manager.inventory_df), 4)
+
+    def test_incremental_pass_saves_manifest_only(self):
+        """Test qu'une mise à jour n'écrit que le manifeste et le fragment."""
+        manager = self.new_manager()
+        manager.consolidate_files()
+
+        with open(self.csv_file, "a", encoding="utf-8") as f:
+            f.write("Produit3,1,30.0,Cat1\n")
+        with mock.patch.object(
+            InventoryCache, "save", wraps=manager.cache.save
+        ) as save, mock.patch.object(
+            InventoryCache, "save_fragment", wraps=manager.cache.save_fragment
+        ) as save_fragment:
+            manager.consolidate_files()
+        save.assert_not_called()
+        save_fragment.assert_called_once()
+
+        # Le processus suivant reconstruit l'inventaire depuis les fragments,
+        # sans relire les CSV, puis le réenregistre
+        other = self.new_manager()
+        with mock.patch.object(FileHandler, "read_csv_file") as read_csv_file:
+            other.consolidate_files()
+        read_csv_file.assert_not_called()
+        pd.testing.assert_frame_equal(other.inventory_df, manager.inventory_df)
+        self.assertIsNotNone(
+            other.cache.load(other.cache.build_manifest([self.csv_file]))
+        )
+
+    def test_options_and_version_checked(self):
+        """Test qu'un cache d'une autre version ou d'autres options est ignoré."""
+        cache = InventoryCache(str(self.cache_dir), options={"pyarrow_strings": False})
+        manifest = cache.build_manifest(FileHandler.list_csv_files(self.data_dir))
+        cache.save(pd.read_csv(self.csv_file), manifest)
+
+        other = InventoryCache(str(self.cache_dir), options={"pyarrow_strings": True})
+        self.assertIsNone(other.load(manifest))
+
+        with mock.patch("inventory_manager.utils.cache.CACHE_FORMAT_VERSION", 0):
+            self.assertIsNone(cache.load(manifest))
+        self.assertIsNotNone(cache.load(manifest))
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "permissions POSIX requises")
+    def test_shared_pickle_refused(self):
+        """Test qu'un pickle modifiable par d'autres utilisateurs est refusé."""
+        cache = InventoryCache(str(self.cache_dir))
+        cache.format = "pickle"
+        manifest = cache.build_manifest(FileHandler.list_csv_files(self.data_dir))
+        cache.save(pd.read_csv(self.csv_file), manifest)
+
+        os.chmod(self.cache_dir / "inventory.pickle", 0o666)
+        self.assertIsNone(cache.load(manifest))
+
+    def test_default_directory_outside_data_dir(self):
+        """Test que le cache par défaut est hors du répertoire de données."""
+        with mock.patch.dict(os.environ, {"INVENTORY_CACHE_DIR": str(self.cache_dir)}):
+            directory = default_cache_directory(str(self.data_dir))
+            self.assertEqual(directory.parent, self.cache_dir)
+            self.assertNotEqual(directory, default_cache_directory(str(self.temp_dir)))
+        self.assertNotIn(self.data_dir.resolve(), directory.resolve().parents)
+
+
+if __name__ == "__main__":
+    unittest.main()
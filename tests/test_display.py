@@ -0,0 +1,107 @@
+import io
+import unittest
+
+import pandas as pd
+from rich.console import Console
+
+from inventory_manager.models.report import ReportResult
+from main import RENDER_CHUNK_SIZE, display_results, render_report
+
+
+def make_results(rows):
+    """Résultats de recherche synthétiques."""
+    return pd.DataFrame(
+        {
+            "name": [f"Produit {i}" for i in range(rows)],
+            "quantity": range(rows),
+            "unit_price": [i + 0.5 for i in range(rows)],
+            "category": pd.Categorical(["Books", "Electronics"] * (rows // 2)),
+        }
+    )
+
+
+def render(df, **kwargs):
+    """Affiche df dans une console en mémoire et retourne le texte produit."""
+    output = io.StringIO()
+    display_results(df, console=Console(file=output, width=200), **kwargs)
+    return output.getvalue()
+
+
+class TestDisplayResults(unittest.TestCase):
+    def test_small_results_use_table(self):
+        """Test que les petits résultats sont affichés dans un tableau rich."""
+        text = render(make_results(4), title="Liste")
+        self.assertIn("┃ name", text)
+        self.assertIn("Produit 3", text)
+        self.assertIn("Total: 4 produits", text)
+
+    def test_large_results_are_streamed(self):
+        """Test que les grands résultats sont écrits ligne à ligne, alignés."""
+        rows = RENDER_CHUNK_SIZE * 2 + 10
+        lines = render(make_results(rows)).splitlines()
+
+        self.assertEqual(
+            lines[0].split(), ["name", "quantity", "unit_price", "category"]
+        )
+        body = lines[2 : 2 + rows]
+        self.assertEqual(body[0].split(), ["Produit", "0", "0", "0.5", "Books"])
+        self.assertEqual(body[-1].split()[:2], ["Produit", str(rows - 1)])
+        # Colonnes alignées d'un bloc à l'autre
+        self.assertEqual(body[0].index("0.5"), body[-1].index(f"{rows - 1}.5"))
+        self.assertIn(f"Total: {rows} produits", lines[-1])
+
+    def test_limit_and_offset(self):
+        """Test de la pagination des résultats."""
+        text = render(make_results(10), limit=3, offset=4)
+        self.assertIn("Produit 4", text)
+        self.assertIn("Produit 6", text)
+        self.assertNotIn("Produit 3 ", text)
+        self.assertNotIn("Produit 7", text)
+        self.assertIn("Lignes 5-7 sur 10 produits", text)
+
+    def test_offset_past_end(self):
+        """Test d'un décalage au-delà des résultats."""
+        self.assertIn("Aucun résultat après", render(make_results(4), offset=10))
+
+    def test_negative_limit(self):
+        """Test qu'une limite négative est refusée."""
+        with self.assertRaises(ValueError):
+            render(make_results(4), limit=-1)
+
+
+class TestRenderReport(unittest.TestCase):
+    def test_tables_in_report_order(self):
+        """Test d'un tableau par catégorie, dans l'ordre du rapport."""
+        result = ReportResult(
+            totals={
+                "count": 1234,
+                "categories": 2,
+                "stock_value": 98765.432,
+                "mean_price": 12.5,
+                "low_stock": 3,
+            },
+            categories=pd.DataFrame(
+                {
+                    "count": [1000, 234],
+                    "stock_value": [90000.0, 8765.432],
+                    "mean_price": [10.0, 22.75],
+                    "total_quantity": [5000, 700],
+                },
+                index=pd.Index(["Zèbre - Savane", "Abeille"], name="category"),
+            ),
+        )
+        output = io.StringIO()
+        render_report(result, console=Console(file=output, width=120))
+        text = output.getvalue()
+
+        self.assertIn("1,234 ", text)
+        self.assertIn("98,765.43", text)
+        self.assertLess(
+            text.index("Statistiques Zèbre - Savane"),
+            text.index("Statistiques Abeille"),
+        )
+        self.assertIn("22.75", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from importlib.util import find_spec
+from unittest.mock import patch
+
+import pandas as pd
+
+from inventory_manager.utils.exporters import export_frame
+
+
+class TestExporters(unittest.TestCase):
+    def setUp(self):
+        """Préparation des données de test."""
+        self.df = pd.DataFrame(
+            {
+                "name": ["Écran", "Clavier", "Souris", "Livre"],
+                "quantity": [5, 0, 12, 3],
+                "unit_price": [199.99, 49.5, 19.0, 12.25],
+                "category": pd.Categorical(
+                    ["Electronics", "Electronics", "Electronics", "Books"]
+                ),
+            }
+        )
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Nettoyage après les tests."""
+        shutil.rmtree(self.test_dir)
+
+    def test_csv_in_chunks(self):
+        """Test que l'export CSV par blocs n'écrit l'en-tête qu'une fois."""
+        output = os.path.join(self.test_dir, "out.csv")
+        export_frame(self.df, "csv", output, chunksize=3)
+
+        result = pd.read_csv(output)
+        self.assertEqual(result["name"].tolist(), self.df["name"].tolist())
+        self.assertEqual(result["unit_price"].tolist(), [199.99, 49.5, 19.0, 12.25])
+
+    def test_jsonl_to_stdout(self):
+        """Test de l'export JSON Lines sur la sortie standard."""
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            export_frame(self.df, "jsonl", chunksize=1)
+
+        records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(len(records), 4)
+        self.assertEqual(
+            records[0],
+            {
+                "name": "Écran",
+                "quantity": 5,
+                "unit_price": 199.99,
+                "category": "Electronics",
+            },
+        )
+
+    def test_empty_csv_keeps_header(self):
+        """Test qu'un export CSV vide contient l'en-tête."""
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            export_frame(self.df.iloc[:0], "csv")
+        self.assertEqual(stdout.getvalue(), "name,quantity,unit_price,category\n")
+
+    def test_parquet_requires_file(self):
+        """Test que le format parquet exige un fichier de sortie."""
+        with self.assertRaises(ValueError):
+            export_frame(self.df, "parquet")
+
+    def test_unknown_format(self):
+        """Test d'un format d'export inconnu."""
+        with self.assertRaises(ValueError):
+            export_frame(self.df, "xml")
+
+    @unittest.skipUnless(find_spec("pyarrow"), "pyarrow non installé")
+    def test_parquet_in_row_groups(self):
+        """Test de l'export Parquet par groupes de lignes."""
+        output = os.path.join(self.test_dir, "out.parquet")
+        export_frame(self.df, "parquet", output, chunksize=3)
+        pd.testing.assert_frame_equal(pd.read_parquet(output), self.df)
+
+
+if __name__ == "__main__":
+    unittest.main()
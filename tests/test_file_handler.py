@@ -43,6 +43,48 @@ class TestFileHandler(unittest.TestCase):
         self.assertIsNotNone(df)
         self.assertEqual(len(df), 2)  # Seulement les données du fichier valide
 
+    def test_read_csv_files_parallel(self):
+        """Test de la lecture parallèle : même résultat qu'en séquentiel."""
+        for i in range(5):
+            pd.DataFrame(
+                {
+                    "name": ["Product1", f"Product{i + 10}"],
+                    "quantity": [i, i + 1],
+                    "unit_price": [1.0 + i, 2.0 + i],
+                    "category": ["Cat1", "Cat3"],
+                }
+            ).to_csv(Path(self.temp_dir) / f"extra_{i}.csv", index=False)
+
+        serial = FileHandler.read_csv_files(self.temp_dir)
+        parallel = FileHandler.read_csv_files(self.temp_dir, jobs=4)
+        pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_optimize_dtypes(self):
+        """Test de la conversion vers des types compacts."""
+        df = FileHandler.read_csv_files(self.temp_dir)
+        optimized = FileHandler.optimize_dtypes(df)
+
+        self.assertEqual(optimized["category"].dtype, "category")
+        self.assertEqual(optimized["quantity"].dtype, "int8")
+        self.assertEqual(optimized["unit_price"].dtype, "float64")
+        pd.testing.assert_frame_equal(
+            optimized.astype({"category": str, "quantity": "int64"}), df
+        )
+
+    def test_read_csv_files_rejects_invalid_rows(self):
+        """Test du rejet des lignes invalides à la lecture."""
+        with open(Path(self.temp_dir) / "bad.csv", "w", encoding="utf-8") as f:
+            f.write("name,quantity,unit_price,category\n")
+            f.write("Product4,-3,10.0,Cat1\n")
+            f.write(" ,1,10.0,Cat1\n")
+            f.write("Product5,2,abc,Cat1\n")
+            f.write("Product6,2,1.5,Cat1\n")
+
+        with self.assertLogs(level="WARNING") as logs:
+            df = FileHandler.read_csv_files(self.temp_dir)
+        self.assertEqual(len(df), 3)
+        self.assertIn("3 ligne(s) rejetée(s)", "\n".join(logs.output))
+
     def test_read_nonexistent_directory(self):
         """Test de la lecture d'un répertoire inexistant."""
         df = FileHandler.read_csv_files("/nonexistent/directory")
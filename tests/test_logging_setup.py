@@ -0,0 +1,49 @@
+import logging
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from inventory_manager.utils import logging_setup
+
+
+class TestLoggingSetup(unittest.TestCase):
+    def setUp(self):
+        """Isole le logger racine le temps du test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = logging.getLogger()
+        self.saved_handlers = self.root.handlers[:]
+        self.saved_level = self.root.level
+        self.root.handlers = []
+
+    def tearDown(self):
+        """Restaure le logger racine."""
+        logging_setup.flush_logging()
+        for handler in self.root.handlers:
+            handler.close()
+        self.root.handlers = self.saved_handlers
+        self.root.setLevel(self.saved_level)
+        shutil.rmtree(self.temp_dir)
+
+    def test_queued_logging(self):
+        """Test que les messages passent par la file et arrivent dans le fichier."""
+        log_file = Path(self.temp_dir) / "test.log"
+        listener = logging_setup.setup_logging(str(log_file))
+
+        self.assertIsNotNone(listener)
+        self.assertIsInstance(self.root.handlers[0], logging.handlers.QueueHandler)
+
+        logging.warning("message de test")
+        logging_setup.flush_logging()
+        self.assertIn("WARNING - message de test", log_file.read_text())
+
+    def test_already_configured(self):
+        """Test qu'un logging déjà configuré n'est pas modifié."""
+        handler = logging.NullHandler()
+        self.root.addHandler(handler)
+        self.assertIsNone(logging_setup.setup_logging())
+        self.assertEqual(self.root.handlers, [handler])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,8 +2,11 @@ import unittest
 import pandas as pd
 import tempfile
 import os
+import tracemalloc
 from pathlib import Path
+from unittest import mock
 from inventory_manager.core.manager import InventoryManager
+from inventory_manager.utils.file_handler import FileHandler
 
 
 class TestInventoryManager(unittest.TestCase):
@@ -37,6 +40,58 @@ class TestInventoryManager(unittest.TestCase):
         self.assertIsNotNone(self.manager.inventory_df)
         self.assertEqual(len(self.manager.inventory_df), 3)
 
+    def test_compact_dtypes(self):
+        """Test des types compacts de l'inventaire consolidé."""
+        self.manager.consolidate_files()
+        df = self.manager.inventory_df
+        self.assertIsInstance(df["category"].dtype, pd.CategoricalDtype)
+        self.assertEqual(df["quantity"].dtype, "int8")
+        self.assertEqual(df["unit_price"].dtype, "float64")
+
+        memory = self.manager.memory_report()
+        self.assertEqual(list(memory.columns), ["avant", "après"])
+        self.assertLess(memory["après"].sum(), memory["avant"].sum())
+
+    def test_incremental_consolidation(self):
+        """Test de la consolidation incrémentale (ajout, modification, suppression)."""
+        self.manager.consolidate_files()
+        pd.DataFrame(
+            {
+                "name": ["Produit1", "Produit4"],
+                "quantity": [99, 4],
+                "unit_price": [100.0, 400.0],
+                "category": ["Cat1", "Cat2"],
+            }
+        ).to_csv(Path(self.temp_dir) / "z_update.csv", index=False)
+
+        with mock.patch.object(
+            FileHandler, "read_csv_file", wraps=FileHandler.read_csv_file
+        ) as read_csv_file:
+            self.manager.consolidate_files()
+        read_csv_file.assert_called_once()
+
+        # Le dernier fichier gagne pour les doublons (name, category)
+        df = self.manager.inventory_df.set_index("name")
+        self.assertEqual(len(df), 4)
+        self.assertEqual(df.loc["Produit1", "quantity"], 99)
+
+        # Sans changement, aucun fichier n'est relu
+        with mock.patch.object(FileHandler, "read_csv_file") as read_csv_file:
+            self.manager.consolidate_files()
+        read_csv_file.assert_not_called()
+
+        # Suppression d'un fichier : ses lignes disparaissent
+        (Path(self.temp_dir) / "z_update.csv").unlink()
+        self.manager.consolidate_files()
+        df = self.manager.inventory_df.set_index("name")
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df.loc["Produit1", "quantity"], 10)
+
+    def test_invalid_jobs(self):
+        """Test du refus d'un nombre de jobs invalide."""
+        with self.assertRaises(ValueError):
+            InventoryManager(self.temp_dir, jobs=0)
+
     def test_search_products(self):
         """Test de la recherche de produits."""
         self.manager.consolidate_files()
@@ -49,6 +104,91 @@ class TestInventoryManager(unittest.TestCase):
         results = self.manager.search_products(category="Cat1")
         self.assertEqual(len(results), 2)
 
+    def test_search_indexes_match_full_scan(self):
+        """Test des index secondaires : mêmes résultats qu'un parcours complet."""
+        pd.DataFrame(
+            {
+                "name": [f"Article{i}" for i in range(40)],
+                "quantity": list(range(40)),
+                "unit_price": [float((i * 37) % 50) for i in range(40)],
+                "category": [f"Cat{i % 3}" for i in range(40)],
+            }
+        ).to_csv(Path(self.temp_dir) / "more.csv", index=False)
+        self.manager.consolidate_files()
+        df = self.manager.inventory_df
+        indexed = InventoryManager(self.temp_dir)
+        indexed.build_indexes = True
+        indexed.consolidate_files()
+
+        for criteria in [
+            {"category": "Cat1"},
+            {"min_price": 10.0},
+            {"max_price": 20.0},
+            {"min_price": 10.0, "max_price": 30.0},
+            {"category": "Cat2", "min_price": 5.0, "max_price": 40.0},
+            {"name": "article1", "max_price": 25.0},
+            {"category": "Inconnue"},
+        ]:
+            expected = df
+            if "name" in criteria:
+                expected = expected[
+                    expected["name"].str.contains(criteria["name"], case=False)
+                ]
+            if "category" in criteria:
+                expected = expected[expected["category"] == criteria["category"]]
+            if "min_price" in criteria:
+                expected = expected[expected["unit_price"] >= criteria["min_price"]]
+            if "max_price" in criteria:
+                expected = expected[expected["unit_price"] <= criteria["max_price"]]
+
+            # Sans index (requête isolée) puis avec les index secondaires
+            for manager in (self.manager, indexed):
+                results = manager.search_products(**criteria)
+                pd.testing.assert_frame_equal(
+                    results, expected, obj=f"{criteria} {manager.build_indexes}"
+                )
+
+    def test_search_by_name_index(self):
+        """Test de la recherche par nom sans accents et approchée."""
+        pd.DataFrame(
+            {
+                "name": ["Écouteurs Sony", "Écran Dell"],
+                "quantity": [3, 4],
+                "unit_price": [250.0, 150.0],
+                "category": ["Cat2", "Cat2"],
+            }
+        ).to_csv(Path(self.temp_dir) / "audio.csv", index=False)
+        self.manager.consolidate_files()
+
+        results = self.manager.search_products(name="ecouteurs")
+        self.assertEqual(list(results["name"]), ["Écouteurs Sony"])
+
+        results = self.manager.search_products(name="ecoutuers", fuzzy=True)
+        self.assertEqual(results["name"].iloc[0], "Écouteurs Sony")
+
+        results = self.manager.search_products(
+            name="ecran", fuzzy=True, max_price=100.0
+        )
+        self.assertTrue(results.empty)
+
+    def test_search_indexes_invalidated(self):
+        """Test de l'invalidation des index lors d'une nouvelle consolidation."""
+        self.manager.consolidate_files()
+        self.assertEqual(len(self.manager.search_products(category="Cat2")), 1)
+
+        pd.DataFrame(
+            {
+                "name": ["Produit4"],
+                "quantity": [1],
+                "unit_price": [250.0],
+                "category": ["Cat2"],
+            }
+        ).to_csv(Path(self.temp_dir) / "new.csv", index=False)
+        self.manager.consolidate_files()
+
+        self.assertEqual(len(self.manager.search_products(category="Cat2")), 2)
+        self.assertEqual(len(self.manager.search_products(min_price=210.0)), 2)
+
     def test_generate_report(self):
         """Test de la génération de rapport."""
         self.manager.consolidate_files()
@@ -56,6 +196,109 @@ class TestInventoryManager(unittest.TestCase):
         self.manager.generate_report(str(report_file))
         self.assertTrue(report_file.exists())
 
+    def test_report_category_stats(self):
+        """Test du contenu et de l'ordre des statistiques par catégorie."""
+        self.manager.consolidate_files()
+        report_file = Path(self.temp_dir) / "report.csv"
+        self.manager.generate_report(str(report_file))
+
+        report = pd.read_csv(report_file).set_index("Métrique")["Valeur"]
+        self.assertEqual(
+            list(report.index[5:]),
+            [
+                f"{category} - {metric}"
+                for category in ["Cat1", "Cat2"]
+                for metric in [
+                    "Nombre de produits",
+                    "Valeur totale",
+                    "Prix moyen",
+                    "Stock total",
+                ]
+            ],
+        )
+        self.assertEqual(report["Cat1 - Nombre de produits"], 2)
+        self.assertAlmostEqual(report["Cat1 - Valeur totale"], 10000.0)
+        self.assertAlmostEqual(report["Cat1 - Prix moyen"], 200.0)
+        self.assertEqual(report["Cat1 - Stock total"], 40)
+
+    def test_report_result(self):
+        """Test du rapport structuré, sans fichier, catégories « - » comprises."""
+        pd.DataFrame(
+            {
+                "name": ["Produit4"],
+                "quantity": [5],
+                "unit_price": [50.0],
+                "category": ["Maison - Jardin"],
+            }
+        ).to_csv(Path(self.temp_dir) / "update.csv", index=False)
+        self.manager.consolidate_files()
+
+        result = self.manager.generate_report()
+        self.assertFalse((Path(self.temp_dir) / "report.csv").exists())
+        self.assertEqual(result.totals["count"], 4)
+        self.assertEqual(result.totals["low_stock"], 1)
+        self.assertEqual(
+            list(result.categories.index), ["Cat1", "Cat2", "Maison - Jardin"]
+        )
+        self.assertEqual(result.categories.loc["Maison - Jardin", "count"], 1)
+        self.assertAlmostEqual(result.categories.loc["Cat1", "mean_price"], 200.0)
+
+        restored = type(result).from_dict(result.to_dict())
+        pd.testing.assert_frame_equal(restored.to_frame(), result.to_frame())
+
+    def test_generate_report_streaming(self):
+        """Test du rapport en streaming : identique au rapport en mémoire."""
+        pd.DataFrame(
+            {
+                "name": ["Produit1", "Produit4", "Produit5"],
+                "quantity": [7, 4, 12],
+                "unit_price": [110.5, 40.25, 3.3],
+                "category": ["Cat1", "Cat3", "Cat1"],
+            }
+        ).to_csv(Path(self.temp_dir) / "update.csv", index=False)
+
+        memory_report = Path(self.temp_dir) / "memory.csv"
+        stream_report = Path(self.temp_dir) / "stream.csv"
+        self.manager.consolidate_files()
+        self.manager.generate_report(str(memory_report))
+        self.manager.generate_report_streaming(str(stream_report), chunksize=2)
+
+        self.assertEqual(memory_report.read_bytes(), stream_report.read_bytes())
+
+    def test_generate_report_streaming_memory(self):
+        """Test que le rapport en streaming ne charge pas tout l'inventaire."""
+        rows = 60_000
+        pd.DataFrame(
+            {
+                "name": [f"Produit{i % 500}" for i in range(rows)],
+                "quantity": [i % 50 for i in range(rows)],
+                "unit_price": [float(i % 300) for i in range(rows)],
+                "category": [f"Cat{i % 7}" for i in range(rows)],
+            }
+        ).to_csv(Path(self.temp_dir) / "large.csv", index=False)
+
+        def peak(func):
+            tracemalloc.start()
+            try:
+                result = func()
+                return result, tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        def in_memory():
+            self.manager.consolidate_files()
+            return self.manager.generate_report()
+
+        expected, memory_peak = peak(in_memory)
+        result, stream_peak = peak(
+            lambda: InventoryManager(self.temp_dir).generate_report_streaming(
+                chunksize=2_000
+            )
+        )
+
+        self.assertEqual(result.totals["count"], expected.totals["count"])
+        self.assertLess(stream_peak, memory_peak / 4)
+
     def test_stock_alerts(self):
         """Test du système d'alertes de stock."""
         test_data = pd.DataFrame(
@@ -97,3 +340,54 @@ class TestInventoryManager(unittest.TestCase):
             self.manager.set_stock_threshold(-5)
         with self.assertRaises(ValueError):
             self.manager.set_stock_threshold("invalid")
+
+    def test_stock_alert_logging(self):
+        """Test des messages d'alerte, du récapitulatif et du fichier d'alertes."""
+        self.manager.consolidate_files()
+        self.manager.set_stock_threshold(20)
+
+        with self.assertLogs(level="WARNING") as logs:
+            alerts = self.manager.check_stock_alerts()
+        self.assertEqual(
+            alerts,
+            [
+                "ALERTE: Stock bas pour Produit1 (10 unités restantes, seuil: 20)",
+                "ALERTE: Stock bas pour Produit2 (20 unités restantes, seuil: 20)",
+            ],
+        )
+        self.assertEqual(len(logs.records), 2)
+
+        alert_file = Path(self.temp_dir) / "alerts.jsonl"
+        with self.assertLogs(level="WARNING") as logs:
+            summary_alerts = self.manager.check_stock_alerts(
+                summary=True, alert_file=str(alert_file)
+            )
+        self.assertEqual(summary_alerts, alerts)
+        self.assertEqual(
+            [record.getMessage() for record in logs.records],
+            ["2 alerte(s) de stock bas (seuil: 20)"],
+        )
+        records = pd.read_json(alert_file, lines=True)
+        self.assertEqual(records["name"].tolist(), ["Produit1", "Produit2"])
+        self.assertEqual(records["threshold"].tolist(), [20, 20])
+
+    def test_category_and_product_thresholds(self):
+        """Test des seuils par catégorie et par produit."""
+        self.manager.consolidate_files()
+        self.manager.set_stock_threshold(5)
+        self.manager.set_stock_threshold(25, category="Cat2")
+        self.manager.set_stock_threshold(10, product="Produit1")
+
+        low_stock = self.manager.get_low_stock_products(with_thresholds=True)
+        self.assertEqual(low_stock["name"].tolist(), ["Produit1", "Produit2"])
+        self.assertEqual(low_stock["threshold"].tolist(), [10, 25])
+        self.assertEqual(
+            self.manager.check_stock_alerts()[1],
+            "ALERTE: Stock bas pour Produit2 (20 unités restantes, seuil: 25)",
+        )
+        with self.assertLogs(level="WARNING") as logs:
+            self.manager.check_stock_alerts(summary=True)
+        self.assertEqual(
+            logs.records[0].getMessage(),
+            "2 alerte(s) de stock bas (seuils: 10 à 25)",
+        )
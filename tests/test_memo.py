@@ -0,0 +1,156 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from inventory_manager.core.manager import InventoryManager
+from inventory_manager.core.sqlite_manager import SQLiteInventoryManager
+from inventory_manager.utils.memo import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    def test_lru_eviction_and_counters(self):
+        """Test de l'éviction du résultat le moins récemment utilisé."""
+        cache = ResultCache(maxsize=2)
+        cache.get("a", lambda: 1)
+        cache.get("b", lambda: 2)
+        self.assertEqual(cache.get("a", lambda: -1), 1)
+        cache.get("c", lambda: 3)
+
+        self.assertEqual(cache.get("b", lambda: 20), 20)
+        self.assertEqual(
+            cache.stats(), {"hits": 1, "misses": 4, "size": 2, "maxsize": 2}
+        )
+
+    def test_errors_are_not_cached(self):
+        """Test qu'un calcul en échec n'est pas conservé."""
+        cache = ResultCache()
+
+        def fail():
+            raise ValueError("échec")
+
+        with self.assertRaises(ValueError):
+            cache.get("a", fail)
+        self.assertEqual(cache.get("a", lambda: 1), 1)
+        self.assertEqual(len(cache), 1)
+
+    def test_zero_size_disables_cache(self):
+        """Test qu'une taille nulle ne conserve aucun résultat."""
+        cache = ResultCache(maxsize=0)
+        cache.get("a", lambda: 1)
+        cache.get("a", lambda: 1)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 2, 0))
+
+        with self.assertRaises(ValueError):
+            ResultCache(maxsize=-1)
+
+
+class TestManagerMemoization(unittest.TestCase):
+    def setUp(self):
+        """Préparation des tests avec des données temporaires."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.write_data([5, 20, 8])
+
+    def tearDown(self):
+        """Nettoyage après les tests."""
+        shutil.rmtree(self.temp_dir)
+
+    def write_data(self, quantities):
+        """Écrit le fichier CSV de test."""
+        pd.DataFrame(
+            {
+                "name": ["Produit1", "Produit2", "Produit3"],
+                "quantity": quantities,
+                "unit_price": [10.0, 20.0, 30.0],
+                "category": ["Cat1", "Cat2", "Cat1"],
+            }
+        ).to_csv(Path(self.temp_dir) / "test.csv", index=False)
+
+    def test_repeated_queries_hit_cache(self):
+        """Test que les requêtes répétées sont servies par le cache."""
+        for backend in (InventoryManager, SQLiteInventoryManager):
+            with self.subTest(backend=backend.__name__):
+                manager = backend(self.temp_dir)
+                manager.consolidate_files()
+
+                first = manager.search_products(category="Cat1")
+                manager.get_low_stock_products()
+                manager.generate_report()
+                misses = manager.memo_stats()["misses"]
+
+                second = manager.search_products(category="Cat1")
+                manager.get_low_stock_products()
+                report = manager.generate_report()
+
+                pd.testing.assert_frame_equal(first, second)
+                self.assertEqual(report.totals["count"], 3)
+                stats = manager.memo_stats()
+                self.assertEqual((stats["hits"], stats["misses"]), (3, misses))
+
+    def test_threshold_change_invalidates_low_stock(self):
+        """Test que le stock bas suit les seuils, quelle que soit leur source."""
+        manager = InventoryManager(self.temp_dir)
+        manager.consolidate_files()
+        self.assertEqual(len(manager.get_low_stock_products()), 2)
+
+        manager.set_stock_threshold(5)
+        self.assertEqual(len(manager.get_low_stock_products()), 1)
+
+        manager.category_thresholds["Cat2"] = 50
+        self.assertEqual(len(manager.get_low_stock_products()), 2)
+
+    def test_consolidation_bumps_version(self):
+        """Test qu'une reconsolidation expire les résultats mémorisés."""
+        manager = InventoryManager(self.temp_dir)
+        manager.consolidate_files()
+        version = manager.data_version
+        self.assertEqual(len(manager.get_low_stock_products()), 2)
+
+        self.write_data([50, 50, 1])
+        manager.consolidate_files()
+
+        self.assertGreater(manager.data_version, version)
+        self.assertEqual(
+            manager.get_low_stock_products()["name"].tolist(), ["Produit3"]
+        )
+
+    def test_results_are_isolated_from_callers(self):
+        """Test qu'un appelant ne peut pas altérer un résultat mémorisé."""
+        manager = InventoryManager(self.temp_dir)
+        manager.consolidate_files()
+
+        low_stock = manager.get_low_stock_products(with_thresholds=True)
+        low_stock.pop("threshold")
+        low_stock["note"] = "x"
+
+        self.assertEqual(
+            list(manager.get_low_stock_products(with_thresholds=True).columns),
+            ["name", "quantity", "unit_price", "category", "threshold"],
+        )
+
+    def test_clear_memo(self):
+        """Test que les résultats oubliés sont recalculés, même version."""
+        manager = InventoryManager(self.temp_dir)
+        manager.consolidate_files()
+        manager.generate_report()
+        version = manager.data_version
+
+        manager.clear_memo()
+        manager.generate_report()
+
+        stats = manager.memo_stats()
+        self.assertEqual((stats["hits"], stats["version"]), (0, version))
+
+    def test_stock_values(self):
+        """Test de la colonne dérivée valeur en stock."""
+        manager = InventoryManager(self.temp_dir)
+        manager.consolidate_files()
+        self.assertEqual(manager.stock_values().tolist(), [50.0, 400.0, 240.0])
+        manager.stock_values()
+        self.assertEqual(manager.memo_stats()["hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
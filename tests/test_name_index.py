@@ -0,0 +1,55 @@
+import unittest
+
+from inventory_manager.core.name_index import NameIndex, normalize_name, scan_names
+
+
+class TestNameIndex(unittest.TestCase):
+    def setUp(self):
+        """Initialisation d'un index sur quelques noms."""
+        self.names = [
+            "Écouteurs Sony WF-1000XM4",
+            "Smartphone Samsung Galaxy A53",
+            "Canapé 3 places",
+            "Chaise Ergonomique",
+            "Écran 27 pouces",
+        ]
+        self.index = NameIndex(self.names)
+
+    def test_normalize_name(self):
+        """Test de la normalisation (casse et accents)."""
+        self.assertEqual(normalize_name("Écouteurs"), "ecouteurs")
+        self.assertEqual(normalize_name("CANAPÉ"), "canape")
+
+    def test_search_accent_insensitive(self):
+        """Test de la recherche sans accents ni casse."""
+        self.assertEqual(list(self.index.search("ecouteurs")), [0])
+        self.assertEqual(list(self.index.search("CANAPE")), [2])
+        self.assertEqual(list(self.index.search("écr")), [4])
+
+    def test_search_substring(self):
+        """Test de la recherche de sous-chaînes, courtes ou absentes."""
+        self.assertEqual(list(self.index.search("sung gal")), [1])
+        self.assertEqual(list(self.index.search("a")), [1, 2, 3, 4])
+        self.assertEqual(list(self.index.search("introuvable")), [])
+
+    def test_fuzzy_search(self):
+        """Test de la recherche approchée avec fautes de frappe."""
+        rows, scores = self.index.fuzzy_search("ecuteurs sonny")
+        self.assertEqual(rows[0], 0)
+        self.assertTrue(all(scores[:-1] >= scores[1:]))
+
+        rows, _ = self.index.fuzzy_search("chaize ergonomik")
+        self.assertEqual(rows[0], 3)
+
+    def test_scan_matches_index(self):
+        """Test du parcours sans index : mêmes résultats que l'index."""
+        for query in ("ecouteurs", "CANAPE", "écr", "sung gal", "a", "introuvable"):
+            with self.subTest(query=query):
+                self.assertEqual(
+                    list(scan_names(self.names, query)),
+                    list(self.index.search(query)),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
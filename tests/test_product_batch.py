@@ -0,0 +1,73 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from inventory_manager.models.product import Product
+from inventory_manager.models.product_batch import ProductBatch
+
+
+class TestProductBatch(unittest.TestCase):
+    def setUp(self):
+        """Initialisation d'un lot de test."""
+        self.products = [
+            Product("Produit1", 10, 100.0, "Cat1"),
+            Product("Produit2", 3, 20.5, "Cat2"),
+            Product("Produit3", 0, 7.25, "Cat1"),
+        ]
+        self.batch = ProductBatch.from_products(self.products)
+
+    def test_product_slots(self):
+        """Test que Product n'a pas de __dict__."""
+        self.assertFalse(hasattr(self.products[0], "__dict__"))
+
+    def test_from_products(self):
+        """Test de l'aller-retour avec une liste de Product."""
+        self.assertEqual(len(self.batch), 3)
+        self.assertEqual(self.batch.categories, ["Cat1", "Cat2"])
+        self.assertEqual(self.batch.to_products(), self.products)
+
+    def test_iteration_reuses_view(self):
+        """Test du parcours avec une vue unique."""
+        views = {id(view) for view in self.batch}
+        self.assertEqual(len(views), 1)
+        self.assertEqual(
+            [view.to_dict() for view in self.batch],
+            [product.to_dict() for product in self.products],
+        )
+        self.assertEqual(self.batch[-1].category, "Cat1")
+        with self.assertRaises(IndexError):
+            self.batch[3]
+
+    def test_frame_round_trip_without_copy(self):
+        """Test de la conversion depuis et vers l'inventaire sans copie."""
+        df = pd.DataFrame(
+            {
+                "name": ["A", "B"],
+                "quantity": np.array([1, 2], dtype=np.int8),
+                "unit_price": [1.5, 2.5],
+                "category": pd.Categorical(["X", "Y"]),
+            }
+        )
+        batch = ProductBatch.from_frame(df)
+        self.assertTrue(np.shares_memory(batch.unit_prices, df["unit_price"]))
+        self.assertTrue(np.shares_memory(batch.quantities, df["quantity"]))
+
+        frame = batch.to_frame()
+        self.assertTrue(np.shares_memory(frame["unit_price"], batch.unit_prices))
+        pd.testing.assert_frame_equal(frame, df, check_dtype=False)
+
+    def test_mismatched_lengths(self):
+        """Test du refus de colonnes de longueurs différentes."""
+        with self.assertRaises(ValueError):
+            ProductBatch(
+                np.array(["A"], dtype=object),
+                np.array([1, 2]),
+                np.array([1.0]),
+                np.array([0]),
+                ["X"],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
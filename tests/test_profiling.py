@@ -0,0 +1,111 @@
+import json
+import os
+import pstats
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from inventory_manager.core.manager import InventoryManager
+from inventory_manager.utils import profiling
+from inventory_manager.utils.profiling import (
+    disable_profiling,
+    enable_profiling,
+    profiled,
+    timed,
+)
+
+
+@profiled("double")
+def double(value):
+    """Fonction chronométrée des tests."""
+    return value * 2
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        """Préparation des tests avec des données temporaires."""
+        self.temp_dir = tempfile.mkdtemp()
+        for name, category in (("a.csv", "Cat1"), ("b.csv", "Cat2")):
+            pd.DataFrame(
+                {
+                    "name": ["Produit1", "Produit2"],
+                    "quantity": [5, 20],
+                    "unit_price": [10.0, 20.0],
+                    "category": [category, category],
+                }
+            ).to_csv(Path(self.temp_dir) / name, index=False)
+
+    def tearDown(self):
+        """Nettoyage après les tests."""
+        disable_profiling()
+        shutil.rmtree(self.temp_dir)
+
+    def test_disabled_costs_nothing(self):
+        """Test que, désactivé, rien n'est mesuré ni alloué."""
+        self.assertIsNone(profiling.get_profiler())
+        self.assertIs(timed("a"), timed("b"))
+        self.assertEqual(double(2), 4)
+        self.assertIsNone(disable_profiling())
+
+    def test_stages(self):
+        """Test du cumul des étapes, de leur détail et de l'imbrication."""
+        profiler = enable_profiling(memory=False)
+        double(1)
+        double(2)
+        with timed("outer", "x"):
+            with timed("outer"):
+                pass
+        disable_profiling()
+
+        stages = {stage["stage"]: stage for stage in profiler.metrics()["stages"]}
+        self.assertEqual(stages["double"]["calls"], 2)
+        self.assertEqual(stages["outer"]["calls"], 1)
+        self.assertEqual(list(stages["outer"]["details"]), ["x"])
+        self.assertIsNone(profiler.metrics()["peak_memory_bytes"])
+        self.assertIsNone(profiling.get_profiler())
+
+    def test_manager_stages_and_exports(self):
+        """Test des étapes du gestionnaire et des exports JSON et cProfile."""
+        profiler = enable_profiling(cprofile=True)
+        manager = InventoryManager(self.temp_dir)
+        manager.consolidate_files()
+        manager.search_products(name="produit1")
+        manager.check_stock_alerts()
+        manager.generate_report()
+        disable_profiling()
+
+        json_file = os.path.join(self.temp_dir, "profile.json")
+        stats_file = os.path.join(self.temp_dir, "profile.prof")
+        profiler.save_json(json_file)
+        profiler.dump_stats(stats_file)
+
+        with open(json_file, encoding="utf-8") as f:
+            metrics = json.load(f)
+        stages = {stage["stage"]: stage for stage in metrics["stages"]}
+        self.assertEqual(
+            set(stages),
+            {
+                "read_csv",
+                "consolidate_files",
+                "search_products",
+                "check_stock_alerts",
+                "generate_report",
+            },
+        )
+        self.assertEqual(set(stages["read_csv"]["details"]), {"a.csv", "b.csv"})
+        self.assertGreater(metrics["peak_memory_bytes"], 0)
+        self.assertGreater(pstats.Stats(stats_file).total_calls, 0)
+
+    def test_dump_stats_requires_cprofile(self):
+        """Test que les statistiques cProfile doivent avoir été collectées."""
+        profiler = enable_profiling(memory=False)
+        disable_profiling()
+        with self.assertRaises(ValueError):
+            profiler.dump_stats(os.path.join(self.temp_dir, "profile.prof"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from importlib.util import find_spec
+from pathlib import Path
+from unittest.mock import patch
+from xml.etree import ElementTree
+
+import pandas as pd
+
+from inventory_manager.models.report import ReportResult
+from inventory_manager.utils.report_sinks import report_format, save_report
+
+XLSX_NS = {"x": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+class TestReportSinks(unittest.TestCase):
+    def setUp(self):
+        """Préparation des données de test."""
+        self.result = ReportResult(
+            totals={
+                "count": 3,
+                "categories": 2,
+                "stock_value": 1234.5678901234,
+                "mean_price": 0.1 + 0.2,
+                "low_stock": 1,
+            },
+            categories=pd.DataFrame(
+                {
+                    "count": [2, 1],
+                    "stock_value": [1000.0, 234.5678901234],
+                    "mean_price": [250.0, 0.1 + 0.2],
+                    "total_quantity": [4, 7],
+                },
+                index=pd.Index(["Books", "A | B <&>"], name="category"),
+            ),
+        )
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Nettoyage après les tests."""
+        shutil.rmtree(self.test_dir)
+
+    def path(self, name: str) -> str:
+        """Chemin d'un fichier du répertoire de test."""
+        return os.path.join(self.test_dir, name)
+
+    def test_format_from_extension(self):
+        """Test que le format est déduit de l'extension, csv par défaut."""
+        self.assertEqual(report_format("r.JSON"), "json")
+        self.assertEqual(report_format("r.md"), "markdown")
+        self.assertEqual(report_format("r.txt"), "csv")
+        self.assertEqual(report_format("r.txt", "xlsx"), "xlsx")
+        with self.assertRaises(ValueError):
+            report_format("r.csv", "xml")
+
+    def test_csv_keeps_legacy_layout(self):
+        """Test que le CSV garde le format Métrique/Valeur."""
+        output = self.path("report.csv")
+        self.assertTrue(save_report(self.result, output))
+        pd.testing.assert_frame_equal(
+            pd.read_csv(output), self.result.to_frame(), check_dtype=False
+        )
+
+    def test_csv_in_blocks(self):
+        """Test que le CSV écrit par blocs est identique au CSV d'un bloc."""
+        single, blocks = self.path("single.csv"), self.path("blocks.csv")
+        self.assertTrue(save_report(self.result, single))
+        self.assertTrue(save_report(self.result, blocks, chunksize=1))
+        self.assertEqual(Path(single).read_bytes(), Path(blocks).read_bytes())
+
+    def test_json_is_wide_and_lossless(self):
+        """Test du JSON écrit par blocs, sans perte de précision."""
+        output = self.path("report.json")
+        self.assertTrue(save_report(self.result, output, chunksize=1))
+
+        with open(output, encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(data["totals"]["mean_price"], 0.1 + 0.2)
+        self.assertEqual(
+            data["categories"],
+            [
+                {
+                    "category": "Books",
+                    "count": 2,
+                    "stock_value": 1000.0,
+                    "mean_price": 250.0,
+                    "total_quantity": 4,
+                },
+                {
+                    "category": "A | B <&>",
+                    "count": 1,
+                    "stock_value": 234.5678901234,
+                    "mean_price": 0.1 + 0.2,
+                    "total_quantity": 7,
+                },
+            ],
+        )
+
+    def test_missing_values(self):
+        """Test des valeurs manquantes : null en JSON, cellule vide en XLSX."""
+        self.result.totals["mean_price"] = float("nan")
+        self.result.categories.loc["Books", "mean_price"] = float("nan")
+        self.result.categories.loc["A | B <&>", "stock_value"] = float("inf")
+
+        output = self.path("report.json")
+        self.assertTrue(save_report(self.result, output))
+        with open(output, encoding="utf-8") as f:
+            data = json.loads(f.read(), parse_constant=self.fail)
+        self.assertIsNone(data["totals"]["mean_price"])
+        self.assertIsNone(data["categories"][0]["mean_price"])
+        self.assertIsNone(data["categories"][1]["stock_value"])
+
+        output = self.path("report.xlsx")
+        self.assertTrue(save_report(self.result, output))
+        with zipfile.ZipFile(output) as archive:
+            for sheet in ("sheet1", "sheet2"):
+                content = archive.read(f"xl/worksheets/{sheet}.xml").decode()
+                self.assertNotIn("nan", content)
+                self.assertNotIn("inf", content)
+                self.assertIn("<c/>", content)
+
+        output = self.path("report.md")
+        self.assertTrue(save_report(self.result, output))
+        self.assertIn(
+            "| Books | 2 | 1000.00 |  | 4 |", Path(output).read_text(encoding="utf-8")
+        )
+
+    def test_markdown_tables(self):
+        """Test du rapport Markdown et de l'échappement des barres."""
+        output = self.path("report.md")
+        self.assertTrue(save_report(self.result, output, chunksize=1))
+
+        text = Path(output).read_text(encoding="utf-8")
+        self.assertIn("| Prix moyen | 0.30 |", text)
+        self.assertIn("| A \\| B <&> | 1 | 234.57 | 0.30 | 7 |", text)
+
+    def test_xlsx_sheets(self):
+        """Test du classeur XLSX : feuille globale et feuille large."""
+        output = self.path("report.xlsx")
+        self.assertTrue(save_report(self.result, output, chunksize=1))
+
+        with zipfile.ZipFile(output) as archive:
+            rows = []
+            for sheet in ("sheet1", "sheet2"):
+                root = ElementTree.fromstring(
+                    archive.read(f"xl/worksheets/{sheet}.xml")
+                )
+                rows.append(
+                    [
+                        [
+                            "".join(cell.itertext())
+                            for cell in row.findall("x:c", XLSX_NS)
+                        ]
+                        for row in root.iterfind(".//x:row", XLSX_NS)
+                    ]
+                )
+        self.assertEqual(rows[0][0], ["Métrique", "Valeur"])
+        self.assertEqual(rows[0][4], ["Prix moyen", repr(0.1 + 0.2)])
+        self.assertEqual(len(rows[1]), 3)
+        self.assertEqual(
+            rows[1][2], ["A | B <&>", "1", "234.5678901234", "0.30000000000000004", "7"]
+        )
+
+    def test_failed_write_keeps_previous_report(self):
+        """Test qu'un échec d'écriture laisse l'ancien rapport intact."""
+        output = self.path("report.json")
+        Path(output).write_text("ancien", encoding="utf-8")
+
+        with patch("json.dump", side_effect=OSError("disque plein")):
+            self.assertFalse(save_report(self.result, output))
+
+        self.assertEqual(Path(output).read_text(encoding="utf-8"), "ancien")
+        self.assertEqual(os.listdir(self.test_dir), ["report.json"])
+
+    @unittest.skipIf(find_spec("pyarrow"), "pyarrow installé")
+    def test_parquet_requires_pyarrow(self):
+        """Test que le format parquet exige pyarrow."""
+        with self.assertRaises(ValueError):
+            save_report(self.result, self.path("report.parquet"))
+
+    @unittest.skipUnless(find_spec("pyarrow"), "pyarrow non installé")
+    def test_parquet_in_row_groups(self):
+        """Test du rapport Parquet par groupes de lignes."""
+        import pyarrow.parquet as pq
+
+        output = self.path("report.parquet")
+        self.assertTrue(save_report(self.result, output, chunksize=1))
+
+        parquet_file = pq.ParquetFile(output)
+        self.assertEqual(parquet_file.num_row_groups, 2)
+        totals = json.loads(
+            parquet_file.schema_arrow.metadata[b"inventory_report_totals"]
+        )
+        self.assertEqual(totals["count"], 3)
+        self.assertEqual(
+            pd.read_parquet(output)["category"].tolist(), ["Books", "A | B <&>"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from inventory_manager.core.client import InventoryClient
+from inventory_manager.core.manager import InventoryManager
+from inventory_manager.core.server import InventoryServer
+from main import RemoteInventory, create_parser, local_loading_options
+
+
+class TestInventoryServer(unittest.TestCase):
+    def setUp(self):
+        """Démarrage d'un serveur sur un répertoire temporaire."""
+        self.temp_dir = tempfile.mkdtemp()
+        pd.DataFrame(
+            {
+                "name": ["Produit1", "Écouteurs", "Produit3"],
+                "quantity": [5, 20, 3],
+                "unit_price": [100.0, 200.0, 300.0],
+                "category": ["Cat1", "Cat2", "Cat1"],
+            }
+        ).to_csv(Path(self.temp_dir) / "test.csv", index=False)
+
+        manager = InventoryManager(self.temp_dir)
+        manager.consolidate_files()
+        self.server = InventoryServer(manager, poll_interval=0.05)
+        self.server.start()
+        self.client = InventoryClient.discover(self.temp_dir)
+        self.remote = RemoteInventory(self.client)
+
+    def tearDown(self):
+        """Arrêt du serveur et nettoyage."""
+        self.server.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def test_discover(self):
+        """Test de la découverte du serveur via le fichier d'état."""
+        self.assertIsNotNone(self.client)
+        self.assertEqual(self.client.address, self.server.address)
+
+        self.server.stop()
+        self.assertIsNone(InventoryClient.discover(self.temp_dir))
+
+    def test_client_returns_json(self):
+        """Test que le client retourne le JSON décodé, sans pandas."""
+        result = self.client.search_products(name="ecouteurs")
+        self.assertEqual(result["columns"][0], "name")
+        self.assertEqual([row[0] for row in result["data"]], ["Écouteurs"])
+
+        code = (
+            "import sys; import inventory_manager.core.client; "
+            "print('pandas' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).resolve().parent.parent,
+        ).stdout
+        self.assertEqual(output.strip(), "False")
+
+    def test_queries(self):
+        """Test des requêtes list, search et alerts."""
+        self.assertEqual(len(self.remote.inventory_df), 3)
+
+        results = self.remote.search_products(name="ecouteurs")
+        self.assertEqual(list(results["name"]), ["Écouteurs"])
+        results = self.remote.search_products(category="Cat1", min_price=150.0)
+        self.assertEqual(list(results["name"]), ["Produit3"])
+
+        self.assertEqual(len(self.remote.check_stock_alerts()), 2)
+        self.remote.set_stock_threshold(3)
+        self.assertEqual(len(self.remote.check_stock_alerts()), 1)
+        # Le seuil du client ne modifie pas celui du serveur
+        self.assertEqual(self.server.manager.stock_threshold, 10)
+
+    def test_report(self):
+        """Test du rapport : statistiques du serveur, fichier écrit localement."""
+        report_file = Path(self.temp_dir) / "report.csv"
+        result = self.remote.generate_report(str(report_file))
+        self.assertTrue(report_file.exists())
+        pd.testing.assert_frame_equal(
+            result.to_frame(), self.server.manager.generate_report().to_frame()
+        )
+
+    def test_alert_file_written_by_client(self):
+        """Test que le fichier d'alertes est écrit par le client."""
+        alert_file = Path(self.temp_dir) / "alerts.jsonl"
+        alerts = self.remote.check_stock_alerts(alert_file=str(alert_file))
+        with open(alert_file, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual(len(rows), len(alerts))
+        self.assertEqual(set(rows[0]), {"name", "category", "quantity", "threshold"})
+
+    def test_server_writes_no_file(self):
+        """Test que le serveur refuse d'écrire un fichier pour un client."""
+        target = Path(self.temp_dir) / "écrit.csv"
+        for command, param in (("report", "output"), ("alerts", "alert_file")):
+            with self.subTest(command=command):
+                with self.assertRaises(ValueError):
+                    self.client.query(command, **{param: str(target)})
+        self.assertFalse(target.exists())
+
+    def test_token(self):
+        """Test du jeton d'accès, obligatoire hors adresse locale."""
+        manager = self.server.manager
+        with self.assertRaises(ValueError):
+            InventoryServer(manager, host="0.0.0.0")
+
+        self.server.stop()
+        self.server = InventoryServer(manager, poll_interval=0.05, token="secret")
+        self.server.start()
+        self.assertEqual(
+            (Path(self.temp_dir) / ".inventory_server.json").stat().st_mode & 0o777,
+            0o600,
+        )
+        client = InventoryClient.discover(self.temp_dir)
+        self.assertEqual(len(client.list_products()["data"]), 3)
+
+        with self.assertRaises(ValueError):
+            InventoryClient(self.server.address, token="faux").list_products()
+        with self.assertRaises(ValueError):
+            InventoryClient(self.server.address).list_products()
+
+    def test_error(self):
+        """Test de la remontée des erreurs du serveur."""
+        with self.assertRaises(ValueError):
+            self.client.query("inconnue")
+
+    def test_local_options_skip_server(self):
+        """Test que les options de chargement local imposent le mode local."""
+        parser = create_parser()
+        self.assertEqual(local_loading_options(parser.parse_args(["list"])), [])
+        args = parser.parse_args(
+            ["--rebuild-cache", "-j", "2", "--backend", "sqlite", "list"]
+        )
+        self.assertEqual(
+            local_loading_options(args), ["--rebuild-cache", "--jobs", "--backend"]
+        )
+
+    def test_reload_on_change(self):
+        """Test du rechargement après ajout d'un fichier."""
+        pd.DataFrame(
+            {
+                "name": ["Produit4"],
+                "quantity": [1],
+                "unit_price": [10.0],
+                "category": ["Cat3"],
+            }
+        ).to_csv(Path(self.temp_dir) / "new.csv", index=False)
+
+        deadline = time.monotonic() + 5
+        while len(self.remote.inventory_df) != 4 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(len(self.remote.inventory_df), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
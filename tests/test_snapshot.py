@@ -0,0 +1,132 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from inventory_manager.core.manager import InventoryManager
+from inventory_manager.utils.snapshot import InventorySnapshot, write_snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        """Inventaire consolidé de deux fichiers et son instantané."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_dir = Path(self.temp_dir) / "data"
+        self.data_dir.mkdir()
+        rng = np.random.default_rng(0)
+        names = ["Écran", "Clavier", "Souris", "Câble", "Lampe", "Chaise"]
+        for i in range(2):
+            rows = 300
+            pd.DataFrame(
+                {
+                    "name": [
+                        f"{names[j % len(names)]} {j}"
+                        for j in rng.integers(0, 200, rows)
+                    ],
+                    "quantity": rng.integers(0, 40, rows),
+                    "unit_price": rng.uniform(1, 500, rows).round(2),
+                    "category": [f"Catégorie {j}" for j in rng.integers(0, 5, rows)],
+                }
+            ).to_csv(self.data_dir / f"part{i}.csv", index=False)
+
+        self.manager = InventoryManager(str(self.data_dir))
+        self.manager.consolidate_files()
+        self.snapshot_file = str(Path(self.temp_dir) / "inventory.snapshot")
+        self.assertTrue(self.manager.save_snapshot(self.snapshot_file))
+
+        self.reader = InventoryManager(str(self.data_dir))
+        self.reader.open_snapshot(self.snapshot_file)
+
+    def tearDown(self):
+        """Nettoyage après les tests."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip(self):
+        """Test que l'instantané restitue l'inventaire et ses types."""
+        pd.testing.assert_frame_equal(
+            self.reader.inventory_df,
+            self.manager.inventory_df.reset_index(drop=True),
+        )
+
+    def test_zero_copy_columns(self):
+        """Test que les colonnes numériques sont des vues sur le fichier."""
+        snapshot = InventorySnapshot.open(self.snapshot_file)
+        self.assertEqual(len(snapshot), len(self.manager.inventory_df))
+        for column in (snapshot.quantity, snapshot.unit_price):
+            self.assertFalse(column.flags.owndata)
+            self.assertFalse(column.flags.writeable)
+        self.assertEqual(
+            snapshot.names(np.array([2, 0])),
+            self.manager.inventory_df["name"].iloc[[2, 0]].tolist(),
+        )
+
+    def test_queries_without_decoding_inventory(self):
+        """Test de recherches et d'alertes identiques, sans inventory_df."""
+        criteria = [
+            {"category": "Catégorie 1"},
+            {"category": "Catégorie 2", "min_price": 100.0},
+            {"min_price": 50.0, "max_price": 150.0},
+            {"name": "ecran", "max_price": 250.0},
+            {"name": "chaize", "fuzzy": True},
+            {"category": "Inconnue"},
+        ]
+        for criterion in criteria:
+            with self.subTest(criterion=criterion):
+                pd.testing.assert_frame_equal(
+                    self.reader.search_products(**criterion).reset_index(drop=True),
+                    self.manager.search_products(**criterion).reset_index(drop=True),
+                )
+
+        for manager in (self.manager, self.reader):
+            manager.set_stock_threshold(5)
+            manager.set_stock_threshold(20, category="Catégorie 3")
+            manager.set_stock_threshold(35, product="Souris 2")
+        pd.testing.assert_frame_equal(
+            self.reader.get_low_stock_products(with_thresholds=True).reset_index(
+                drop=True
+            ),
+            self.manager.get_low_stock_products(with_thresholds=True).reset_index(
+                drop=True
+            ),
+        )
+        self.assertIsNone(self.reader._inventory_df)
+
+    def test_same_report(self):
+        """Test d'un rapport identique à l'octet près."""
+        expected = Path(self.temp_dir) / "expected.csv"
+        actual = Path(self.temp_dir) / "actual.csv"
+        self.manager.generate_report(str(expected))
+        self.reader.generate_report(str(actual))
+        self.assertEqual(expected.read_text(), actual.read_text())
+
+    def test_empty_inventory(self):
+        """Test d'un instantané sans produit."""
+        path = str(Path(self.temp_dir) / "empty.snapshot")
+        self.assertTrue(write_snapshot(self.manager.inventory_df.iloc[:0], path))
+        snapshot = InventorySnapshot.open(path)
+        self.assertEqual(len(snapshot), 0)
+        self.assertTrue(snapshot.take().empty)
+
+    def test_stale_snapshot(self):
+        """Test de la détection des fichiers CSV modifiés."""
+        snapshot = InventorySnapshot.open(self.snapshot_file)
+        self.assertFalse(snapshot.is_stale(str(self.data_dir)))
+        source = self.data_dir / "part0.csv"
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertTrue(snapshot.is_stale(str(self.data_dir)))
+
+    def test_invalid_snapshot(self):
+        """Test d'un fichier absent ou qui n'est pas un instantané."""
+        with self.assertRaises(ValueError):
+            self.reader.open_snapshot(str(Path(self.temp_dir) / "absent.snapshot"))
+        with self.assertRaises(ValueError):
+            self.reader.open_snapshot(str(self.data_dir / "part0.csv"))
+
+
+if __name__ == "__main__":
+    unittest.main()
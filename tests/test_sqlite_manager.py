@@ -0,0 +1,170 @@
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from inventory_manager.core.backends import get_backend
+from inventory_manager.core.manager import InventoryManager
+from inventory_manager.core.sqlite_manager import SQLiteInventoryManager
+from inventory_manager.utils.file_handler import FileHandler
+
+
+def comparable(df):
+    """Résultats sans index ni types compacts, pour comparer deux stockages."""
+    return df.reset_index(drop=True).astype(
+        {"name": object, "category": object, "quantity": "int64"}
+    )
+
+
+class TestSQLiteInventoryManager(unittest.TestCase):
+    def setUp(self):
+        """Trois fichiers aléatoires avec des produits en double."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_dir = Path(self.temp_dir) / "data"
+        self.data_dir.mkdir()
+        rng = np.random.default_rng(0)
+        names = ["Écran", "Clavier", "Souris", "Câble", "Lampe", "Chaise"]
+        for i in range(3):
+            rows = 200
+            pd.DataFrame(
+                {
+                    "name": [
+                        f"{names[j % len(names)]} {j}"
+                        for j in rng.integers(0, 150, rows)
+                    ],
+                    "quantity": rng.integers(0, 40, rows),
+                    "unit_price": rng.uniform(1, 500, rows).round(2),
+                    "category": [f"Cat{j}" for j in rng.integers(0, 5, rows)],
+                }
+            ).to_csv(self.data_dir / f"part{i}.csv", index=False)
+
+        self.pandas = InventoryManager(str(self.data_dir))
+        self.pandas.consolidate_files()
+        self.sqlite = SQLiteInventoryManager(
+            str(self.data_dir), cache_directory=str(Path(self.temp_dir) / "cache")
+        )
+        self.sqlite.consolidate_files()
+
+    def tearDown(self):
+        """Nettoyage après les tests."""
+        self.sqlite.connection.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_backends(self):
+        """Test du choix du stockage."""
+        self.assertIs(get_backend("pandas"), InventoryManager)
+        self.assertIs(get_backend("sqlite"), SQLiteInventoryManager)
+        with self.assertRaises(ValueError):
+            get_backend("csv")
+
+    def test_same_inventory(self):
+        """Test que l'upsert reproduit drop_duplicates(keep="last")."""
+        pd.testing.assert_frame_equal(
+            comparable(self.sqlite.inventory_df), comparable(self.pandas.inventory_df)
+        )
+
+    def test_same_search_results(self):
+        """Test de recherches identiques sur les deux stockages."""
+        criteria = [
+            {"name": "ecran"},
+            {"name": "Câ", "category": "Cat2"},
+            {"category": "Cat1", "min_price": 100.0},
+            {"min_price": 50.0, "max_price": 150.0},
+            {"name": "chaize", "fuzzy": True},
+            {"name": "lampe", "fuzzy": True, "max_price": 200.0},
+            {"category": "Inconnue"},
+        ]
+        for criterion in criteria:
+            with self.subTest(criterion=criterion):
+                pd.testing.assert_frame_equal(
+                    comparable(self.sqlite.search_products(**criterion)),
+                    comparable(self.pandas.search_products(**criterion)),
+                )
+
+    def test_same_alerts(self):
+        """Test d'alertes identiques, seuils par catégorie et produit compris."""
+        for manager in (self.pandas, self.sqlite):
+            manager.set_stock_threshold(5)
+            manager.set_stock_threshold(20, category="Cat3")
+            manager.set_stock_threshold(35, product="Souris 2")
+        self.assertEqual(
+            self.sqlite.check_stock_alerts(), self.pandas.check_stock_alerts()
+        )
+
+    def test_same_report(self):
+        """Test d'un rapport identique à l'octet près, dans chaque format."""
+        for extension in ("csv", "json", "md", "xlsx"):
+            with self.subTest(extension=extension):
+                pandas_report = Path(self.temp_dir) / f"pandas.{extension}"
+                sqlite_report = Path(self.temp_dir) / f"sqlite.{extension}"
+                self.pandas.generate_report(str(pandas_report))
+                self.sqlite.generate_report(str(sqlite_report))
+                if extension == "xlsx":
+                    with zipfile.ZipFile(pandas_report) as p, zipfile.ZipFile(
+                        sqlite_report
+                    ) as s:
+                        self.assertEqual(
+                            [p.read(name) for name in p.namelist()],
+                            [s.read(name) for name in s.namelist()],
+                        )
+                else:
+                    self.assertEqual(
+                        pandas_report.read_bytes(), sqlite_report.read_bytes()
+                    )
+
+    def test_report_sums_match_pandas_bits(self):
+        """Test de sommes identiques au bit près sur des prix non exacts."""
+        totals = self.sqlite.generate_report().totals
+        expected = self.pandas.generate_report().totals
+        for key in ("stock_value", "mean_price"):
+            self.assertEqual(totals[key].hex(), expected[key].hex())
+
+    def test_persistent_database(self):
+        """Test qu'une base à jour est réutilisée sans relire les CSV."""
+        other = SQLiteInventoryManager(
+            str(self.data_dir), cache_directory=str(Path(self.temp_dir) / "cache")
+        )
+        self.addCleanup(other.connection.close)
+        with mock.patch.object(FileHandler, "read_csv_paths") as read:
+            other.consolidate_files()
+        read.assert_not_called()
+        self.assertEqual(len(other.inventory_df), len(self.pandas.inventory_df))
+
+        pd.DataFrame(
+            {
+                "name": ["Nouveau"],
+                "quantity": [1],
+                "unit_price": [1.0],
+                "category": ["Cat9"],
+            }
+        ).to_csv(self.data_dir / "zz.csv", index=False)
+        other.consolidate_files()
+        self.assertEqual(other.inventory_df["name"].iloc[-1], "Nouveau")
+
+    def test_old_schema_is_reloaded(self):
+        """Test qu'une base d'une autre version du schéma est rechargée."""
+        with self.sqlite.connection:
+            self.sqlite.connection.execute(
+                "UPDATE meta SET value = '1' WHERE key = 'schema'"
+            )
+        other = SQLiteInventoryManager(
+            str(self.data_dir), cache_directory=str(Path(self.temp_dir) / "cache")
+        )
+        self.addCleanup(other.connection.close)
+        with mock.patch.object(
+            FileHandler, "read_csv_paths", wraps=FileHandler.read_csv_paths
+        ) as read:
+            other.consolidate_files()
+        read.assert_called_once()
+        pd.testing.assert_frame_equal(
+            comparable(other.inventory_df), comparable(self.pandas.inventory_df)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
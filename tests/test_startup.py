@@ -0,0 +1,62 @@
+import re
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+MAIN = Path(__file__).resolve().parent.parent / "main.py"
+
+# Budget du temps d'import cumulé de `main.py --help` (millisecondes)
+HELP_IMPORT_BUDGET_MS = 150
+
+HEAVY_MODULES = {"pandas", "numpy", "rich"}
+
+
+def import_times(*args):
+    """
+    Lance main.py avec -X importtime.
+
+    Returns:
+        dict: Temps d'import propre (µs) par module importé
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(MAIN), *args],
+        capture_output=True,
+        text=True,
+        cwd=MAIN.parent,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+\d+ \|\s+(\S+)", line)
+        if match:
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+
+class TestStartup(unittest.TestCase):
+    def test_help_skips_heavy_imports(self):
+        """Test que --help n'importe ni pandas, ni numpy, ni rich."""
+        modules = {name.split(".")[0] for name in import_times("--help")}
+        self.assertFalse(modules & HEAVY_MODULES)
+
+    def test_bad_argument_skips_heavy_imports(self):
+        """Test qu'une erreur d'argument n'importe pas les modules lourds."""
+        modules = {name.split(".")[0] for name in import_times("list", "--bad")}
+        self.assertFalse(modules & HEAVY_MODULES)
+
+    def test_export_skips_rich(self):
+        """Test que les formats d'export n'importent pas rich."""
+        data_dir = str(MAIN.parent / "tests" / "test_data")
+        args = ["--data-dir", data_dir, "--no-cache", "--no-server", "list"]
+        modules = import_times(*args, "--output-format", "jsonl")
+        self.assertIn("pandas", modules)
+        self.assertNotIn("rich", modules)
+
+    def test_help_import_budget(self):
+        """Test du budget de temps d'import de --help."""
+        total_ms = sum(import_times("--help").values()) / 1000
+        self.assertLess(total_ms, HELP_IMPORT_BUDGET_MS)
+
+
+if __name__ == "__main__":
+    unittest.main()
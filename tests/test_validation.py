@@ -0,0 +1,107 @@
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from inventory_manager.models.product import Product
+from inventory_manager.models.validation import (
+    REASON_NAME_TYPE,
+    REASON_QUANTITY_TYPE,
+    round_prices,
+    validate_products,
+)
+
+
+class TestValidation(unittest.TestCase):
+    def setUp(self):
+        """Préparation d'un lot de lignes valides et invalides."""
+        self.df = pd.DataFrame(
+            {
+                "name": [" Produit1 ", "", "Produit3", "Produit4", None, "Produit6"],
+                "quantity": ["10", "5", "-1", "abc", "3", "2.5"],
+                "unit_price": ["99.999", "1", "2", "3", "4", "5"],
+                "category": ["Cat1 ", "Cat1", "Cat2", "Cat2", "Cat3", "Cat3"],
+            }
+        )
+
+    def test_reasons(self):
+        """Test des motifs de rejet, dans l'ordre des règles de Product."""
+        clean, rejected = validate_products(self.df)
+
+        self.assertEqual(len(clean), 1)
+        self.assertEqual(
+            list(rejected["reason"]),
+            [
+                "Le nom ne peut pas être vide",
+                "La quantité ne peut pas être négative",
+                "La quantité doit être un entier",
+                "Le nom doit être une chaîne de caractères",
+                "La quantité doit être un entier",
+            ],
+        )
+        # Les lignes rejetées sont conservées telles que lues
+        self.assertEqual(rejected.iloc[0]["quantity"], "5")
+
+    def test_clean_rows_match_product(self):
+        """Test que les lignes valides sont nettoyées comme par Product."""
+        clean, _ = validate_products(self.df)
+        row = clean.iloc[0]
+        product = Product(" Produit1 ", 10, 99.999, "Cat1 ")
+
+        self.assertEqual(
+            {
+                "name": row["name"],
+                "quantity": row["quantity"],
+                "unit_price": row["unit_price"],
+                "category": row["category"],
+            },
+            product.to_dict(),
+        )
+        self.assertEqual(clean["quantity"].dtype, np.int64)
+
+    def test_string_columns(self):
+        """Test des colonnes StringDtype lues par read_csv, sans les modifier."""
+        df = pd.DataFrame(
+            {
+                "name": pd.Series(["Produit1", " Produit2", None], dtype="str"),
+                "quantity": [1, 2, 3],
+                "unit_price": [1.0, 2.0, 3.0],
+                "category": pd.Series(["Cat1", "Cat1", "Cat2"], dtype="str"),
+            }
+        )
+        original = df.copy()
+        clean, rejected = validate_products(df)
+
+        self.assertEqual(list(clean["name"]), ["Produit1", "Produit2"])
+        self.assertEqual(clean["name"].dtype, df["name"].dtype)
+        self.assertEqual(list(rejected["reason"]), [REASON_NAME_TYPE])
+        pd.testing.assert_frame_equal(df, original)
+
+    def test_oversized_quantity(self):
+        """Test du rejet d'une quantité hors de l'intervalle int64."""
+        df = pd.DataFrame(
+            {
+                "name": ["Produit1", "Produit2", "Produit3"],
+                "quantity": ["99999999999999999999", "-99999999999999999999", "7"],
+                "unit_price": ["1", "2", "3"],
+                "category": ["Cat1", "Cat1", "Cat1"],
+            }
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            clean, rejected = validate_products(df)
+
+        self.assertEqual(clean["quantity"].tolist(), [7])
+        self.assertEqual(list(rejected["reason"]), [REASON_QUANTITY_TYPE] * 2)
+
+    def test_round_prices(self):
+        """Test de l'arrondi identique à round(prix, 2)."""
+        prices = np.array([2.675, 0.125, 1.005, 79740.425, 3175.995, 12.3456])
+        self.assertEqual(
+            list(round_prices(prices)), [round(float(p), 2) for p in prices]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
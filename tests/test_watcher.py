@@ -0,0 +1,128 @@
+import os
+import queue
+import shutil
+import tempfile
+import time
+import unittest
+from importlib.util import find_spec
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+from inventory_manager.core.manager import InventoryManager
+from inventory_manager.core.watcher import DirectoryWatcher, diff_snapshots
+from inventory_manager.utils.file_handler import FileHandler
+
+
+def write_csv(path, names, quantity=5):
+    """Écrit un fichier CSV d'inventaire."""
+    pd.DataFrame(
+        {
+            "name": names,
+            "quantity": [quantity] * len(names),
+            "unit_price": [10.0] * len(names),
+            "category": ["Cat1"] * len(names),
+        }
+    ).to_csv(path, index=False)
+
+
+class TestDirectoryWatcher(unittest.TestCase):
+    def setUp(self):
+        """Préparation d'un répertoire surveillé."""
+        self.temp_dir = tempfile.mkdtemp()
+        write_csv(Path(self.temp_dir) / "a.csv", ["Produit1"])
+        self.events = queue.Queue()
+
+    def tearDown(self):
+        """Nettoyage après les tests."""
+        shutil.rmtree(self.temp_dir)
+
+    def start_watcher(self, **kwargs):
+        watcher = DirectoryWatcher(
+            self.temp_dir, self.events.put, poll_interval=0.05, **kwargs
+        )
+        watcher.start()
+        self.addCleanup(watcher.stop)
+        return watcher
+
+    def test_diff_snapshots(self):
+        """Test de la comparaison de deux relevés."""
+        changes = diff_snapshots(
+            {"a": (1, 10), "b": (1, 10)}, {"a": (2, 10), "c": (1, 5)}
+        )
+        self.assertEqual(changes, {"added": ["c"], "modified": ["a"], "removed": ["b"]})
+
+    def test_polling_detects_changes(self):
+        """Test de la détection des ajouts, modifications et suppressions."""
+        self.start_watcher(debounce=0.05, use_watchdog=False)
+        a, b = Path(self.temp_dir) / "a.csv", Path(self.temp_dir) / "b.csv"
+
+        write_csv(b, ["Produit2"])
+        self.assertEqual(self.events.get(timeout=5)["added"], [str(b)])
+
+        write_csv(a, ["Produit1", "Produit3"])
+        self.assertEqual(self.events.get(timeout=5)["modified"], [str(a)])
+
+        os.remove(b)
+        self.assertEqual(self.events.get(timeout=5)["removed"], [str(b)])
+
+    def test_debounce_groups_bursts(self):
+        """Test qu'une rafale de modifications n'est signalée qu'une fois."""
+        self.start_watcher(debounce=0.5, use_watchdog=False)
+        for i in range(3):
+            write_csv(Path(self.temp_dir) / f"new{i}.csv", [f"Produit{i}"])
+            time.sleep(0.1)
+
+        changes = self.events.get(timeout=5)
+        self.assertEqual(len(changes["added"]), 3)
+        self.assertTrue(self.events.empty())
+
+    @unittest.skipUnless(find_spec("watchdog"), "watchdog non installé")
+    def test_watchdog_notifications(self):
+        """Test de la détection par notifications du système."""
+        watcher = DirectoryWatcher(
+            self.temp_dir, self.events.put, poll_interval=60, debounce=0.05
+        )
+        watcher.start()
+        self.addCleanup(watcher.stop)
+        write_csv(Path(self.temp_dir) / "b.csv", ["Produit2"])
+        self.assertEqual(len(self.events.get(timeout=5)["added"]), 1)
+
+
+class TestIncrementalReload(unittest.TestCase):
+    def setUp(self):
+        """Préparation de deux fichiers consolidés."""
+        self.temp_dir = tempfile.mkdtemp()
+        write_csv(Path(self.temp_dir) / "a.csv", ["Produit1"])
+        write_csv(Path(self.temp_dir) / "b.csv", ["Produit2"])
+        self.manager = InventoryManager(self.temp_dir)
+        self.manager.consolidate_files()
+
+    def tearDown(self):
+        """Nettoyage après les tests."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_only_changed_files_are_signed(self):
+        """Test que seuls les fichiers signalés sont relus."""
+        b = Path(self.temp_dir) / "b.csv"
+        write_csv(b, ["Produit2"], quantity=1)
+
+        with mock.patch.object(
+            FileHandler, "file_signature", wraps=FileHandler.file_signature
+        ) as signature:
+            self.manager.consolidate_files(changed_paths=[str(b)])
+
+        self.assertEqual(
+            [call.args[0].name for call in signature.call_args_list], ["b.csv"]
+        )
+        quantities = dict(
+            zip(
+                self.manager.inventory_df["name"], self.manager.inventory_df["quantity"]
+            )
+        )
+        self.assertEqual(quantities, {"Produit1": 5, "Produit2": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()